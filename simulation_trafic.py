@@ -14,8 +14,24 @@ import pygame
 import sys
 import time
 import random
-import heapq
-from typing import List, Dict, Tuple, Any, Set, Union
+import numpy as np
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Any, FrozenSet, Set, Union
+
+# Numba est optionnel : s'il est présent, le noyau A* est compilé en code natif,
+# sinon le même noyau s'exécute en Python pur (plus lent mais identique).
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+    print("AVERTISSEMENT: Numba indisponible, le pathfinding A* s'exécutera en Python pur.")
+
+    def njit(*args, **kwargs):
+        # Décorateur de substitution : renvoie la fonction inchangée.
+        def decorateur(fonction):
+            return fonction
+        return decorateur
 
 # Initialisation de Pygame
 pygame.init()
@@ -88,18 +104,18 @@ COULEUR_FLEUR_ROSE = (255, 105, 180)
 COULEUR_FLEUR_VERT = (0, 100, 0)
 
 # --- SYMBOLES DE LA GRILLE ---
-
-## @brief Symbole représentant une zone non routière (bâtiment, parc, etc.) dans la grille.
-NON_ROUTIER = "N"
-## @brief Symbole représentant une route praticable dans la grille.
-ROUTE = " "
-## @brief Symbole représentant un obstacle MANUEL ('X') sur une route.
-OBSTACLE_MANUEL = "X"
-## @brief NOUVEAU : Symbole représentant un obstacle AUTOMATIQUE ('A') sur une route.
-OBSTACLE_AUTO_SYM = "A"
-
-## @brief Ensemble de tous les symboles représentant des cellules non praticables (pour le pathfinding, etc.).
-SYMBOLES_NON_PRATICABLES = {NON_ROUTIER, OBSTACLE_MANUEL, OBSTACLE_AUTO_SYM}
+# La grille est un tableau NumPy uint8 : chaque symbole est un petit entier,
+# ce qui donne un stockage contigu d'un octet par cellule (au lieu d'un objet
+# str Python) et permet de passer la grille telle quelle au noyau A* compilé.
+
+## @brief Code représentant une route praticable dans la grille.
+ROUTE = 0
+## @brief Code représentant une zone non routière (bâtiment, parc, etc.) dans la grille.
+NON_ROUTIER = 1
+## @brief Code représentant un obstacle MANUEL sur une route.
+OBSTACLE_MANUEL = 2
+## @brief Code représentant un obstacle AUTOMATIQUE sur une route.
+OBSTACLE_AUTO_SYM = 3
 
 # --- POSITIONS D'ÉLÉMENTS FIXES (DÉCORATIONS) ---
 # Assurez-vous que ces positions correspondent à des cases NON_ROUTIER dans le réseau routier défini.
@@ -143,6 +159,17 @@ PROBA_APPARITION_PIETON = 0.005
 ## @brief Intervalle de temps en secondes pour tenter d'ajouter ou de retirer un obstacle automatique.
 OBSTACLE_AUTOMATIQUE_INTERVAL = 0.5 # 0.5 secondes
 
+## @brief Durée d'un pas de simulation en secondes (30 Hz, indépendant de la cadence d'affichage).
+# La logique (feux, piétons, voitures, obstacles auto) avance par pas fixes accumulés ;
+# le rendu, lui, n'a lieu que lorsqu'au moins un pas s'est exécuté ou que la grille a changé.
+PAS_SIMULATION = 1.0 / 30.0
+## @brief Nombre maximal de pas de rattrapage par frame (évite la spirale après un gel).
+MAX_PAS_RATTRAPAGE = 5
+
+## @brief Orientation (en degrés) d'une voiture selon son delta de déplacement (dx, dy).
+# Table de correspondance figée : remplace la cascade de comparaisons à chaque mouvement.
+ORIENTATION_PAR_DELTA: Dict[Tuple[int, int], int] = {(1, 0): 0, (-1, 0): 180, (0, 1): 270, (0, -1): 90}
+
 # --- VARIABLES GLOBALES DE SIMULATION (ÉTAT) ---
 
 ## @brief Surface principale de dessin (la fenêtre Pygame).
@@ -153,9 +180,9 @@ clock = pygame.time.Clock()
 
 ##
 # @var grille
-# @brief La grille 2D représentant le réseau routier et les zones non routières.
-# Chaque cellule contient un symbole : 'N', ' ', 'X', ou 'A'.
-grille: List[List[str]] = []
+# @brief La grille 2D (tableau NumPy uint8) représentant le réseau routier et les zones non routières.
+# Chaque cellule contient un code : ROUTE, NON_ROUTIER, OBSTACLE_MANUEL ou OBSTACLE_AUTO_SYM.
+grille: np.ndarray = np.zeros((0, 0), dtype=np.uint8)
 
 ##
 # @var lignes_directions
@@ -166,10 +193,60 @@ lignes_directions: Dict[int, str] = {}
 # @brief Dictionnaire associant un indice de colonne à son sens de circulation ('haut' ou 'bas').
 colonnes_directions: Dict[int, str] = {}
 
+##
+# @brief Représente un feu de circulation (partie statique).
+# @details L'état dynamique (couleur, durées, horodatages) vit dans les tableaux SoA
+# `feu_etat`/`feu_durees`/... indexés par `index` ; l'objet ne porte que la position
+# fixe et cet index. Classe à __slots__ comme Voiture : l'accès attribut remplace le
+# hachage de clé de l'ancien dict dans les boucles de validation et de dessin.
+class Feu:
+    __slots__ = ("position", "index")
+
+    ##
+    # @brief Initialise un feu placé.
+    # @param position Tuple (x, y) de la case du feu (fixe).
+    # @param index Index du feu dans les tableaux d'état SoA.
+    def __init__(self, position: Tuple[int, int], index: int) -> None:
+        self.position = position
+        self.index = index
+
 ##
 # @var feux
-# @brief Liste des feux de circulation. Chaque feu est un dict.
-feux: List[Dict[str, Any]] = []
+# @brief Liste des feux de circulation (objets Feu).
+feux: List[Feu] = []
+# États possibles d'un feu, encodés en petits entiers : l'ordre du cycle
+# vert -> orange -> rouge correspond à (etat + 1) % 3.
+## @brief Code d'état : feu vert.
+FEU_VERT = 0
+## @brief Code d'état : feu orange.
+FEU_ORANGE = 1
+## @brief Code d'état : feu rouge.
+FEU_ROUGE = 2
+
+# État dynamique des feux en tableaux parallèles (SoA), indexés par feu.index.
+# Cette disposition permet une mise à jour vectorisée de tous les feux d'un coup.
+## @brief État courant de chaque feu (FEU_VERT / FEU_ORANGE / FEU_ROUGE).
+feu_etat: np.ndarray = np.zeros(0, dtype=np.uint8)
+## @brief Durées de chaque état par feu, colonne = code d'état (vert, orange, rouge).
+feu_durees: np.ndarray = np.zeros((0, 3))
+## @brief Durée restante de l'état courant au moment du dernier changement.
+feu_duree_actuelle: np.ndarray = np.zeros(0)
+## @brief Horodatage du dernier changement d'état de chaque feu.
+feu_dernier_changement: np.ndarray = np.zeros(0)
+
+##
+# @var feux_positions
+# @brief Ensemble des positions (x, y) occupées par un feu. Construit une fois après
+# l'initialisation des feux (qui ne bougent jamais) pour éviter de reconstruire
+# l'ensemble à chaque test d'obstacle. Figé (frozenset) : toute mutation accidentelle
+# lèverait une erreur plutôt que de désynchroniser l'ensemble des feux réels.
+feux_positions: FrozenSet[Tuple[int, int]] = frozenset()
+##
+# @var feu_index_par_position
+# @brief Index spatial des feux : position (x, y) -> index dans les tableaux d'état SoA.
+# Construit une fois après l'initialisation (les feux ne bougent jamais) ; remplace le
+# parcours linéaire de la liste des feux à chaque validation de déplacement.
+feu_index_par_position: Dict[Tuple[int, int], int] = {}
 ##
 # @var passages_pietons
 # @brief Liste des passages piétons sur la grille. Chaque passage est un dict.
@@ -181,10 +258,49 @@ pietons_actifs: List[Dict[str, Any]] = []
 ## @brief Compteur pour attribuer un ID unique croissant à chaque nouveau piéton.
 prochain_id_pieton = 0
 
+##
+# @brief Représente une voiture de la simulation.
+# @details Classe à __slots__ plutôt que dict : les champs sont fixes et les accès
+# (position, chemin, temps_arrivee...) sont sur le chemin chaud de la mise à jour
+# et du dessin ; l'attribut C-level évite un hachage de clé par lecture et réduit
+# l'empreinte mémoire par voiture.
+class Voiture:
+    __slots__ = ("id", "position", "destination", "chemin", "chemin_idx",
+                 "temps_arrivee", "dernier_deplacement", "couleur", "image",
+                 "orientation", "bloquee_depuis", "recalcul_echecs",
+                 "position_dessinee", "centre_px")
+
+    ##
+    # @brief Initialise une voiture prête à rouler.
+    # @param id_voiture Identifiant entier unique.
+    # @param position Tuple (x, y) de départ.
+    # @param destination Tuple (x, y) visé.
+    # @param chemin Tuple des pas restants (commence au pas suivant, pas à la position actuelle).
+    # @param couleur Couleur (r, g, b) de secours, ou None si une image teintée existe.
+    # @param image Surface teintée partagée, ou None (dessin en cercle).
+    def __init__(self, id_voiture: int, position: Tuple[int, int], destination: Tuple[int, int],
+                 chemin: Tuple[Tuple[int, int], ...], couleur: Union[Tuple[int, int, int], None],
+                 image: Union[pygame.Surface, None]) -> None:
+        self.id = id_voiture
+        self.position = position
+        self.destination = destination
+        self.chemin = chemin
+        self.chemin_idx = 0 # Curseur du prochain pas à exécuter dans 'chemin'
+        self.temps_arrivee: Union[float, None] = None
+        self.dernier_deplacement = time.time() # Initialisée maintenant, elle bougera après DELAI_MIN_MOUVEMENT
+        self.couleur = couleur
+        self.image = image
+        self.orientation = 0 # Orientation initiale (ajustée au 1er mouvement)
+        self.bloquee_depuis: Union[float, None] = None
+        self.recalcul_echecs = 0
+        # Cache de dessin : position déjà rasterisée et son centre en pixels (voir dessiner_voitures)
+        self.position_dessinee: Union[Tuple[int, int], None] = None
+        self.centre_px: Union[Tuple[int, int], None] = None
+
 ##
 # @var voitures
-# @brief Liste des voitures actives dans la simulation. Chaque voiture est un dict.
-voitures: List[Dict[str, Any]] = []
+# @brief Liste des voitures actives dans la simulation.
+voitures: List[Voiture] = []
 ## @brief Compteur pour attribuer un ID unique croissant à chaque nouvelle voiture (initiale ou régénérée).
 prochain_id_voiture = 1
 
@@ -196,6 +312,20 @@ image_voiture_echelle: Union[pygame.Surface, None] = None
 ## @brief Minuteur pour déclencher l'ajout/retrait d'obstacles automatiques.
 obstacle_automatique_timer: float = 0.0
 
+##
+# @var obstacles_auto_positions
+# @brief Positions (x, y) des obstacles automatiques actuellement posés.
+# @details Liste entretenue aux deux seuls points de mutation (pose dans
+# `ajouter_obstacle_auto`, retrait dans la branche 'remove' de la boucle principale) :
+# le tirage d'un obstacle à retirer est O(1) au lieu d'un balayage de la grille.
+obstacles_auto_positions: List[Tuple[int, int]] = []
+
+##
+# @var version_grille
+# @brief Compteur de version de la grille, incrémenté à chaque ajout/retrait d'obstacle.
+# Sert de clé d'invalidation pour le cache de chemins A*.
+version_grille: int = 0
+
 # --- CHARGEMENT IMAGE VOITURE ---
 try:
     image_voiture_originale = pygame.image.load('car.png').convert_alpha()
@@ -210,25 +340,24 @@ except Exception as e:
 # --- FONCTIONS UTILITAIRES GRILLE & ENVIRONNEMENT ---
 
 ##
-# @brief Crée une grille 2D remplie de zones non routières ('N').
+# @brief Crée une grille 2D remplie de zones non routières.
 # @param taille_x Nombre de colonnes.
 # @param taille_y Nombre de lignes.
-# @return Une liste de listes représentant la grille initialisée.
-def creer_grille(taille_x: int, taille_y: int) -> List[List[str]]:
-    return [[NON_ROUTIER for _ in range(taille_x)] for _ in range(taille_y)]
+# @return Un tableau NumPy uint8 représentant la grille initialisée.
+def creer_grille(taille_x: int, taille_y: int) -> np.ndarray:
+    return np.full((taille_y, taille_x), NON_ROUTIER, dtype=np.uint8)
 
 ##
-# @brief Définit le tracé des routes (remplace 'N' par ROUTE=' ') sur la grille.
+# @brief Définit le tracé des routes (remplace NON_ROUTIER par ROUTE) sur la grille.
 # @param grille La grille (sera modifiée).
 # @param taille_x Largeur de la grille.
 # @param taille_y Hauteur de la grille.
 # @details Exemple: crée une grille régulière avec routes toutes les 3 lignes/colonnes.
-def definir_reseau_routier(grille: List[List[str]], taille_x: int, taille_y: int) -> None:
+def definir_reseau_routier(grille: np.ndarray, taille_x: int, taille_y: int) -> None:
     print("Définition du réseau routier...")
-    for y in range(taille_y):
-        for x in range(taille_x):
-            if x % 3 == 0 or y % 3 == 0:
-                 grille[y][x] = ROUTE
+    # Deux affectations par tranches remplacent la double boucle Python cellule par cellule
+    grille[::3, :] = ROUTE # Une ligne de route toutes les 3 lignes
+    grille[:, ::3] = ROUTE # Une colonne de route toutes les 3 colonnes
     print("Réseau routier défini.")
 
 ##
@@ -241,24 +370,94 @@ def creer_directions_routes(taille_x: int, taille_y: int) -> Tuple[Dict[int, str
     directions_colonnes = {x: "bas" if x % 2 == 0 else "haut" for x in range(taille_x)}
     return directions_lignes, directions_colonnes
 
+## @brief Masque booléen des cases "escapables", mis en cache par version de grille.
+_masque_escapable: Union[np.ndarray, None] = None
+## @brief Version de grille pour laquelle _masque_escapable a été calculé.
+_masque_escapable_version: int = -1
+
 ##
-# @brief Vérifie si une case donnée permet de sortir (est ROUTE et a au moins une voisine ROUTE).
-# @param pos Position (x, y) à vérifier.
-# @param taille_x Largeur grille.
-# @param taille_y Hauteur grille.
+# @brief Calcule d'un coup le masque des cases ROUTE ayant au moins une voisine ROUTE.
 # @param grille La grille.
-# @return True si la case est une ROUTE et permet un mouvement valide vers une case ROUTE adjacente. False sinon.
-def est_case_escapable(pos: Tuple[int, int], taille_x: int, taille_y: int, grille: List[List[str]]) -> bool:
-    x, y = pos
-    # Doit être sur une route
-    if not (0 <= y < taille_y and 0 <= x < taille_x and grille[y][x] == ROUTE):
-        return False
-    # Vérifie s'il y a au moins un voisin qui est aussi une route
-    for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < taille_x and 0 <= ny < taille_y and grille[ny][nx] == ROUTE:
-                 return True
-    return False
+# @return Masque booléen de la même forme que la grille.
+def _calculer_masque_escapable(grille: np.ndarray) -> np.ndarray:
+    route_mask = grille == ROUTE
+    voisin_route = np.zeros_like(route_mask)
+    voisin_route[:-1, :] |= route_mask[1:, :] # Voisine du dessous
+    voisin_route[1:, :] |= route_mask[:-1, :] # Voisine du dessus
+    voisin_route[:, :-1] |= route_mask[:, 1:] # Voisine de droite
+    voisin_route[:, 1:] |= route_mask[:, :-1] # Voisine de gauche
+    return route_mask & voisin_route
+
+##
+# @brief Renvoie le masque booléen "escapable" (case ROUTE avec au moins une voisine ROUTE).
+# @param grille La grille.
+# @return Masque booléen de la même forme que la grille. Ne pas modifier (cache partagé).
+# @details Recalculé (vectorisé) seulement quand un obstacle change la grille (suivi via
+#          version_grille). Exposé séparément pour permettre aux appelants de combiner le
+#          masque entier avec d'autres filtres vectorisés, plutôt que case par case.
+def obtenir_masque_escapable(grille: np.ndarray) -> np.ndarray:
+    global _masque_escapable, _masque_escapable_version
+    if _masque_escapable is None or _masque_escapable_version != version_grille or _masque_escapable.shape != grille.shape:
+        _masque_escapable = _calculer_masque_escapable(grille)
+        _masque_escapable_version = version_grille
+    return _masque_escapable
+
+##
+# @var _cellules_valides
+# @brief Réservoir des cases candidates pour départs/destinations : ROUTE escapable hors
+# feux. Recalculé uniquement quand version_grille change.
+_cellules_valides: Union[List[Tuple[int, int]], None] = None
+## @brief Version de grille pour laquelle _cellules_valides est valide.
+_cellules_valides_version: int = -1
+
+##
+# @brief Renvoie la liste des cases valides comme départ ou destination de voiture.
+# @param grille La grille.
+# @param feux Liste des feux (leurs cases sont exclues).
+# @return Liste de tuples (x, y). Ne pas modifier la liste renvoyée (cache partagé).
+# @details Chaque tirage dans ce réservoir est valide d'office (ROUTE, escapable, hors
+#          feu/obstacle) : l'échantillonnage par rejet des générateurs se réduit aux seules
+#          contraintes variables (case occupée, chemin atteignable).
+def obtenir_cellules_valides(grille: np.ndarray, feux: List[Feu]) -> List[Tuple[int, int]]:
+    global _cellules_valides, _cellules_valides_version
+    if _cellules_valides is None or _cellules_valides_version != version_grille:
+        # Le masque escapable exige déjà ROUTE (donc exclut obstacles et non-routier)
+        masque = obtenir_masque_escapable(grille).copy()
+        for feu in feux:
+            fx, fy = feu.position
+            masque[fy, fx] = False
+        _cellules_valides = [(int(x), int(y)) for y, x in np.argwhere(masque)]
+        _cellules_valides_version = version_grille
+    return _cellules_valides
+
+##
+# @var _cellules_route_libres
+# @brief Réservoir des cases ROUTE hors feux (candidates pour les obstacles automatiques).
+# Recalculé uniquement quand version_grille change.
+_cellules_route_libres: Union[List[Tuple[int, int]], None] = None
+## @brief Version de grille pour laquelle _cellules_route_libres est valide.
+_cellules_route_libres_version: int = -1
+
+##
+# @brief Renvoie la liste des cases ROUTE où un obstacle automatique peut être posé.
+# @param grille La grille.
+# @param feux Liste des feux (leurs cases sont exclues).
+# @return Liste de tuples (x, y). Ne pas modifier la liste renvoyée (cache partagé).
+# @details version_grille change à chaque pose/retrait d'obstacle, donc le réservoir se
+#          reconstruit exactement quand la réponse peut différer ; entre deux mutations,
+#          l'intervalle d'obstacle automatique le réutilise tel quel.
+def obtenir_cellules_route_libres(grille: np.ndarray, feux: List[Feu]) -> List[Tuple[int, int]]:
+    global _cellules_route_libres, _cellules_route_libres_version
+    if _cellules_route_libres is None or _cellules_route_libres_version != version_grille:
+        # Les cases de feux sont éteintes dans le masque avant argwhere : pas de test
+        # d'appartenance Python par case ROUTE lors de la reconstruction
+        masque = grille == ROUTE
+        for feu in feux:
+            fx, fy = feu.position
+            masque[fy, fx] = False
+        _cellules_route_libres = [(int(x), int(y)) for y, x in np.argwhere(masque)]
+        _cellules_route_libres_version = version_grille
+    return _cellules_route_libres
 
 
 # --- FONCTIONS DE GESTION OBSTACLES ---
@@ -268,12 +467,14 @@ def est_case_escapable(pos: Tuple[int, int], taille_x: int, taille_y: int, grill
 # @param grille La grille.
 # @param x Coordonnée X (colonne).
 # @param y Coordonnée Y (ligne).
-# @param feux Liste des feux (pour ne pas placer sur un feu).
+# @param positions_feux Ensemble des positions de feux (pour ne pas placer sur un feu).
 # @return True si l'obstacle a été ajouté, False sinon.
-def ajouter_obstacle_manuel(grille: List[List[str]], x: int, y: int, feux: List[Dict[str, Any]]) -> bool:
-    positions_feux = {feu["position"] for feu in feux}
-    if grille[y][x] == ROUTE and (x, y) not in positions_feux and grille[y][x] not in SYMBOLES_NON_PRATICABLES:
-        grille[y][x] = OBSTACLE_MANUEL
+def ajouter_obstacle_manuel(grille: np.ndarray, x: int, y: int, positions_feux: Set[Tuple[int, int]]) -> bool:
+    global version_grille
+    # La cellule uint8 est lue une fois ; == ROUTE exclut déjà tous les codes non praticables
+    if grille[y, x] == ROUTE and (x, y) not in positions_feux:
+        grille[y, x] = OBSTACLE_MANUEL
+        version_grille += 1
         print(f"Obstacle MANUEL ajouté en ({x},{y}).")
         return True
     return False
@@ -283,30 +484,60 @@ def ajouter_obstacle_manuel(grille: List[List[str]], x: int, y: int, feux: List[
 # @param grille La grille.
 # @param x Coordonnée X (colonne).
 # @param y Coordonnée Y (ligne).
-# @param feux Liste des feux (pour ne pas placer sur un feu).
+# @param positions_feux Ensemble des positions de feux (pour ne pas placer sur un feu).
 # @return True si l'obstacle automatique a été ajouté, False sinon.
-def ajouter_obstacle_auto(grille: List[List[str]], x: int, y: int, feux: List[Dict[str, Any]]) -> bool:
-    positions_feux = {feu["position"] for feu in feux}
-    if grille[y][x] == ROUTE and (x, y) not in positions_feux and grille[y][x] not in SYMBOLES_NON_PRATICABLES:
-        grille[y][x] = OBSTACLE_AUTO_SYM
+def ajouter_obstacle_auto(grille: np.ndarray, x: int, y: int, positions_feux: Set[Tuple[int, int]]) -> bool:
+    global version_grille
+    # Même lecture unique que pour l'obstacle manuel : == ROUTE suffit
+    if grille[y, x] == ROUTE and (x, y) not in positions_feux:
+        grille[y, x] = OBSTACLE_AUTO_SYM
+        obstacles_auto_positions.append((x, y)) # Tient à jour la liste des obstacles auto posés
+        version_grille += 1
         return True
     return False
 
 ##
-# @brief Force un recalcul de chemin pour les voitures dont la destination ou le chemin est affecté par un nouvel obstacle.
-# @param obstacle_x Coordonnée X de l'obstacle.
-# @param obstacle_y Coordonnée Y de l'obstacle.
+# @brief Force un recalcul de chemin pour les voitures dont la destination ou le chemin est affecté par de nouveaux obstacles.
+# @param positions_obstacles Ensemble des positions (x, y) des obstacles ajoutés ce tick.
 # @param voitures Liste des voitures actives (sera modifiée).
-def forcer_recalcul_si_affecte(obstacle_x: int, obstacle_y: int, voitures: List[Dict[str, Any]]) -> None:
-    obstacle_pos = (obstacle_x, obstacle_y)
+# @details Version groupée : k obstacles ajoutés dans le même tick (p.ex. clics rapides)
+#          coûtent un seul balayage des voitures avec tests d'appartenance O(1),
+#          au lieu de k balayages complets.
+def forcer_recalcul_si_affectees(positions_obstacles: FrozenSet[Tuple[int, int]], voitures: List[Voiture]) -> None:
     for v in voitures:
-        if v.get('temps_arrivee') is None and tuple(v["position"]) != obstacle_pos:
-            chemin_tuples = [tuple(p) for p in v["chemin"]] if v["chemin"] else []
-            if (obstacle_pos in chemin_tuples) or (tuple(v["destination"]) == obstacle_pos):
-                v["chemin"] = [] # Chemin vide pour forcer un recalcul
-                v["recalcul_echecs"] = 0
+        if v.temps_arrivee is None and v.position not in positions_obstacles:
+            # Seule la portion restante du chemin (à partir du curseur) est pertinente :
+            # les pas déjà consommés ne seront plus empruntés.
+            if (v.destination in positions_obstacles) or not positions_obstacles.isdisjoint(v.chemin[v.chemin_idx:]):
+                v.chemin = () # Chemin vide pour forcer un recalcul
+                v.chemin_idx = 0
+                v.recalcul_echecs = 0
                 # Ne marque pas comme bloquée ici, la fonction détectera le blocage si le recalcul échoue ou si elle ne bouge pas.
 
+##
+# @brief Construit un index spatial (hachage uniforme) des voitures par cellule occupée.
+# @param voitures Liste des voitures (actives et en phase de disparition).
+# @return Dictionnaire cellule (x, y) -> liste des voitures présentes sur cette cellule.
+# @details Remplace les parcours linéaires de `voitures` par des requêtes O(1)
+#          "y a-t-il une voiture sur la case (x, y) ?". Reconstruit une fois par tick.
+def construire_index_spatial_voitures(voitures: List[Voiture]) -> Dict[Tuple[int, int], List[Voiture]]:
+    index: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    for v in voitures:
+        index.setdefault(v.position, []).append(v)
+    return index
+
+##
+# @brief Construit un index spatial des piétons actifs par passage piéton occupé.
+# @param pietons Liste des piétons actifs.
+# @return Dictionnaire position de passage (x, y) -> liste des piétons sur ce passage.
+# @details Même principe que l'index des voitures : reconstruit une fois par tick pour
+#          remplacer le parcours linéaire de `pietons` à chaque validation de déplacement.
+def construire_index_pietons(pietons: List[Dict[str, Any]]) -> Dict[Tuple[int, int], List[Dict[str, Any]]]:
+    index: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    for pieton in pietons:
+        index.setdefault(pieton["passage_pos"], []).append(pieton)
+    return index
+
 # --- FONCTIONS DE GESTION PIÉTONS ET PASSAGES PIÉTONS ---
 
 ##
@@ -317,37 +548,32 @@ def forcer_recalcul_si_affecte(obstacle_x: int, obstacle_y: int, voitures: List[
 # @param feux Liste des feux (positions interdites).
 # @param grille La grille (pour vérifier si la case est ROUTE et non obstacle).
 # @return Une liste de dictionnaires représentant les passages piétons placés.
-def initialiser_passages_pietons_sur_routes(n_passages: int, taille_x: int, taille_y: int, feux: List[Dict[str, Any]], grille: List[List[str]]) -> List[Dict[str, Any]]:
-    nouveaux_passages = []
-    positions_interdites = {f['position'] for f in feux}.union({
-        (x,y) for y in range(taille_y) for x in range(taille_x)
-        if grille[y][x] in (OBSTACLE_MANUEL, OBSTACLE_AUTO_SYM)
-    })
-
-    tentatives = 0
-    max_tentatives = n_passages * 200
-
-    while len(nouveaux_passages) < n_passages and tentatives < max_tentatives:
-        px = random.randrange(1, taille_x - 1) # Evite les bords stricts
-        py = random.randrange(1, taille_y - 1)
-        pos = (px, py)
-
-        if grille[py][px] == ROUTE and pos not in positions_interdites and pos not in {p['position'] for p in nouveaux_passages}:
-            is_good_spot = False
-            # Check passage horizontal
-            if px > 0 and px < taille_x - 1 and grille[py][px-1] == ROUTE and grille[py][px+1] == ROUTE:
-                 orientation = 'horizontal'
-                 is_good_spot = True
-            # Check passage vertical
-            elif py > 0 and py < taille_y - 1 and grille[py-1][px] == ROUTE and grille[py+1][px] == ROUTE:
-                 orientation = 'vertical'
-                 is_good_spot = True
-
-            if is_good_spot:
-                 nouveaux_passages.append({'position': pos, 'orientation': orientation})
-                 positions_interdites.add(pos)
-
-        tentatives += 1
+def initialiser_passages_pietons_sur_routes(n_passages: int, taille_x: int, taille_y: int, feux: List[Feu], grille: np.ndarray) -> List[Dict[str, Any]]:
+    # Positions interdites : feux + obstacles existants (repérés en un passage vectorisé).
+    positions_interdites = {f.position for f in feux}
+    masque_obstacles = (grille == OBSTACLE_MANUEL) | (grille == OBSTACLE_AUTO_SYM)
+    positions_interdites.update((int(x), int(y)) for y, x in np.argwhere(masque_obstacles))
+
+    # Construit d'un coup l'ensemble des cases candidates (plutôt qu'un échantillonnage
+    # par rejet pouvant brûler n_passages*200 tirages) : case ROUTE intérieure avec
+    # deux voisines ROUTE opposées. L'horizontale est préférée, comme auparavant.
+    route_mask = grille == ROUTE
+    horizontal_ok = np.zeros_like(route_mask)
+    horizontal_ok[:, 1:-1] = route_mask[:, 1:-1] & route_mask[:, :-2] & route_mask[:, 2:]
+    vertical_ok = np.zeros_like(route_mask)
+    vertical_ok[1:-1, :] = route_mask[1:-1, :] & route_mask[:-2, :] & route_mask[2:, :]
+    interieur = np.zeros_like(route_mask)
+    interieur[1:-1, 1:-1] = True # Evite les bords stricts
+
+    candidats: List[Dict[str, Any]] = []
+    for y, x in np.argwhere((horizontal_ok | vertical_ok) & interieur):
+        pos = (int(x), int(y))
+        if pos not in positions_interdites:
+            orientation = 'horizontal' if horizontal_ok[y, x] else 'vertical'
+            candidats.append({'position': pos, 'orientation': orientation})
+
+    # Echantillonnage sans remise directement dans le vivier de candidats valides
+    nouveaux_passages = random.sample(candidats, min(n_passages, len(candidats)))
 
     if len(nouveaux_passages) < n_passages:
          print(f"Avertissement: N'a pu placer que {len(nouveaux_passages)} passages piétons utiles sur {n_passages} demandés.")
@@ -355,64 +581,79 @@ def initialiser_passages_pietons_sur_routes(n_passages: int, taille_x: int, tail
     print(f"Initialisé {len(nouveaux_passages)} passages piétons.")
     return nouveaux_passages
 
+## @brief Générateur NumPy utilisé pour les tirages aléatoires par lots.
+_rng = np.random.default_rng()
+## @brief Taille du réservoir de tirages uniformes pré-générés.
+_TAILLE_RESERVOIR_UNIFORMES = 1024
+## @brief Réservoir courant de tirages U[0,1), consommé tirage par tirage.
+_reservoir_uniformes: np.ndarray = _rng.random(_TAILLE_RESERVOIR_UNIFORMES)
+## @brief Indice du prochain tirage disponible dans le réservoir.
+_indice_reservoir: int = 0
+
+##
+# @brief Renvoie un tirage uniforme U[0,1) pris dans le réservoir pré-généré.
+# @return Un flottant dans [0, 1).
+# @details Un seul appel C de NumPy produit 1024 tirages d'un coup ; les appels
+#          Python au générateur (un par tick pour les piétons) sont ainsi amortis.
+def _tirage_uniforme() -> float:
+    global _reservoir_uniformes, _indice_reservoir
+    if _indice_reservoir >= _TAILLE_RESERVOIR_UNIFORMES:
+        _reservoir_uniformes = _rng.random(_TAILLE_RESERVOIR_UNIFORMES)
+        _indice_reservoir = 0
+    valeur = float(_reservoir_uniformes[_indice_reservoir])
+    _indice_reservoir += 1
+    return valeur
+
 ##
 # @brief Met à jour l'état (progression) des piétons et gère l'apparition de nouveaux sur les passages libres.
 # @param passages_pietons Liste des passages piétons.
 # @param pietons_actifs Liste des piétons actifs (sera modifiée).
 # @param voitures Liste des voitures actives (pour vérifier si un passage est bloqué par une voiture arrêtée).
-def mettre_a_jour_pietons(passages_pietons: List[Dict[str, Any]], pietons_actifs: List[Dict[str, Any]], voitures: List[Dict[str, Any]]) -> None:
+def mettre_a_jour_pietons(passages_pietons: List[Dict[str, Any]], pietons_actifs: List[Dict[str, Any]], voitures: List[Voiture]) -> None:
     global prochain_id_pieton
 
+    # Index spatial des voitures, construit une fois pour tout le tick :
+    # toutes les requêtes "voiture sur la case ?" deviennent des accès dict O(1)
+    # au lieu de parcours linéaires de la liste des voitures.
+    index_voitures = construire_index_spatial_voitures(voitures)
+
     # 1. Mise à jour de la progression des piétons existants et suppression si arrivée
-    pietons_termines: List[Dict[str, Any]] = [] # Liste temporaire pour ceux à garder
+    # Compactage en place (indice d'écriture) : pas de liste intermédiaire allouée à chaque tick
+    ecriture = 0
     for pieton in pietons_actifs:
         pos_passage = pieton['passage_pos']
-        # Un piéton est bloqué si une voiture *bloquée* ou non-arrivé est sur sa case passage
-        # Vérifier uniquement si la voiture n'est pas en cours de disparition.
-        voiture_bloquante_sur_passage = any(
-            tuple(v['position']) == pos_passage and v.get('temps_arrivee') is None # Une voiture active occupe la case
-            for v in voitures
-        )
-        # Alternativement, pour être précis comme dans la mise à jour voitures:
-        # Une voiture BLOQUÉE (statut bloqué_depuis != None) ou en phase terminale (temps_arrivee!=None, pas encore supprimée)
-        # bloquant_logic = any(
-        #     tuple(v['position']) == pos_passage and (v.get('bloquee_depuis') is not None or (v.get('temps_arrivee') is not None and (time.time() - v['temps_arrivee']) < DELAI_DISPARITION_APRES_ARRIVEE ))
-        #     for v in voitures
-        # )
-        # Conservons la version plus simple "une voiture active sur la case", car est_deplacement_valide checke voitures + pietons
-        # Et les voitures ne *tentent* pas de rouler sur un piéton actif.
         # Le piéton lui-même s'arrête si une voiture active (même non bloquée) est sur sa case.
+        # Les voitures ne *tentent* pas de rouler sur un piéton actif (construire_grille_blocages).
         voiture_presente_sur_passage = any(
-            tuple(v['position']) == pos_passage
-            for v in voitures if v.get('temps_arrivee') is None
+            v.temps_arrivee is None
+            for v in index_voitures.get(pos_passage, ())
         )
 
-
         # Le piéton ne bouge que s'il n'y a PAS de voiture active sur son passage
         if not voiture_presente_sur_passage:
              pieton['progres'] += VITESSE_PIETON
 
         # Si le piéton a fini sa traversée (progression >= 1.0), il est supprimé
         if pieton['progres'] < 1.0:
-            pietons_termines.append(pieton)
+            pietons_actifs[ecriture] = pieton
+            ecriture += 1
 
-    # Remplace la liste des piétons actifs par ceux qui n'ont pas fini de traverser
-    pietons_actifs[:] = pietons_termines
+    # Tronque la liste aux piétons qui n'ont pas fini de traverser
+    del pietons_actifs[ecriture:]
 
     # 2. Tentative d'apparition de nouveaux piétons
     # Vérifie s'il y a des passages piétons disponibles et si la probabilité aléatoire permet l'apparition ce tick.
-    if passages_pietons and random.random() < PROBA_APPARITION_PIETON * len(passages_pietons):
+    if passages_pietons and _tirage_uniforme() < PROBA_APPARITION_PIETON * len(passages_pietons):
         # Choisit un passage piéton au hasard parmi ceux initialisés sur des routes valides
-        passage_choisi = random.choice(passages_pietons)
+        passage_choisi = passages_pietons[int(_tirage_uniforme() * len(passages_pietons))]
         pos_passage_cible = passage_choisi['position']
 
         # Un nouveau piéton peut apparaître seulement si la case du passage piéton n'est occupée par AUCUN piéton
         # ET par AUCUNE voiture (ni arrivée ni en route) qui serait dessus au moment de l'apparition.
         passage_deja_occupe_par_pieton = any(p['passage_pos'] == pos_passage_cible for p in pietons_actifs)
-        passage_deja_occupe_par_voiture = any(
-            tuple(v['position']) == pos_passage_cible
-            for v in voitures # Regarde TOUTES les voitures, même celles marquées pour suppression imminente, tant qu'elles sont encore dans la liste.
-        )
+        # Regarde TOUTES les voitures, même celles marquées pour suppression imminente,
+        # tant qu'elles sont encore dans la liste (l'index les contient toutes).
+        passage_deja_occupe_par_voiture = pos_passage_cible in index_voitures
 
         # Apparait seulement si le passage est totalement libre (ROUTE, pas de piéton, pas de voiture)
         # Note: la vérification que le passage est sur ROUTE est faite lors de l'initialisation des passages.
@@ -436,9 +677,15 @@ def mettre_a_jour_pietons(passages_pietons: List[Dict[str, Any]], pietons_actifs
 # @param taille_x Largeur grille.
 # @param taille_y Hauteur grille.
 # @param grille La grille (pour identifier les routes et intersections).
-# @return Une liste de dictionnaires représentant les feux initialisés.
-def initialiser_feux_repartis_sur_routes(taille_x: int, taille_y: int, grille: List[List[str]]) -> List[Dict[str, Any]]:
-    feux = []
+# @return Une liste d'objets Feu initialisés (état dynamique dans les tableaux SoA).
+def initialiser_feux_repartis_sur_routes(taille_x: int, taille_y: int, grille: np.ndarray) -> List[Feu]:
+    global feu_etat, feu_durees, feu_duree_actuelle, feu_dernier_changement
+    feux: List[Feu] = []
+    # Colonnes SoA accumulées pendant le placement, converties en tableaux à la fin
+    etats: List[int] = []
+    durees: List[Tuple[float, float, float]] = []
+    durees_actuelles: List[float] = []
+    derniers_changements: List[float] = []
     positions_occupees = set() # Pour éviter de placer deux feux sur la même case
     # Limites pour répartir les feux
     MAX_FEUX_PAR_LIGNE = max(1, taille_x // 15) # Par exemple, 1 feu tous les ~15 cellules de largeur
@@ -450,19 +697,20 @@ def initialiser_feux_repartis_sur_routes(taille_x: int, taille_y: int, grille: L
     duree_vert, duree_orange, duree_rouge = 10.0, 3.0, 7.0
 
     # Trouver les intersections (cases ROUTE avec >=3 voisins ROUTE y compris elles-mêmes)
-    intersections_candidates: List[Tuple[int, int]] = []
-    for y in range(taille_y):
-        for x in range(taille_x):
-             if grille[y][x] == ROUTE:
-                 route_voisins = sum(
-                     1 for dx, dy in [(0, 0), (0, 1), (0, -1), (1, 0), (-1, 0)]
-                     if 0 <= x + dx < taille_x and 0 <= y + dy < taille_y and grille[y + dy][x + dx] == ROUTE
-                 )
-                 if route_voisins >= 3: intersections_candidates.append((x, y))
+    # Comptage par décalages-et-additions vectorisés plutôt que par double boucle Python.
+    route_mask = grille == ROUTE
+    compte_voisins = route_mask.astype(np.int8)
+    compte_voisins[:-1, :] += route_mask[1:, :] # Voisine du dessous
+    compte_voisins[1:, :] += route_mask[:-1, :] # Voisine du dessus
+    compte_voisins[:, :-1] += route_mask[:, 1:] # Voisine de droite
+    compte_voisins[:, 1:] += route_mask[:, :-1] # Voisine de gauche
+    intersections_candidates: List[Tuple[int, int]] = [
+        (int(x), int(y)) for y, x in np.argwhere(route_mask & (compte_voisins >= 3))
+    ]
 
     # Fallback si peu/pas d'intersections détectées
     if not intersections_candidates:
-         intersections_candidates = [(x,y) for y in range(taille_y) for x in range(taille_x) if grille[y][x] == ROUTE]
+         intersections_candidates = [(int(x), int(y)) for y, x in np.argwhere(route_mask)]
          if not intersections_candidates:
               print("FATAL: Aucune case ROUTE pour placer les feux!")
               return []
@@ -475,7 +723,7 @@ def initialiser_feux_repartis_sur_routes(taille_x: int, taille_y: int, grille: L
             feux_par_ligne.get(y, 0) < MAX_FEUX_PAR_LIGNE and
             feux_par_colonne.get(x, 0) < MAX_FEUX_PAR_COLONNE and
             pos not in positions_occupees and
-            grille[y][x] not in (OBSTACLE_AUTO_SYM, OBSTACLE_MANUEL)
+            grille[y, x] not in (OBSTACLE_AUTO_SYM, OBSTACLE_MANUEL)
         )
 
         if peut_placer:
@@ -483,188 +731,482 @@ def initialiser_feux_repartis_sur_routes(taille_x: int, taille_y: int, grille: L
             offset = random.uniform(0, temps_total_cycle)
             temps_depuis_debut_cycle = (time.time() - offset) % temps_total_cycle
 
-            etat_initial = "vert"
+            etat_initial = FEU_VERT
             duree_actuelle_initiale: float
             dernier_changement_initial: float = time.time() - temps_depuis_debut_cycle
 
             if temps_depuis_debut_cycle <= duree_vert:
-                 etat_initial = "vert"
+                 etat_initial = FEU_VERT
                  temps_ecoule_dans_etat = temps_depuis_debut_cycle
                  duree_actuelle_initiale = duree_vert - temps_ecoule_dans_etat
             elif temps_depuis_debut_cycle <= duree_vert + duree_orange:
-                 etat_initial = "orange"
+                 etat_initial = FEU_ORANGE
                  temps_ecoule_dans_etat = temps_depuis_debut_cycle - duree_vert
                  duree_actuelle_initiale = duree_orange - temps_ecoule_dans_etat
             else: # Reste du cycle = rouge
-                 etat_initial = "rouge"
+                 etat_initial = FEU_ROUGE
                  temps_ecoule_dans_etat = temps_depuis_debut_cycle - (duree_vert + duree_orange)
                  duree_actuelle_initiale = duree_rouge - temps_ecoule_dans_etat
 
-            feux.append({
-                "position": pos, "etat": etat_initial,
-                "duree_vert": duree_vert, "duree_orange": duree_orange, "duree_rouge": duree_rouge,
-                "duree_actuelle": duree_actuelle_initiale,
-                "dernier_changement": dernier_changement_initial
-            })
+            feux.append(Feu(position=pos, index=len(feux)))
+            etats.append(etat_initial)
+            durees.append((duree_vert, duree_orange, duree_rouge))
+            durees_actuelles.append(duree_actuelle_initiale)
+            derniers_changements.append(dernier_changement_initial)
             positions_occupees.add(pos)
             feux_par_ligne[y] = feux_par_ligne.get(y, 0) + 1
             feux_par_colonne[x] = feux_par_colonne.get(x, 0) + 1
 
+    # Matérialise l'état dynamique en tableaux parallèles
+    feu_etat = np.array(etats, dtype=np.uint8)
+    feu_durees = np.array(durees)
+    feu_duree_actuelle = np.array(durees_actuelles)
+    feu_dernier_changement = np.array(derniers_changements)
+
     print(f"Initialisé {len(feux)} feux (max {MAX_FEUX_PAR_LIGNE}/ligne, max {MAX_FEUX_PAR_COLONNE}/colonne).")
     return feux
 
 ##
 # @brief Met à jour l'état (couleur) de chaque feu en fonction du temps écoulé.
 # @param feux La liste des feux de circulation (sera modifiée).
-def mettre_a_jour_feux(feux: List[Dict[str, Any]]) -> None:
-    temps_actuel = time.time()
-    for feu in feux:
-        if temps_actuel - feu["dernier_changement"] > feu["duree_actuelle"]:
-            if feu["etat"] == "vert":
-                feu["etat"] = "orange"
-                feu["duree_actuelle"] = feu["duree_orange"]
-            elif feu["etat"] == "orange":
-                feu["etat"] = "rouge"
-                feu["duree_actuelle"] = feu["duree_rouge"]
-            elif feu["etat"] == "rouge":
-                feu["etat"] = "vert"
-                feu["duree_actuelle"] = feu["duree_vert"]
-            feu["dernier_changement"] = temps_actuel
+# @param temps_actuel Horloge du tick courant (calculée une fois dans la boucle principale).
+def mettre_a_jour_feux(feux: List[Feu], temps_actuel: float) -> None:
+    if not feux:
+        return
+    # Transition d'état vectorisée sur tous les feux dont la durée est écoulée
+    a_changer = np.nonzero(temps_actuel - feu_dernier_changement > feu_duree_actuelle)[0]
+    if a_changer.size:
+        feu_etat[a_changer] = (feu_etat[a_changer] + 1) % 3 # vert -> orange -> rouge -> vert
+        feu_duree_actuelle[a_changer] = feu_durees[a_changer, feu_etat[a_changer]]
+        feu_dernier_changement[a_changer] = temps_actuel
 
 # --- FONCTION PATHFINDING (A*) ---
 
+##
+# @var _cache_chemins
+# @brief Mémo des résultats A* : (depart, arrivee, version_grille) -> chemin (ou None).
+# Les destinations étant tirées d'un petit ensemble de cases, les mêmes requêtes
+# reviennent souvent ; un hit évite toute la recherche. La clé inclut version_grille,
+# donc les entrées obsolètes ne sont jamais réutilisées après un changement d'obstacle.
+# Éviction LRU : un hit repousse l'entrée en fin d'ordre, la purge retire la plus ancienne.
+_cache_chemins: "OrderedDict[Tuple[Tuple[int, int], Tuple[int, int], int], Union[List[Tuple[int, int]], None]]" = OrderedDict()
+## @brief Taille maximale du cache de chemins avant éviction de l'entrée la moins récente.
+_CACHE_CHEMINS_MAX = 4096
+
+##
+# @brief Convertit les dictionnaires de sens de circulation en tableaux int8 (+1/-1).
+# @param directions_lignes Dictionnaire des sens par ligne ('droite'/'gauche').
+# @param directions_colonnes Dictionnaire des sens par colonne ('bas'/'haut').
+# @param taille_x Largeur grille.
+# @param taille_y Hauteur grille.
+# @return Tuple (sens_lignes, sens_colonnes) : sens_lignes[y] = +1 (droite) ou -1 (gauche),
+#         sens_colonnes[x] = +1 (bas) ou -1 (haut).
+def convertir_directions_en_tableaux(directions_lignes: Dict[int, str], directions_colonnes: Dict[int, str], taille_x: int, taille_y: int) -> Tuple[np.ndarray, np.ndarray]:
+    sens_lignes = np.empty(taille_y, dtype=np.int8)
+    for y in range(taille_y):
+        sens_lignes[y] = 1 if directions_lignes.get(y) == "droite" else -1
+    sens_colonnes = np.empty(taille_x, dtype=np.int8)
+    for x in range(taille_x):
+        sens_colonnes[x] = 1 if directions_colonnes.get(x) == "bas" else -1
+    return sens_lignes, sens_colonnes
+
+##
+# @var _masque_deplacements
+# @brief Masque uint8 des déplacements autorisés par case (bit 0 = bas, 1 = haut,
+# 2 = droite, 3 = gauche), recalculé uniquement quand version_grille change.
+_masque_deplacements: Union[np.ndarray, None] = None
+## @brief Version de grille pour laquelle _masque_deplacements est valide.
+_masque_deplacements_version: int = -1
+
+##
+# @brief Calcule le masque des déplacements autorisés pour chaque case (vectorisé).
+# @details Un bit est levé si la case voisine correspondante est dans la grille, est une
+#          ROUTE praticable, et si le déplacement respecte le sens unique de la ligne ou
+#          de la colonne. Le noyau A* n'a ainsi plus qu'un test de bit par voisin.
+# @param grille Grille uint8.
+# @param sens_lignes Tableau int8 : +1 (droite) ou -1 (gauche) par ligne.
+# @param sens_colonnes Tableau int8 : +1 (bas) ou -1 (haut) par colonne.
+# @return Tableau uint8 de même forme que la grille.
+def _calculer_masque_deplacements(grille: np.ndarray, sens_lignes: np.ndarray, sens_colonnes: np.ndarray) -> np.ndarray:
+    route = grille == ROUTE
+
+    # Praticabilité du voisin dans chaque direction (décalages, bords = interdit)
+    voisin_bas = np.zeros_like(route)
+    voisin_bas[:-1, :] = route[1:, :]
+    voisin_haut = np.zeros_like(route)
+    voisin_haut[1:, :] = route[:-1, :]
+    voisin_droite = np.zeros_like(route)
+    voisin_droite[:, :-1] = route[:, 1:]
+    voisin_gauche = np.zeros_like(route)
+    voisin_gauche[:, 1:] = route[:, :-1]
+
+    # Sens uniques : les déplacements verticaux dépendent de la colonne, les horizontaux de la ligne
+    colonne_bas = (sens_colonnes == 1)[None, :]
+    colonne_haut = (sens_colonnes == -1)[None, :]
+    ligne_droite = (sens_lignes == 1)[:, None]
+    ligne_gauche = (sens_lignes == -1)[:, None]
+
+    return ((voisin_bas & colonne_bas).astype(np.uint8)
+            | ((voisin_haut & colonne_haut).astype(np.uint8) << np.uint8(1))
+            | ((voisin_droite & ligne_droite).astype(np.uint8) << np.uint8(2))
+            | ((voisin_gauche & ligne_gauche).astype(np.uint8) << np.uint8(3)))
+
+##
+# @brief Noyau A* numérique travaillant sur le masque de déplacements (compilé par Numba si disponible).
+# @details Les positions sont encodées en indices plats (pid = y * taille_x + x) et les
+#          structures de l'algorithme sont des tableaux NumPy plats, ce qui évite tout
+#          dictionnaire/tuple Python dans la boucle d'expansion. Les limites de grille,
+#          la praticabilité et les sens uniques sont déjà encodés dans le masque : la
+#          validation d'un voisin se réduit à un test de bit. L'heuristique de Manhattan
+#          est volontairement recalculée inline (deux abs + une addition entières) : une
+#          mémoïsation par case coûterait ici plus cher (lecture mémoire) que le calcul.
+# @param masque_deplacements Masque uint8 par case (voir _calculer_masque_deplacements).
+# @param depart_x Coordonnée X de départ.
+# @param depart_y Coordonnée Y de départ.
+# @param arrivee_x Coordonnée X d'arrivée.
+# @param arrivee_y Coordonnée Y d'arrivée.
+# @return Tableau int32 'precedent' indexé par pid (-1 = non atteint) ; la case d'arrivée
+#         vaut -1 si aucun chemin n'existe.
+@njit(cache=True)
+def _astar_noyau(masque_deplacements: np.ndarray, depart_x: int, depart_y: int, arrivee_x: int, arrivee_y: int) -> np.ndarray:
+    taille_y, taille_x = masque_deplacements.shape
+    nb_cellules = taille_x * taille_y
+
+    depart_pid = depart_y * taille_x + depart_x
+    arrivee_pid = arrivee_y * taille_x + arrivee_x
+
+    # precedent[pid] = pid du parent dans le chemin, -1 si non atteint
+    precedent = np.full(nb_cellules, -1, dtype=np.int32)
+    # cout_g[pid] = coût du départ à pid, -1 si non visité
+    cout_g = np.full(nb_cellules, -1, dtype=np.int32)
+    cout_g[depart_pid] = 0
+    # Ensemble fermé : une case dépilée est définitive (heuristique de Manhattan
+    # cohérente) ; les doublons encore dans le tas sont ignorés au dépilage.
+    clos = np.zeros(nb_cellules, dtype=np.uint8)
+    precedent[depart_pid] = depart_pid # Le départ est son propre parent (sentinelle)
+
+    # Min-heap binaire sur tableau plat préalloué : chaque entrée (f_cost, pid) est
+    # empaquetée dans un seul int64 (cle = f_cost * nb_cellules + pid), ce qui préserve
+    # l'ordre lexicographique et réduit push/pop à des déplacements d'entiers, sans
+    # tuples boxés ni liste Python. Capacité bornée : au plus une entrée par arc entrant
+    # (4 par case), plus l'entrée initiale.
+    tas = np.empty(4 * nb_cellules + 1, dtype=np.int64)
+    tas[0] = (abs(depart_x - arrivee_x) + abs(depart_y - arrivee_y)) * nb_cellules + depart_pid
+    taille_tas = 1
+
+    while taille_tas > 0:
+        # Dépile la racine (plus petit f_cost), puis percolation descendante du dernier élément
+        courant_pid = int(tas[0] % nb_cellules)
+        taille_tas -= 1
+        derniere = tas[taille_tas]
+        i = 0
+        while True:
+            enfant = 2 * i + 1
+            if enfant >= taille_tas:
+                break
+            if enfant + 1 < taille_tas and tas[enfant + 1] < tas[enfant]:
+                enfant += 1
+            if tas[enfant] < derniere:
+                tas[i] = tas[enfant]
+                i = enfant
+            else:
+                break
+        if taille_tas > 0:
+            tas[i] = derniere
+
+        if clos[courant_pid]:
+            continue # Entrée périmée : la case a déjà été dépilée avec un meilleur coût
+        clos[courant_pid] = 1
+        cx = courant_pid % taille_x
+        cy = courant_pid // taille_x
+
+        if courant_pid == arrivee_pid:
+            return precedent # Chemin trouvé, reconstruit par l'appelant
+
+        # Explore les 4 voisins orthogonaux (Bas, Haut, Droite, Gauche) ; le masque
+        # encode déjà limites, praticabilité et sens uniques : un bit par direction
+        bits = masque_deplacements[cy, cx]
+        for k in range(4):
+            if not (bits >> k) & 1:
+                continue # Déplacement interdit (bord, non-route ou contresens)
+            if k == 0:
+                dx, dy = 0, 1
+            elif k == 1:
+                dx, dy = 0, -1
+            elif k == 2:
+                dx, dy = 1, 0
+            else:
+                dx, dy = -1, 0
+            nx, ny = cx + dx, cy + dy
+
+            # Calcule le coût (chaque étape coûte 1)
+            n_cout_g = cout_g[courant_pid] + 1
+
+            voisin_pid = ny * taille_x + nx
+            if clos[voisin_pid]:
+                continue # Déjà finalisé, inutile de le réexaminer
+            # Si ce chemin vers le voisin est meilleur, ou si le voisin n'a pas encore été visité
+            if cout_g[voisin_pid] == -1 or n_cout_g < cout_g[voisin_pid]:
+                cout_g[voisin_pid] = n_cout_g
+                precedent[voisin_pid] = courant_pid
+                priorite = n_cout_g + abs(nx - arrivee_x) + abs(ny - arrivee_y) # f_cost (G + H)
+                # Empile (percolation montante) la clé empaquetée (f_cost, pid)
+                cle = np.int64(priorite) * nb_cellules + voisin_pid
+                i = taille_tas
+                taille_tas += 1
+                while i > 0:
+                    parent = (i - 1) >> 1
+                    if tas[parent] <= cle:
+                        break
+                    tas[i] = tas[parent]
+                    i = parent
+                tas[i] = cle
+
+    return precedent # Aucun chemin trouvé : precedent[arrivee_pid] reste -1
+
+##
+# @brief BFS inverse depuis une destination : distance de chaque case vers la destination.
+# @details Parcourt le graphe en sens inverse (une case p est prédécesseur de c si le
+#          masque autorise le déplacement p -> c). Coûts unitaires : le BFS donne les
+#          mêmes longueurs optimales que l'A*, mais un seul parcours sert ensuite à
+#          reconstruire les chemins de *toutes* les voitures visant cette destination.
+# @param masque_deplacements Masque uint8 par case (voir _calculer_masque_deplacements).
+# @param arrivee_x Coordonnée X de la destination.
+# @param arrivee_y Coordonnée Y de la destination.
+# @return Tableau int32 (taille_y, taille_x) : distance vers la destination, -1 si inatteignable.
+@njit(cache=True)
+def _bfs_inverse_noyau(masque_deplacements: np.ndarray, arrivee_x: int, arrivee_y: int) -> np.ndarray:
+    taille_y, taille_x = masque_deplacements.shape
+    nb_cellules = taille_x * taille_y
+
+    dist = np.full((taille_y, taille_x), -1, dtype=np.int32)
+    dist[arrivee_y, arrivee_x] = 0
+
+    # File FIFO préallouée d'indices plats (chaque case n'est empilée qu'une fois)
+    file_pids = np.empty(nb_cellules, dtype=np.int32)
+    file_pids[0] = arrivee_y * taille_x + arrivee_x
+    tete, queue = 0, 1
+
+    while tete < queue:
+        courant_pid = file_pids[tete]
+        tete += 1
+        cx = courant_pid % taille_x
+        cy = courant_pid // taille_x
+        d_suivante = dist[cy, cx] + 1
+
+        # Prédécesseurs : cases p telles que le déplacement k depuis p mène ici
+        for k in range(4):
+            if k == 0:
+                dx, dy = 0, 1
+            elif k == 1:
+                dx, dy = 0, -1
+            elif k == 2:
+                dx, dy = 1, 0
+            else:
+                dx, dy = -1, 0
+            px, py = cx - dx, cy - dy
+            if px < 0 or px >= taille_x or py < 0 or py >= taille_y:
+                continue
+            if dist[py, px] != -1:
+                continue # Déjà atteinte (BFS : première visite = distance minimale)
+            if not (masque_deplacements[py, px] >> k) & 1:
+                continue # Le masque n'autorise pas le déplacement p -> courant
+            dist[py, px] = d_suivante
+            file_pids[queue] = py * taille_x + px
+            queue += 1
+
+    return dist
+
+# Échauffement : force la compilation JIT des noyaux au lancement (sur une grille 2x2
+# triviale) plutôt qu'au premier recalcul d'itinéraire en cours de simulation.
+# Avec cache=True, les lancements suivants rechargent le code natif depuis le disque.
+if NUMBA_DISPONIBLE:
+    _astar_noyau(np.full((2, 2), 0b1111, dtype=np.uint8), 0, 0, 1, 1)
+    _bfs_inverse_noyau(np.full((2, 2), 0b1111, dtype=np.uint8), 1, 1)
+
+##
+# @brief Renvoie le masque de déplacements autorisés, recalculé seulement quand la grille change.
+# @param grille La grille.
+# @param directions_lignes Dictionnaire des sens par ligne.
+# @param directions_colonnes Dictionnaire des sens par colonne.
+# @return Masque uint8 par case (voir _calculer_masque_deplacements). Ne pas modifier (cache partagé).
+def obtenir_masque_deplacements(grille: np.ndarray, directions_lignes: Dict[int, str], directions_colonnes: Dict[int, str]) -> np.ndarray:
+    global _masque_deplacements, _masque_deplacements_version
+    if _masque_deplacements is None or _masque_deplacements_version != version_grille:
+        taille_y, taille_x = grille.shape
+        sens_lignes, sens_colonnes = convertir_directions_en_tableaux(directions_lignes, directions_colonnes, taille_x, taille_y)
+        _masque_deplacements = _calculer_masque_deplacements(grille, sens_lignes, sens_colonnes)
+        _masque_deplacements_version = version_grille
+    return _masque_deplacements
+
+##
+# @brief Mémorise un résultat A*/BFS dans le cache LRU des chemins (avec éviction).
+# @param cle_cache Clé (depart, arrivee, version_grille).
+# @param chemin Chemin trouvé, ou None pour mémoriser un échec.
+def _memoriser_chemin(cle_cache: Tuple[Tuple[int, int], Tuple[int, int], int], chemin: Union[List[Tuple[int, int]], None]) -> None:
+    if len(_cache_chemins) >= _CACHE_CHEMINS_MAX:
+        _cache_chemins.popitem(last=False) # Évince l'entrée la moins récemment utilisée
+    _cache_chemins[cle_cache] = chemin
+
 ##
 # @brief Calcule le chemin le plus court entre deux points sur la grille en évitant les obstacles et respectant les sens de circulation.
+# @details Enveloppe fine autour du noyau numérique `_astar_noyau` : convertit la grille et
+#          les sens une fois, puis reconstruit le chemin depuis le tableau 'precedent'.
 # @param grille La grille.
 # @param depart Coordonnées de départ [x, y].
 # @param arrivee Coordonnées d'arrivée [x, y].
 # @param directions_lignes Dictionnaire des sens par ligne.
 # @param directions_colonnes Dictionnaire des sens par colonne.
-# @return Liste de coordonnées [x, y] représentant le chemin, ou None si aucun chemin n'est trouvé.
-def trouver_chemin(grille: List[List[str]], depart: List[int], arrivee: List[int], directions_lignes: Dict[int, str], directions_colonnes: Dict[int, str]) -> Union[List[List[int]], None]:
-    def heuristique(a: Tuple[int, int], b: Tuple[int, int]) -> int:
-        # Distance de Manhattan comme heuristique
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    depart_t, arrivee_t = tuple(depart), tuple(arrivee)
-    taille_x, taille_y = len(grille[0]), len(grille)
+# @return Liste de coordonnées (x, y) représentant le chemin, ou None si aucun chemin n'est trouvé.
+def trouver_chemin(grille: np.ndarray, depart: Tuple[int, int], arrivee: Tuple[int, int], directions_lignes: Dict[int, str], directions_colonnes: Dict[int, str]) -> Union[List[Tuple[int, int]], None]:
+    # Les positions circulent en tuples partout dans le module : ne convertit que si
+    # un appelant externe passe encore une liste (aucune allocation sur le chemin chaud)
+    depart_t = depart if type(depart) is tuple else tuple(depart)
+    arrivee_t = arrivee if type(arrivee) is tuple else tuple(arrivee)
+    taille_y, taille_x = grille.shape
 
     # Vérification basique de la validité des points de départ/arrivée
     if not (0 <= depart_t[0] < taille_x and 0 <= depart_t[1] < taille_y and 0 <= arrivee_t[0] < taille_x and 0 <= arrivee_t[1] < taille_y):
         return None # Hors limites
-    if grille[depart_t[1]][depart_t[0]] != ROUTE or grille[arrivee_t[1]][arrivee_t[0]] != ROUTE:
+    if grille[depart_t[1], depart_t[0]] != ROUTE or grille[arrivee_t[1], arrivee_t[0]] != ROUTE:
         return None # Pas sur une route praticable
 
     if depart_t == arrivee_t:
-        return [list(depart_t)] # Déjà arrivé
-
-    # Initialisation de l'algorithme A*
-    # ouverte est un min-heap: [(f_cost, position)]
-    ouverte: List[Tuple[int, Tuple[int, int]]] = [(heuristique(depart_t, arrivee_t), depart_t)]
-    # precedent enregistre le chemin : position courante -> position précédente
-    precedent: Dict[Tuple[int, int], Union[Tuple[int, int], None]] = {depart_t: None}
-    # cout_g enregistre le coût du départ à la position courante
-    cout_g: Dict[Tuple[int, int], float] = {depart_t: 0}
-
-    # Directions de déplacement possibles (orthogonal seulement)
-    cardinal_directions = [(0, 1), (0, -1), (1, 0), (-1, 0)] # Bas, Haut, Droite, Gauche
-
-    while ouverte:
-        # Sélectionne la case dans 'ouverte' avec le plus petit f_cost
-        _, courant = heapq.heappop(ouverte)
-        cx, cy = courant
-
-        if courant == arrivee_t:
-            # Chemin trouvé, reconstruction à l'envers
-            chemin: List[List[int]] = []
-            temp = courant
-            while temp is not None:
-                chemin.append(list(temp))
-                temp = precedent.get(temp)
-            return chemin[::-1] # Retourne le chemin dans le bon ordre (du départ à l'arrivée)
-
-        # Explore les voisins
-        for dx, dy in cardinal_directions:
-            voisin_t = (cx + dx, cy + dy)
-            nx, ny = voisin_t
-
-            # Vérifications du voisin
-            if not (0 <= nx < taille_x and 0 <= ny < taille_y): continue # Hors limites
-            if grille[ny][nx] != ROUTE: continue # Le voisin n'est pas une route (inclut Obstacles et Non-Routier)
-
-            # Vérifie si le déplacement est autorisé selon les sens uniques globaux
-            move_is_allowed = False
-            if dy == 0 and dx != 0: # Mouvement horizontal
-                # Vérifie le sens de la ligne actuelle (cy)
-                if (directions_lignes.get(cy) == "droite" and dx == 1) or (directions_lignes.get(cy) == "gauche" and dx == -1):
-                    move_is_allowed = True
-            elif dx == 0 and dy != 0: # Mouvement vertical
-                 # Vérifie le sens de la colonne actuelle (cx)
-                if (directions_colonnes.get(cx) == "bas" and dy == 1) or (directions_colonnes.get(cx) == "haut" and dy == -1):
-                    move_is_allowed = True
-            # Les mouvements diagonaux sont implicitement non autorisés ici.
-
-            if not move_is_allowed:
-                 continue # Le déplacement ne suit pas le sens unique
-
-            # Calcule le coût (distance + 1 car mouvements unitaires)
-            n_cout_g = cout_g[courant] + 1 # Chaque étape coûte 1
-
-            # Si ce chemin vers le voisin est meilleur (coût G plus petit), ou si le voisin n'a pas encore été visité
-            if voisin_t not in cout_g or n_cout_g < cout_g[voisin_t]:
-                cout_g[voisin_t] = n_cout_g # Met à jour le coût G
-                precedent[voisin_t] = courant # Enregistre le parent pour reconstruction du chemin
-                priorite = n_cout_g + heuristique(voisin_t, arrivee_t) # Calcule f_cost (G + H)
-                heapq.heappush(ouverte, (priorite, voisin_t)) # Ajoute ou met à jour dans la queue de priorité
-
-    return None # Aucun chemin trouvé de départ à arrivée
+        return [depart_t] # Déjà arrivé
+
+    # Consulte le mémo : un hit évite toute la recherche A*
+    cle_cache = (depart_t, arrivee_t, version_grille)
+    if cle_cache in _cache_chemins:
+        chemin_memo = _cache_chemins[cle_cache]
+        _cache_chemins.move_to_end(cle_cache) # Hit : entrée redevient la plus récente
+        # Renvoi direct sans copie : depuis le passage au curseur de chemin, les
+        # appelants ne modifient jamais la liste (ils n'en prennent que des tranches)
+        return chemin_memo
+
+    masque = obtenir_masque_deplacements(grille, directions_lignes, directions_colonnes)
+    precedent = _astar_noyau(masque, depart_t[0], depart_t[1], arrivee_t[0], arrivee_t[1])
+
+    arrivee_pid = arrivee_t[1] * taille_x + arrivee_t[0]
+    if precedent[arrivee_pid] == -1:
+        # Mémorise aussi les échecs : re-chercher un chemin inexistant est tout aussi coûteux
+        _memoriser_chemin(cle_cache, None)
+        return None # Aucun chemin trouvé de départ à arrivée
+
+    # Chemin trouvé, reconstruction à l'envers depuis l'arrivée
+    depart_pid = depart_t[1] * taille_x + depart_t[0]
+    chemin: List[Tuple[int, int]] = []
+    pid = arrivee_pid
+    while pid != depart_pid:
+        chemin.append((pid % taille_x, pid // taille_x))
+        pid = int(precedent[pid])
+    chemin.append(depart_t)
+    chemin.reverse() # Remet le chemin dans le bon ordre (du départ à l'arrivée)
+
+    _memoriser_chemin(cle_cache, chemin)
+    return chemin # Renvoi direct : les appelants ne modifient jamais la liste
+
+##
+# @brief Calcule en lot les chemins de plusieurs départs vers une MÊME destination.
+# @details Un seul BFS inverse depuis la destination produit le champ des distances, puis
+#          chaque chemin est reconstruit par descente gloutonne (distance strictement
+#          décroissante). Coûts unitaires : les chemins sont optimaux, comme avec l'A*.
+#          À privilégier quand plusieurs voitures visent la même destination dans le tick.
+# @param grille La grille.
+# @param departs Liste de positions de départ (x, y).
+# @param arrivee Destination commune (x, y).
+# @param directions_lignes Dictionnaire des sens par ligne.
+# @param directions_colonnes Dictionnaire des sens par colonne.
+# @return Liste alignée sur `departs` : chemin (liste de tuples) ou None pour chaque départ.
+def trouver_chemins_groupes(grille: np.ndarray, departs: List[Tuple[int, int]], arrivee: Tuple[int, int], directions_lignes: Dict[int, str], directions_colonnes: Dict[int, str]) -> List[Union[List[Tuple[int, int]], None]]:
+    arrivee_t = arrivee if type(arrivee) is tuple else tuple(arrivee)
+    taille_y, taille_x = grille.shape
+    resultats: List[Union[List[Tuple[int, int]], None]] = []
+
+    if not (0 <= arrivee_t[0] < taille_x and 0 <= arrivee_t[1] < taille_y) or grille[arrivee_t[1], arrivee_t[0]] != ROUTE:
+        return [None] * len(departs) # Destination invalide : aucun départ ne peut aboutir
+
+    masque = obtenir_masque_deplacements(grille, directions_lignes, directions_colonnes)
+    dist: Union[np.ndarray, None] = None # Champ des distances, calculé au premier besoin
+
+    for depart in departs:
+        depart_t = depart if type(depart) is tuple else tuple(depart)
+        if not (0 <= depart_t[0] < taille_x and 0 <= depart_t[1] < taille_y) or grille[depart_t[1], depart_t[0]] != ROUTE:
+            resultats.append(None)
+            continue
+        if depart_t == arrivee_t:
+            resultats.append([depart_t])
+            continue
+
+        # Même mémo LRU que trouver_chemin : hits partagés entre les deux chemins d'accès
+        cle_cache = (depart_t, arrivee_t, version_grille)
+        if cle_cache in _cache_chemins:
+            chemin_memo = _cache_chemins[cle_cache]
+            _cache_chemins.move_to_end(cle_cache)
+            resultats.append(chemin_memo) # Renvoi direct : jamais modifié par les appelants
+            continue
+
+        if dist is None:
+            dist = _bfs_inverse_noyau(masque, arrivee_t[0], arrivee_t[1])
+
+        x, y = depart_t
+        if dist[y, x] == -1:
+            _memoriser_chemin(cle_cache, None)
+            resultats.append(None)
+            continue
+
+        # Descente gloutonne : chaque pas va vers une voisine autorisée de distance - 1
+        chemin: List[Tuple[int, int]] = [depart_t]
+        while (x, y) != arrivee_t:
+            bits = int(masque[y, x])
+            d_voulue = dist[y, x] - 1
+            if bits & 1 and dist[y + 1, x] == d_voulue:
+                y += 1
+            elif (bits >> 1) & 1 and dist[y - 1, x] == d_voulue:
+                y -= 1
+            elif (bits >> 2) & 1 and dist[y, x + 1] == d_voulue:
+                x += 1
+            else: # Le masque garantit qu'au moins une direction décroît (champ cohérent)
+                x -= 1
+            chemin.append((x, y))
+
+        _memoriser_chemin(cle_cache, chemin)
+        resultats.append(chemin) # Renvoi direct : jamais modifié par les appelants
+
+    return resultats
 
 ##
 # @brief Trouve une nouvelle destination aléatoire valide (sur ROUTE praticable et "escapable")
 # pour une voiture, en évitant la position actuelle et les positions permanemment bloquées.
-# @param voiture_actuelle Le dict voiture.
+# @param voiture_actuelle La voiture concernée.
 # @param taille_x Largeur grille.
 # @param taille_y Hauteur grille.
 # @param feux Liste feux (pour exclure ces positions).
 # @param grille La grille.
-# @param directions_lignes Dictionnaire des sens par ligne (utilisé par `est_case_escapable`).
-# @param colonnes_directions Dictionnaire des sens par colonne (utilisé par `est_case_escapable`).
+# @param directions_lignes Dictionnaire des sens par ligne (transmis au pathfinding).
+# @param colonnes_directions Dictionnaire des sens par colonne (transmis au pathfinding).
 # @param voitures Liste autres voitures (non utilisé dans l'impl. actuelle pour choisir dest, mais pourrait l'être).
-# @return Nouvelle destination sous forme de liste [x, y] ou None si aucune destination atteignable trouvée.
-def trouver_nouvelle_destination_valide(voiture_actuelle: Dict[str, Any], taille_x: int, taille_y: int, feux: List[Dict[str, Any]], grille: List[List[str]], directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], voitures: List[Dict[str, Any]]) -> Union[List[int], None]:
-    # Calculer les positions permanentes interdites une seule fois
-    positions_interdites_perm = {feu["position"] for feu in feux}.union({
-         (x,y) for y in range(taille_y) for x in range(taille_x)
-         if grille[y][x] in SYMBOLES_NON_PRATICABLES
-    })
-
-    pos_actuelle = tuple(voiture_actuelle["position"])
+# @return Nouvelle destination sous forme de tuple (x, y) ou None si aucune destination atteignable trouvée.
+def trouver_nouvelle_destination_valide(voiture_actuelle: Voiture, taille_x: int, taille_y: int, feux: List[Feu], grille: np.ndarray, directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], voitures: List[Voiture]) -> Union[Tuple[int, int], None]:
+    # Réservoir des cases valides d'office : chaque tirage est ROUTE, escapable, hors
+    # feu/obstacle. Seules les contraintes variables restent vérifiées dans la boucle.
+    cellules_valides = obtenir_cellules_valides(grille, feux)
+    if not cellules_valides:
+        return None
+
+    pos_actuelle = voiture_actuelle.position
     tentatives = 0
     max_tentatives = 300 # Limiter le nombre de tentatives pour éviter de bloquer la simulation
 
     while tentatives < max_tentatives:
-        # Choisit une destination aléatoire potentielle
-        x_dest, y_dest = random.randrange(taille_x), random.randrange(taille_y)
-        dest = (x_dest, y_dest)
-
-        # Vérifie si la destination candidate est valide :
-        # 1. Dans les limites
-        # 2. Sur une case ROUTE
-        # 3. Pas la position actuelle de la voiture
-        # 4. Non dans la liste des positions permanentes interdites (feux, obstacles, non-routier)
-        # 5. Est une case "escapable" (a une route voisine accessible depuis elle)
-        if (0 <= y_dest < taille_y and 0 <= x_dest < taille_x) and \
-           grille[y_dest][x_dest] == ROUTE and \
-           dest != pos_actuelle and \
-           dest not in positions_interdites_perm and \
-           est_case_escapable(dest, taille_x, taille_y, grille):
-
-            # De plus, il doit exister un chemin possible de la position actuelle vers cette destination
+        dest = random.choice(cellules_valides)
+
+        if dest != pos_actuelle:
+            # Il doit exister un chemin possible de la position actuelle vers cette destination
             # avec l'état actuel de la grille (obstacles, directions).
-            temp_path = trouver_chemin(grille, list(pos_actuelle), list(dest), directions_lignes, colonnes_directions)
+            temp_path = trouver_chemin(grille, pos_actuelle, dest, directions_lignes, colonnes_directions)
             # Un chemin valide doit exister ET contenir plus d'une étape (plus que juste la position de départ)
             if temp_path and len(temp_path) > 1:
-                return list(dest) # Destination valide et atteignable trouvée
+                return dest # Destination valide et atteignable trouvée
 
         tentatives += 1
 
@@ -674,40 +1216,67 @@ def trouver_nouvelle_destination_valide(voiture_actuelle: Dict[str, Any], taille
 # --- FONCTION GESTION MOUVEMENT (Détection Blocage, Recalcul, Déplacement) ---
 
 ##
-# @brief Vérifie si un déplacement vers une position donnée est valide, en tenant compte des feux et des piétons.
-# Cette fonction NE VÉRIFIE PAS la présence d'autres voitures (collision car-to-car).
-# @param pos Position cible [x, y] du déplacement.
-# @param feux Liste des feux (pour vérifier les états).
-# @param pietons Liste des piétons actifs (pour vérifier les passages piétons occupés).
-# @param grille La grille (pour vérifier que la position est une ROUTE).
-# @return True si la position est ROUTE et non bloquée par un feu rouge/orange ou un piéton, False sinon.
-def est_deplacement_valide(pos: Tuple[int, int], feux: List[Dict[str, Any]], pietons: List[Dict[str, Any]], grille: List[List[str]]) -> bool:
-    x, y = pos
-    # Vérifier les limites de la grille et le type de cellule (doit être une ROUTE)
-    taille_y, taille_x = len(grille), len(grille[0])
-    if not (0 <= x < taille_x and 0 <= y < taille_y) or grille[y][x] != ROUTE:
-        # Cette vérification est déjà implicitement faite par le pathfinding et la gestion des obstacles
-        # dans les fonctions d'ajout, mais une double vérification ne fait pas de mal ici,
-        # ou peut signaler un problème logique ailleurs si elle est déclenchée.
-        return False
-
-    # Vérifier les feux de circulation
-    # Si la position cible correspond à un feu qui n'est PAS vert, le déplacement est interdit.
-    for feu in feux:
-        if feu["position"] == pos and feu["etat"] != "vert":
-             #print(f" -> Mouvement vers {pos} bloqué par un feu {feu['etat']}.")
-             return False
+# @brief Construit la grille booléenne des cases interdites aux voitures pour ce tick.
+# Cette grille NE CODE PAS la présence d'autres voitures (collision car-to-car),
+# gérée séparément par les grilles d'occupation.
+# @param grille La grille (les cases non-ROUTE sont interdites).
+# @param pietons_par_passage Index spatial des piétons actifs (voir `construire_index_pietons`).
+# @return Tableau booléen (taille_y, taille_x) : True si la case est interdite
+#         (non-ROUTE, feu non vert, ou piéton en cours de traversée).
+# @details Remplace l'ancienne fonction `est_deplacement_valide` appelée pour chaque
+#          pas candidat : l'état feux/piétons ne change pas au sein d'un tick, il est
+#          donc encodé une seule fois ici, et chaque test de pas devient une simple
+#          lecture de tableau au lieu de deux consultations de dicts.
+def construire_grille_blocages(grille: np.ndarray, pietons_par_passage: Dict[Tuple[int, int], List[Dict[str, Any]]]) -> np.ndarray:
+    # Base vectorisée : toute case qui n'est pas une ROUTE est interdite
+    bloquees = grille != ROUTE
+
+    # Feux : une case portant un feu qui n'est PAS vert est interdite.
+    # Le nombre de feux est petit ; l'itération du dict statique est négligeable.
+    for (x, y), index_feu in feu_index_par_position.items():
+        if feu_etat[index_feu] != FEU_VERT:
+            bloquees[y, x] = True
+
+    # Passages piétons : interdits tant qu'un piéton est en cours de traversée (progrès < 1.0)
+    for (x, y), pietons_ici in pietons_par_passage.items():
+        if any(pieton['progres'] < 1.0 for pieton in pietons_ici):
+            bloquees[y, x] = True
+
+    return bloquees
 
-    # Vérifier les passages piétons
-    # Si la position cible est un passage piéton et qu'un piéton est en cours de traversée (progrès < 1.0) dessus,
-    # le déplacement de la voiture est interdit.
-    for pieton in pietons:
-         if pieton['passage_pos'] == pos and pieton['progres'] < 1.0:
-              #print(f" -> Mouvement vers {pos} bloqué par un piéton.")
-              return False
+##
+# @var _tampons_soa
+# @brief Tampons NumPy persistants du rassemblement SoA de `mettre_a_jour_voitures`.
+# Alloués avec une capacité doublée à la demande puis découpés en vues à chaque tick :
+# le rassemblement ne paie plus sept allocations par frame, seulement le remplissage.
+_tampons_soa: Dict[str, np.ndarray] = {}
+## @brief Capacité courante (en voitures) des tampons SoA.
+_tampons_soa_capacite: int = 0
 
-    # Si toutes les vérifications passent, le déplacement est valide selon ces règles (feux, piétons, type de cellule).
-    return True
+##
+# @brief Retourne les vues des tampons SoA dimensionnées pour `nb_voitures`.
+# @param nb_voitures Nombre de voitures du tick courant.
+# @return Tuple (positions, destinations, actives, t_arrivee, dernier_dep, a_chemin, bloquee).
+def _obtenir_tampons_soa(nb_voitures: int) -> Tuple[np.ndarray, ...]:
+    global _tampons_soa, _tampons_soa_capacite
+    if nb_voitures > _tampons_soa_capacite:
+        # Croissance géométrique : les reallocations deviennent vite inexistantes
+        capacite = max(nb_voitures, 2 * _tampons_soa_capacite, 2 * NOMBRE_VOITURES_CIBLE)
+        _tampons_soa = {
+            "positions": np.empty((capacite, 2), dtype=np.int32),
+            "destinations": np.empty((capacite, 2), dtype=np.int32),
+            "actives": np.empty(capacite, dtype=bool),
+            "t_arrivee": np.empty(capacite, dtype=np.float64),
+            "dernier_dep": np.empty(capacite, dtype=np.float64),
+            "a_chemin": np.empty(capacite, dtype=bool),
+            "bloquee": np.empty(capacite, dtype=np.float64),
+        }
+        _tampons_soa_capacite = capacite
+    t = _tampons_soa
+    return (t["positions"][:nb_voitures], t["destinations"][:nb_voitures],
+            t["actives"][:nb_voitures], t["t_arrivee"][:nb_voitures],
+            t["dernier_dep"][:nb_voitures], t["a_chemin"][:nb_voitures],
+            t["bloquee"][:nb_voitures])
 
 ##
 # @brief Gère le comportement de toutes les voitures : pathfinding, détection de blocage, recalcul de chemin/destination, et déplacement.
@@ -719,113 +1288,175 @@ def est_deplacement_valide(pos: Tuple[int, int], feux: List[Dict[str, Any]], pie
 # @param taille_x Largeur grille.
 # @param taille_y Hauteur grille.
 # @param pietons Liste des piétons actifs.
-def mettre_a_jour_voitures(voitures: List[Dict[str, Any]], grille: List[List[str]], feux: List[Dict[str, Any]], directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], taille_x: int, taille_y: int, pietons: List[Dict[str, Any]]) -> None:
-    temps_actuel = time.time()
+# @param temps_actuel Horloge du tick courant (calculée une fois dans la boucle principale).
+def mettre_a_jour_voitures(voitures: List[Voiture], grille: np.ndarray, feux: List[Feu], directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], taille_x: int, taille_y: int, pietons: List[Dict[str, Any]], temps_actuel: float) -> None:
+
+    if not voitures:
+        return
+
+    # Rassemblement SoA : les champs numériques chauds des dicts sont projetés une fois
+    # par tick dans des tableaux NumPy parallèles (indexés comme 'voitures'), ce qui
+    # permet de vectoriser les tests des phases 0 et 2 au lieu de sonder chaque dict.
+    # Un seul balayage de la liste remplit tous les tableaux (au lieu d'une compréhension
+    # par champ, soit sept parcours des mêmes dicts).
+    # Vues sur les tampons persistants (voir _obtenir_tampons_soa) ; entièrement
+    # réécrites par le balayage ci-dessous, aucune valeur du tick précédent ne survit.
+    # bloquee_depuis : NaN encode "non bloquée" (None côté objet)
+    nb_voitures = len(voitures)
+    positions, destinations, actives, t_arrivee, dernier_dep, a_chemin, bloquee = _obtenir_tampons_soa(nb_voitures)
+    for i, v in enumerate(voitures):
+        positions[i] = v.position
+        destinations[i] = v.destination
+        temps_arr = v.temps_arrivee
+        actives[i] = temps_arr is None
+        t_arrivee[i] = 0.0 if temps_arr is None else temps_arr
+        dernier_dep[i] = v.dernier_deplacement
+        a_chemin[i] = v.chemin_idx < len(v.chemin)
+        depuis = v.bloquee_depuis
+        bloquee[i] = np.nan if depuis is None else depuis
 
     # PHASE 0: Gérer les arrivées et identifier les voitures à supprimer ou garder actives
-    voitures_restantes: List[Dict[str, Any]] = []
-    for v in voitures:
-        # Marque la voiture comme arrivée si elle atteint sa destination pour la première fois
-        if v.get("temps_arrivee") is None and tuple(v["position"]) == tuple(v["destination"]):
-            v["temps_arrivee"] = temps_actuel
-            v["chemin"] = [] # Vide le chemin une fois arrivé
-            v["bloquee_depuis"] = None # N'est plus considérée comme bloquée une fois arrivée
-            v["recalcul_echecs"] = 0 # Reset le compteur d'échecs car objectif atteint
-
-        # Conserver la voiture si elle n'est pas encore arrivée OU si elle est arrivée récemment et n'a pas dépassé le délai de disparition
-        if v.get("temps_arrivee") is None or (temps_actuel - v["temps_arrivee"] < DELAI_DISPARITION_APRES_ARRIVEE):
-             voitures_restantes.append(v)
-    # Mettre à jour la liste des voitures dans l'espace mémoire référencé par 'voitures'
-    voitures[:] = voitures_restantes
-
-    # Identifier les voitures *effectivement en route* pour les phases suivantes (celles qui n'ont PAS atteint leur destination finale)
-    voitures_en_route = [v for v in voitures if v.get("temps_arrivee") is None]
+    # Test d'arrivée vectorisé : active ET position == destination
+    arrivees_ce_tick = actives & (positions == destinations).all(axis=1)
+    for idx in np.flatnonzero(arrivees_ce_tick):
+        v = voitures[idx]
+        v.temps_arrivee = temps_actuel
+        v.chemin = () # Vide le chemin une fois arrivé
+        v.chemin_idx = 0
+        v.bloquee_depuis = None # N'est plus considérée comme bloquée une fois arrivée
+        v.recalcul_echecs = 0 # Reset le compteur d'échecs car objectif atteint
+    actives &= ~arrivees_ce_tick
+    t_arrivee[arrivees_ce_tick] = temps_actuel
+    a_chemin[arrivees_ce_tick] = False
+    bloquee[arrivees_ce_tick] = np.nan
+
+    # Conserver les voitures actives et celles arrivées depuis moins de DELAI_DISPARITION_APRES_ARRIVEE
+    conservees = actives | (temps_actuel - t_arrivee < DELAI_DISPARITION_APRES_ARRIVEE)
+    if not conservees.all():
+        voitures[:] = [v for v, garder in zip(voitures, conservees) if garder]
+        positions = positions[conservees]
+        actives = actives[conservees]
+        dernier_dep = dernier_dep[conservees]
+        a_chemin = a_chemin[conservees]
+        bloquee = bloquee[conservees]
+        if not voitures:
+            return
 
     # PHASE 1: Tenter recalcul de chemin pour les voitures pathless ou récemment bloquées (test court)
-    # Identifie les voitures ayant besoin d'un calcul ou recalcul de chemin initial
-    # (celles qui n'ont pas de chemin actuellement OU qui sont marquées bloquées et ont dépassé le seuil pour un recalcul simple)
-    cars_needing_pathfind = [
-         v for v in voitures_en_route
-         if not v["chemin"] or (v.get("bloquee_depuis") is not None and (temps_actuel - v["bloquee_depuis"]) > SEUIL_BLOCAGE)
-    ]
-
-    for v in cars_needing_pathfind:
-         current_pos_list = list(v["position"])
-         destination_list = list(v["destination"])
-
-         # Tente de trouver un chemin VERS la destination actuelle
-         path_trouve = trouver_chemin(grille, current_pos_list, destination_list, directions_lignes, colonnes_directions)
-
-         if path_trouve and len(path_trouve) > 1:
-             # Chemin trouvé, le définir et réinitialiser l'état bloqué
-             v["chemin"] = path_trouve[1:] # Chemin commence *après* la position actuelle
-             v["bloquee_depuis"] = None # N'est plus considérée comme bloquée, elle a maintenant un chemin
-             v["recalcul_echecs"] = 0 # Reset car un chemin viable a été trouvé
-             #print(f"V{v['id']}: Succès simple recalcul.")
-         else:
-             # Aucun chemin trouvé vers la destination actuelle
-             v["chemin"] = [] # Assurer que le chemin est vide pour indiquer pas de direction connue
-             # Si elle n'était pas déjà marquée bloquée, la marquer maintenant
-             if v.get("bloquee_depuis") is None:
-                  v["bloquee_depuis"] = temps_actuel
-             # Le compteur d'échecs sera incrémenté dans la phase suivante si nécessaire.
+    # Sélection vectorisée : actives sans chemin, ou bloquées depuis plus de SEUIL_BLOCAGE
+    # (les comparaisons avec NaN sont fausses, donc les non-bloquées sont bien exclues)
+    besoin_chemin = actives & (~a_chemin | ((temps_actuel - bloquee) > SEUIL_BLOCAGE))
+
+    # Grille d'occupation courante (positions des voitures actives) et index des piétons,
+    # construits ici pour la sonde locale puis réutilisés par la phase 2
+    occupe_actuel = np.zeros((taille_y, taille_x), dtype=bool)
+    positions_actives = positions[actives]
+    occupe_actuel[positions_actives[:, 1], positions_actives[:, 0]] = True
+    pietons_par_passage = construire_index_pietons(pietons)
+    # Grille des cases interdites (non-ROUTE, feu non vert, piéton en traversée),
+    # encodée une fois pour le tick : les tests de pas des phases 1 et 2 deviennent
+    # de simples lectures de tableau
+    cellule_bloquee = construire_grille_blocages(grille, pietons_par_passage)
+
+    # Sonde locale avant recherche complète : une voiture bloquée qui possède encore un
+    # chemin retente d'abord son prochain pas contre l'état courant (feu repassé au vert,
+    # piéton parti, case libérée). Si le pas est redevenu praticable, le chemin existant
+    # est conservé tel quel et la recherche est évitée ; la phase 2 tentera le mouvement.
+    for idx in np.flatnonzero(besoin_chemin & a_chemin):
+        v = voitures[idx]
+        prochain_pas = v.chemin[v.chemin_idx]
+        if not occupe_actuel[prochain_pas[1], prochain_pas[0]] and \
+           not cellule_bloquee[prochain_pas[1], prochain_pas[0]]:
+            besoin_chemin[idx] = False
+
+    # Regroupe les demandes par destination : un seul BFS inverse sert toutes les
+    # voitures qui visent la même case, au lieu d'un A* complet par voiture
+    demandes_par_destination: Dict[Tuple[int, int], List[int]] = {}
+    for idx in np.flatnonzero(besoin_chemin):
+        demandes_par_destination.setdefault(voitures[idx].destination, []).append(idx)
+
+    for destination, indices_demandes in demandes_par_destination.items():
+        if len(indices_demandes) > 1:
+            # Recherche groupée : le champ de distances est partagé entre les demandes
+            chemins_trouves = trouver_chemins_groupes(grille, [voitures[i].position for i in indices_demandes], destination, directions_lignes, colonnes_directions)
+        else:
+            seul_idx = indices_demandes[0]
+            chemins_trouves = [trouver_chemin(grille, voitures[seul_idx].position, destination, directions_lignes, colonnes_directions)]
+
+        for idx, path_trouve in zip(indices_demandes, chemins_trouves):
+            v = voitures[idx]
+            if path_trouve and len(path_trouve) > 1:
+                # Chemin trouvé, le définir et réinitialiser l'état bloqué
+                # Chemin stocké en tuple immuable + curseur : la consommation d'un pas est un
+                # simple incrément d'index au lieu d'un pop(0) en O(longueur du chemin)
+                v.chemin = tuple(path_trouve[1:]) # Chemin commence *après* la position actuelle
+                v.chemin_idx = 0
+                v.bloquee_depuis = None # N'est plus considérée comme bloquée, elle a maintenant un chemin
+                v.recalcul_echecs = 0 # Reset car un chemin viable a été trouvé
+                a_chemin[idx] = True
+                bloquee[idx] = np.nan
+                #print(f"V{v.id}: Succès simple recalcul.")
+            else:
+                # Aucun chemin trouvé vers la destination actuelle
+                v.chemin = () # Assurer que le chemin est vide pour indiquer pas de direction connue
+                v.chemin_idx = 0
+                a_chemin[idx] = False
+                # Si elle n'était pas déjà marquée bloquée, la marquer maintenant
+                if v.bloquee_depuis is None:
+                    v.bloquee_depuis = temps_actuel
+                    bloquee[idx] = temps_actuel
+                # Le compteur d'échecs sera incrémenté dans la phase suivante si nécessaire.
 
 
 
     # PHASE 2: Résolution des mouvements (Prévention des collisions car-to-car) et Application
-    # Construit l'ensemble des positions occupées *projetées* à la fin de ce tick.
-    # Commence par toutes les positions actuelles des voitures qui ne sont PAS en cours de disparition (elles pourraient potentiellement rester là si elles ne peuvent pas bouger).
-    projected_occupied_cells: Set[Tuple[int, int]] = {
-        tuple(v['position']) for v in voitures if v.get("temps_arrivee") is None # Only active cars participate in projected collision
-    }
+    # Grille booléenne des positions occupées *projetées* à la fin de ce tick : part de
+    # l'occupation courante (les voitures pourraient rester sur place si elles ne peuvent
+    # pas bouger) ; le test d'occupation est une lecture directe, sans hachage de tuple.
+    occupe_projete = occupe_actuel.copy()
 
     # Stocke les mouvements approuvés : car_id -> (new_x, new_y) tuple
     approved_moves: Dict[int, Tuple[int, int]] = {}
 
-    # Identifier les voitures éligibles pour un mouvement *potentielles* ce tick: non arrivées, avec chemin, délai respecté.
-    voitures_eligibles_pour_mouvement = [
-        v for v in voitures_en_route # Seules les voitures en route peuvent bouger
-        if v["chemin"] and (temps_actuel - v["dernier_deplacement"] >= DELAI_MIN_MOUVEMENT)
-    ]
+    # Éligibilité vectorisée : active, avec chemin, et délai minimum écoulé
+    eligibles = actives & a_chemin & ((temps_actuel - dernier_dep) >= DELAI_MIN_MOUVEMENT)
 
     # Prioriser les voitures récemment bloquées pour la résolution du mouvement (pour aider à "défiler" les queues)
-    # Une voiture est "priorisée" si elle était marquée `bloquee_depuis`.
-    prioritized_cars = [v for v in voitures_eligibles_pour_mouvement if v.get("bloquee_depuis") is not None]
-    remaining_cars = [v for v in voitures_eligibles_pour_mouvement if v.get("bloquee_depuis") is None]
-
-    # Tri ascendant par 'bloquee_depuis': les plus anciens timestamps (les plus bloqués) en premier
-    prioritized_cars.sort(key=lambda car: car["bloquee_depuis"])
+    # Une voiture est "priorisée" si elle était marquée `bloquee_depuis` (non-NaN dans le SoA).
+    # Tri ascendant par timestamp via argsort sur le tableau : les plus bloquées en premier,
+    # sans évaluation d'une clé lambda par dict.
+    est_bloquee = ~np.isnan(bloquee)
+    indices_prioritaires = np.flatnonzero(eligibles & est_bloquee)
+    indices_prioritaires = indices_prioritaires[np.argsort(bloquee[indices_prioritaires], kind="stable")]
     # Mélange le reste aléatoirement pour casser les égalités
+    remaining_cars = [voitures[idx] for idx in np.flatnonzero(eligibles & ~est_bloquee)]
     random.shuffle(remaining_cars)
 
     # Ordre de traitement: voitures prioritaires, puis le reste mélangé
-    voitures_a_resoudre_mouvement = prioritized_cars + remaining_cars
+    voitures_a_resoudre_mouvement = [voitures[idx] for idx in indices_prioritaires] + remaining_cars
 
 
     # Itère sur les voitures dans l'ordre de priorité pour tenter d'appliquer leur mouvement
     for v in voitures_a_resoudre_mouvement:
-        car_id = v["id"]
-        current_pos_t = tuple(v["position"])
+        car_id = v.id
+        current_pos_t = v.position
         # Le prochain pas désiré est la première case du chemin calculé
-        next_pos_t = tuple(v["chemin"][0]) # On sait qu'il y a un chemin, car elles sont "eligibles"
+        next_pos_t = v.chemin[v.chemin_idx] # On sait qu'il y a un chemin, car elles sont "eligibles"
 
         # Tente de se déplacer vers next_pos_t seulement si cette case projetée est libre
         # ET que le déplacement respecte les règles externes (feux, piétons).
         # On NE VERIFIE PAS ICI le type de cellule (ROUTE, obstacle, etc.) car cela a été fait par le pathfinding.
-        if next_pos_t not in projected_occupied_cells and \
-           est_deplacement_valide(next_pos_t, feux, pietons, grille): # La case cible est libre (proj.), non bloquée par feu/piéton...
+        if not occupe_projete[next_pos_t[1], next_pos_t[0]] and \
+           not cellule_bloquee[next_pos_t[1], next_pos_t[0]]: # La case cible est libre (proj.), non bloquée par feu/piéton...
 
             # --- MOUVEMENT APPROUVÉ pour V vers next_pos_t! ---
             # La voiture V quitte sa position actuelle current_pos_t et va vers next_pos_t.
             # Cette future position next_pos_t est maintenant réservée dans notre projection pour ce tick.
 
-            # Met à jour l'occupation projetée: V libère sa position actuelle et réserve sa future position.
-            # La suppression de current_pos_t est parfois inutile si elle n'y était pas,
-            # mais l'ajouter et retirer après garantit que SA nouvelle position bloque les autres.
-            # Meilleure approche : l'ajouter *après* qu'on sache qu'elle BOUGE vers elle.
-            # projected_occupied_cells.discard(current_pos_t) # Retiré car l'initialisation inclut déjà les positions courantes. On n'a besoin d'ajouter QUE les nouvelles.
-            # Add the *new* target position to the projected occupied cells.
-            projected_occupied_cells.add(next_pos_t) # C'est ICI qu'on marque la cellule ciblée comme occupée *pour le reste des voitures de ce tick*.
+            # Met à jour l'occupation projetée : la case ciblée est marquée occupée
+            # *pour le reste des voitures de ce tick*. La position actuelle reste marquée
+            # (comportement historique : une case libérée ce tick n'est pas réattribuée).
+            occupe_projete[next_pos_t[1], next_pos_t[0]] = True
 
             # Enregistre le mouvement approuvé pour application différée
             approved_moves[car_id] = next_pos_t
@@ -833,38 +1464,35 @@ def mettre_a_jour_voitures(voitures: List[Dict[str, Any]], grille: List[List[str
             # Remettre à zéro le marqueur de blocage si la voiture a pu bouger.
             # Ce marqueur était activé si la voiture n'avait pas bougé depuis SEUIL_BLOCAGE.
             # Maintenant qu'elle bouge, elle n'est plus "bloquée" par le système de détection de blocage passif.
-            v["bloquee_depuis"] = None # Une voiture qui bouge n'est plus considérée bloquée
+            v.bloquee_depuis = None # Une voiture qui bouge n'est plus considérée bloquée
 
 
     # PHASE 3: Application réelle des mouvements approuvés
     # Itère sur la liste principale des voitures et applique les mouvements qui ont été décidés dans la phase 3.
     for v in voitures:
-        car_id = v["id"]
+        car_id = v.id
         # Vérifie si un mouvement a été approuvé pour cette voiture
         if car_id in approved_moves:
-            old_pos = list(v["position"]) # Ancienne position (liste)
+            old_pos = v.position # Ancienne position (tuple)
             new_pos_t = approved_moves[car_id] # Nouvelle position (tuple)
-            new_pos_list = list(new_pos_t) # Convertir en liste
 
             # Mettre à jour l'orientation basée sur la direction du mouvement
+            # (consultation de la table figée ; les deltas inconnus, p.ex. diagonales
+            # si le pathfinding les autorisait un jour, conservent l'orientation courante)
             dx, dy = new_pos_t[0] - old_pos[0], new_pos_t[1] - old_pos[1]
-            if dx == 1 and dy == 0: v["orientation"] = 0 # Droite
-            elif dx == -1 and dy == 0: v["orientation"] = 180 # Gauche
-            elif dx == 0 and dy == 1: v["orientation"] = 270 # Bas
-            elif dx == 0 and dy == -1: v["orientation"] = 90  # Haut
-            # Gérer les diagonales si le pathfinding les autorisait
+            v.orientation = ORIENTATION_PAR_DELTA.get((dx, dy), v.orientation)
 
             # Appliquer la nouvelle position
-            v["position"] = new_pos_list
+            v.position = new_pos_t
 
-            # Supprimer le premier pas du chemin car il a été exécuté
-            # Cette vérification assure qu'on pop le bon élément, bien qu'avec la logique actuelle ça devrait toujours être v["chemin"][0].
-            if v["chemin"] and tuple(v["chemin"][0]) == new_pos_t:
-                 v["chemin"].pop(0)
+            # Avance le curseur de chemin car le pas a été exécuté (O(1), le tuple n'est
+            # jamais modifié). La vérification garde le comportement de l'ancien pop ciblé.
+            if v.chemin_idx < len(v.chemin) and v.chemin[v.chemin_idx] == new_pos_t:
+                 v.chemin_idx += 1
             #else: # Potential desync? Or the move was just one step and chemin is now empty.
 
             # Mettre à jour le timestamp du dernier déplacement réussi
-            v["dernier_deplacement"] = temps_actuel
+            v.dernier_deplacement = temps_actuel
 
             # 'bloquee_depuis' a déjà été reset en Phase 3 si le mouvement a été approuvé.
 
@@ -873,6 +1501,39 @@ def mettre_a_jour_voitures(voitures: List[Dict[str, Any]], grille: List[List[str
 
 # --- FONCTIONS DE GENERATION VOITURES ---
 
+##
+# @var _surfaces_voitures_colorees
+# @brief Réservoir des surfaces de voiture teintées, indexées par couleur quantifiée.
+# Chaque teinte demandait copie + surface masque + blend RGBA par apparition ; avec la
+# quantification, les voitures de teintes proches partagent la même surface pré-rendue.
+_surfaces_voitures_colorees: Dict[Tuple[int, int, int], Union[pygame.Surface, None]] = {}
+## @brief Pas de quantification des composantes RGB pour le réservoir de surfaces.
+_PAS_QUANTIFICATION_COULEUR = 16
+
+##
+# @brief Renvoie la surface de l'image de base teintée avec la couleur donnée (mise en cache).
+# @param img_base_voiture Image Pygame de base.
+# @param couleur Couleur (r, g, b) demandée.
+# @return Surface teintée partagée (ne pas modifier), ou None si la coloration échoue.
+def obtenir_surface_voiture_coloree(img_base_voiture: pygame.Surface, couleur: Tuple[int, int, int]) -> Union[pygame.Surface, None]:
+    pas = _PAS_QUANTIFICATION_COULEUR
+    cle = (couleur[0] // pas * pas, couleur[1] // pas * pas, couleur[2] // pas * pas)
+    if cle in _surfaces_voitures_colorees: # None (échec) est aussi mémorisé
+        return _surfaces_voitures_colorees[cle]
+    try:
+        surface = img_base_voiture.copy()
+        sombresseur_facteur = 0.8
+        mask = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        dark_color = (int(cle[0] * sombresseur_facteur), int(cle[1] * sombresseur_facteur), int(cle[2] * sombresseur_facteur), 255)
+        mask.fill(dark_color)
+        surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        surface = surface.convert_alpha() # Format d'affichage pour les blits par frame
+    except Exception as img_err:
+        print(f"Erreur coloration img voiture ({cle}): {img_err}. Utilisera un cercle.")
+        surface = None
+    _surfaces_voitures_colorees[cle] = surface
+    return surface
+
 ##
 # @brief Tente de générer une nouvelle voiture avec destination aléatoire valide et chemin atteignable.
 # Cette fonction est utilisée pour remplacer les voitures supprimées afin de maintenir un nombre cible.
@@ -885,32 +1546,29 @@ def mettre_a_jour_voitures(voitures: List[Dict[str, Any]], grille: List[List[str
 # @param img_base_voiture Image Pygame de base pour coloration (ou None).
 # @param voitures Liste des voitures actuelles (pour vérifier positions déjà occupées).
 # @return Un dictionnaire représentant la nouvelle voiture si succès, None sinon.
-def generer_une_nouvelle_voiture(taille_x: int, taille_y: int, feux: List[Dict[str, Any]], grille: List[List[str]], directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], img_base_voiture: Union[pygame.Surface, None], voitures: List[Dict[str, Any]]) -> Union[Dict[str, Any], None]:
+def generer_une_nouvelle_voiture(taille_x: int, taille_y: int, feux: List[Feu], grille: np.ndarray, directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], img_base_voiture: Union[pygame.Surface, None], voitures: List[Voiture]) -> Union[Voiture, None]:
     global prochain_id_voiture
     # Positions non routières, feux, ou obstacles permanents/initiaux sont interdits comme START ou END.
     # Les positions temporairement bloquées par des voitures actuelles doivent aussi être évitées comme START.
-    positions_interdites_perm = {feu["position"] for feu in feux}.union({
-         (x,y) for y in range(taille_y) for x in range(taille_x)
-         if grille[y][x] in SYMBOLES_NON_PRATICABLES
-    })
+    # Réservoir des cases valides d'office comme départ ou destination (ROUTE, escapable,
+    # hors feu/obstacle) ; seules les contraintes variables restent testées par tirage.
+    cellules_valides = obtenir_cellules_valides(grille, feux)
+    if not cellules_valides:
+        return None
     # Les positions *actuellement* occupées par des voitures actives
-    occupied_positions_by_cars: Set[Tuple[int, int]] = {tuple(v['position']) for v in voitures if v.get('temps_arrivee') is None}
+    occupied_positions_by_cars: Set[Tuple[int, int]] = {v.position for v in voitures if v.temps_arrivee is None}
 
     tentatives_start = 50 # Limite les tentatives pour trouver un point de départ viable
     tentatives_dest = 50 # Limite les tentatives pour trouver une destination viable DEPUIS ce point de départ
     total_attempts_pair = 1000 # Nombre max de paires start/dest candidates à tester en tout
 
     for _ in range(total_attempts_pair):
-        # Trouver un point de départ valide (ROUTE, libre, pas feu/obstacle, escapable)
+        # Trouver un point de départ valide (tirage direct dans le réservoir, il ne reste
+        # qu'à vérifier qu'aucune voiture active n'occupe la case)
         pos_initiale: Union[Tuple[int, int], None] = None
         for _ in range(tentatives_start):
-            x_pos, y_pos = random.randrange(taille_x), random.randrange(taille_y)
-            pos_candidate = (x_pos, y_pos)
-            if (0 <= y_pos < taille_y and 0 <= x_pos < taille_x) and \
-               grille[y_pos][x_pos] == ROUTE and \
-               pos_candidate not in positions_interdites_perm and \
-               pos_candidate not in occupied_positions_by_cars and \
-               est_case_escapable(pos_candidate, taille_x, taille_y, grille): # Escapable basé uniquement sur grille non bloquée permanemment
+            pos_candidate = random.choice(cellules_valides)
+            if pos_candidate not in occupied_positions_by_cars:
                pos_initiale = pos_candidate
                break # Trouvé un point de départ
 
@@ -921,15 +1579,10 @@ def generer_une_nouvelle_voiture(taille_x: int, taille_y: int, feux: List[Dict[s
         # Trouve une destination valide depuis ce point de départ
         dest: Union[Tuple[int, int], None] = None
         for _ in range(tentatives_dest):
-            x_dest, y_dest = random.randrange(taille_x), random.randrange(taille_y)
-            dest_candidate = (x_dest, y_dest)
-            if (0 <= y_dest < taille_y and 0 <= x_dest < taille_x) and \
-               grille[y_dest][x_dest] == ROUTE and \
-               dest_candidate != pos_initiale and \
-               dest_candidate not in positions_interdites_perm and \
-               est_case_escapable(dest_candidate, taille_x, taille_y, grille): # Escapable basé uniquement sur grille non bloquée permanemment
-                # Et surtout, doit être atteignable PAR PATHFINDING depuis pos_initiale
-                temp_path = trouver_chemin(grille, list(pos_initiale), list(dest_candidate), directions_lignes, colonnes_directions)
+            dest_candidate = random.choice(cellules_valides)
+            if dest_candidate != pos_initiale:
+                # La destination doit surtout être atteignable PAR PATHFINDING depuis pos_initiale
+                temp_path = trouver_chemin(grille, pos_initiale, dest_candidate, directions_lignes, colonnes_directions)
                 if temp_path and len(temp_path) > 1:
                     dest = dest_candidate
                     chemin_initial = temp_path # Garde le chemin trouvé
@@ -941,34 +1594,22 @@ def generer_une_nouvelle_voiture(taille_x: int, taille_y: int, feux: List[Dict[s
             prochain_id_voiture += 1
 
             voiture_couleur = (random.randint(0, 150), random.randint(0, 150), random.randint(100, 255)) # Une couleur distinctive
+            # Surface teintée tirée du réservoir partagé (pré-rendue à la première demande
+            # de cette teinte quantifiée) plutôt que copie + blend par apparition
             voiture_image_specifique = None
             if img_base_voiture:
-                try:
-                    voiture_image_specifique = img_base_voiture.copy()
-                    sombresseur_facteur = 0.8
-                    mask = pygame.Surface(voiture_image_specifique.get_size(), pygame.SRCALPHA)
-                    dark_color = (int(voiture_couleur[0]*sombresseur_facteur), int(voiture_couleur[1]*sombresseur_facteur), int(voiture_couleur[2]*sombresseur_facteur), 255)
-                    mask.fill(dark_color)
-                    voiture_image_specifique.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                except Exception as img_err:
-                    print(f"Erreur coloration img nouvelle voiture {nouvel_id}: {img_err}. Utilisera un cercle.")
-                    voiture_image_specifique = None
+                voiture_image_specifique = obtenir_surface_voiture_coloree(img_base_voiture, voiture_couleur)
 
             # Créer la nouvelle voiture
-            nouvelle_voiture = {
-                "id": nouvel_id,
-                "position": list(pos_initiale),
-                "destination": list(dest),
-                "chemin": chemin_initial[1:], # Le chemin commence par le prochain pas, pas la position actuelle
-                "temps_arrivee": None,
-                "dernier_deplacement": time.time(), # Initialisé maintenant, elle bougera après DELAI_MIN_MOUVEMENT
-                "couleur": voiture_couleur if voiture_image_specifique is None else None,
-                "image": voiture_image_specifique,
-                "orientation": 0, # Orientation initiale (peut être ajustée au 1er mouvement)
-                "bloquee_depuis": None,
-                "recalcul_echecs": 0
-            }
-            #print(f"Généré nouvelle voiture V{nouvel_id} de {pos_initiale} à {dest}. Chemin trouvé de {len(nouvelle_voiture['chemin']) + 1} pas.")
+            nouvelle_voiture = Voiture(
+                id_voiture=nouvel_id,
+                position=pos_initiale, # Tuple (x, y) immuable : comparaisons sans conversion
+                destination=dest,
+                chemin=tuple(chemin_initial[1:]), # Le chemin commence par le prochain pas, pas la position actuelle
+                couleur=voiture_couleur if voiture_image_specifique is None else None,
+                image=voiture_image_specifique
+            )
+            #print(f"Généré nouvelle voiture V{nouvel_id} de {pos_initiale} à {dest}. Chemin trouvé de {len(nouvelle_voiture.chemin) + 1} pas.")
             return nouvelle_voiture
         # else: Failed to find a reachable destination from this start pos. Loop continues to try a new start pos.
 
@@ -985,9 +1626,9 @@ def generer_une_nouvelle_voiture(taille_x: int, taille_y: int, feux: List[Dict[s
 # @param colonnes_directions Dict sens colonnes.
 # @param img_base_voiture Image Pygame de base (ou None).
 # @param n_voitures Nombre de voitures souhaité.
-# @return Liste des dictionnaires voiture générés.
-def generer_voitures_initiales(taille_x: int, taille_y: int, feux: List[Dict[str, Any]], grille: List[List[str]], directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], img_base_voiture: Union[pygame.Surface, None], n_voitures: int) -> List[Dict[str, Any]]:
-    initial_voitures: List[Dict[str, Any]] = []
+# @return Liste des voitures générées.
+def generer_voitures_initiales(taille_x: int, taille_y: int, feux: List[Feu], grille: np.ndarray, directions_lignes: Dict[int, str], colonnes_directions: Dict[int, str], img_base_voiture: Union[pygame.Surface, None], n_voitures: int) -> List[Voiture]:
+    initial_voitures: List[Voiture] = []
     max_total_generation_attempts = n_voitures * 2 # Tenter jusqu'à X fois le nombre cible
 
     attempt = 0
@@ -1011,12 +1652,16 @@ def generer_voitures_initiales(taille_x: int, taille_y: int, feux: List[Dict[str
 # @param fenetre Surface Pygame.
 # @param grille La grille.
 # @param taille_cellule Taille d'une cellule en pixels.
-def dessiner_fonds_cellules(fenetre: pygame.Surface, grille: List[List[str]], taille_cellule: int) -> None:
-    for y in range(len(grille)):
-        for x in range(len(grille[0])):
-            cell_rect = pygame.Rect(x * taille_cellule, y * taille_cellule, taille_cellule, taille_cellule)
-            couleur = GRIS_CLAIR if grille[y][x] == NON_ROUTIER else GRIS_ROUTE
-            pygame.draw.rect(fenetre, couleur, cell_rect)
+# @details Rasterisation vectorisée : un tableau RGB (une couleur par cellule) est étiré
+#          à la taille des pixels par np.repeat puis transféré en un seul passage via
+#          surfarray, au lieu d'un pygame.draw.rect par cellule (W·H appels Python).
+def dessiner_fonds_cellules(fenetre: pygame.Surface, grille: np.ndarray, taille_cellule: int) -> None:
+    couleurs = np.empty(grille.shape + (3,), dtype=np.uint8)
+    couleurs[:, :] = GRIS_ROUTE
+    couleurs[grille == NON_ROUTIER] = GRIS_CLAIR
+    # Étire chaque cellule à taille_cellule pixels ; surfarray attend l'axe X en premier
+    pixels = couleurs.repeat(taille_cellule, axis=0).repeat(taille_cellule, axis=1).swapaxes(0, 1)
+    fenetre.blit(pygame.surfarray.make_surface(pixels), (0, 0))
 
 ##
 # @brief Dessine les lignes de la grille (par-dessus les fonds).
@@ -1036,62 +1681,92 @@ def dessiner_grille_lignes(fenetre: pygame.Surface, largeur: int, hauteur: int,
 # @param fenetre Surface Pygame.
 # @param grille La grille.
 # @param taille_cellule Taille d'une cellule.
-def dessiner_obstacles_manuels(fenetre: pygame.Surface, grille: List[List[str]], taille_cellule: int) -> None:
-    for y in range(len(grille)):
-        for x in range(len(grille[0])):
-            if grille[y][x] == OBSTACLE_MANUEL:
-                pygame.draw.rect(fenetre, NOIR, (x * taille_cellule, y * taille_cellule, taille_cellule, taille_cellule))
+def dessiner_obstacles_manuels(fenetre: pygame.Surface, grille: np.ndarray, taille_cellule: int) -> None:
+    # Zone de découpe courante : les cases entièrement hors de cette zone sont écartées
+    # avant l'appel de dessin (rejet Python, moins cher qu'une traversée C pour rien)
+    clip = fenetre.get_clip()
+    # Repérage vectorisé : seules les cases concernées sont parcourues en Python
+    for y, x in np.argwhere(grille == OBSTACLE_MANUEL):
+        px, py = int(x) * taille_cellule, int(y) * taille_cellule
+        if px >= clip.right or py >= clip.bottom or px + taille_cellule <= clip.left or py + taille_cellule <= clip.top:
+            continue
+        pygame.draw.rect(fenetre, NOIR, (px, py, taille_cellule, taille_cellule))
 
 ##
 # @brief Dessine les obstacles AUTOMATIQUES ('A').
 # @param fenetre Surface Pygame.
 # @param grille La grille.
 # @param taille_cellule Taille d'une cellule.
-def dessiner_obstacles_automatiques(fenetre: pygame.Surface, grille: List[List[str]], taille_cellule: int) -> None:
+def dessiner_obstacles_automatiques(fenetre: pygame.Surface, grille: np.ndarray, taille_cellule: int) -> None:
     # Optionnel : Dessiner les obstacles automatiques différemment ou pas du tout
     # S'ils sont destinés à être des blocages "naturels" non visibles, ne les dessine pas.
     # S'ils représentent un événement (accident, travaux), on peut les dessiner.
     # Exemple : on ne les dessine pas, le fond GRIS_ROUTE reste visible, le blocage est purement logique.
     # Pour les rendre visibles, on peut faire :
-     for y in range(len(grille)):
-         for x in range(len(grille[0])):
-             if grille[y][x] == OBSTACLE_AUTO_SYM:
-                 # Exemple : un carré rouge/orange pour indiquer travaux ou accident
-                 pygame.draw.rect(fenetre, (255, 80, 0), (x * taille_cellule, y * taille_cellule, taille_cellule, taille_cellule), 2) # Bordure orange
-                 # Peut aussi ajouter une icône ou hachures
-                 pass # Ne dessine rien de visible par défaut, comme des ralentissements invisibles.
+     for y, x in np.argwhere(grille == OBSTACLE_AUTO_SYM): # Repérage vectorisé
+         # Exemple : un carré rouge/orange pour indiquer travaux ou accident
+         pygame.draw.rect(fenetre, (255, 80, 0), (int(x) * taille_cellule, int(y) * taille_cellule, taille_cellule, taille_cellule), 2) # Bordure orange
+         # Peut aussi ajouter une icône ou hachures
+         pass # Ne dessine rien de visible par défaut, comme des ralentissements invisibles.
      pass # Pas de dessin visible pour OBSTACLE_AUTO_SYM par défaut. Ils sont des blocages logiques.
 
 
 ##
-# @brief Dessine les feux de circulation.
+# @var _sprites_feux
+# @brief Sprites de feu pré-rendus, indexés par code d'état (FEU_VERT/ORANGE/ROUGE),
+# par taille de cellule. La géométrie des trois lampes est identique pour tous les feux :
+# la rasteriser une fois par état remplace six pygame.draw.circle par feu et par frame.
+_sprites_feux: Dict[int, List[pygame.Surface]] = {}
+
+##
+# @brief Pré-rend les trois sprites de feu (un par état) pour une taille de cellule donnée.
+# @param taille_cellule Taille d'une cellule en pixels.
+# @return Liste de surfaces SRCALPHA indexée par code d'état.
+def _construire_sprites_feux(taille_cellule: int) -> List[pygame.Surface]:
+    rayon = max(3, taille_cellule // 8)
+    espacement_vertical = int(rayon * 2.2)
+    epaisseur_contour = 1
+    couleur_inactive = GRIS_FONCE
+    largeur = 2 * rayon + 2
+    hauteur = 2 * (espacement_vertical + rayon) + 2
+    cx, cy = largeur // 2, hauteur // 2
+    centre_r, centre_o, centre_v = (cx, cy - espacement_vertical), (cx, cy), (cx, cy + espacement_vertical)
+
+    sprites: List[pygame.Surface] = []
+    for etat in (FEU_VERT, FEU_ORANGE, FEU_ROUGE): # L'ordre suit les codes d'état (0, 1, 2)
+        sprite = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, ROUGE if etat == FEU_ROUGE else couleur_inactive, centre_r, rayon)
+        pygame.draw.circle(sprite, ORANGE if etat == FEU_ORANGE else couleur_inactive, centre_o, rayon)
+        pygame.draw.circle(sprite, VERT if etat == FEU_VERT else couleur_inactive, centre_v, rayon)
+        if epaisseur_contour > 0:
+            pygame.draw.circle(sprite, NOIR, centre_r, rayon, epaisseur_contour)
+            pygame.draw.circle(sprite, NOIR, centre_o, rayon, epaisseur_contour)
+            pygame.draw.circle(sprite, NOIR, centre_v, rayon, epaisseur_contour)
+        sprites.append(sprite)
+    return sprites
+
+##
+# @brief Dessine les feux de circulation (un blit du sprite pré-rendu de l'état courant).
 # @param fenetre Surface Pygame.
 # @param feux Liste des feux.
 # @param taille_cellule Taille d'une cellule.
-def dessiner_feux(fenetre: pygame.Surface, feux: List[Dict[str, Any]], taille_cellule: int) -> None:
+def dessiner_feux(fenetre: pygame.Surface, feux: List[Feu], taille_cellule: int) -> None:
+    sprites = _sprites_feux.get(taille_cellule)
+    if sprites is None:
+        sprites = _construire_sprites_feux(taille_cellule)
+        _sprites_feux[taille_cellule] = sprites
+
+    dc = taille_cellule // 2
+    # Limites de la fenêtre (avec une cellule de marge) pour écarter les dessins hors écran
+    limite_x_px, limite_y_px = fenetre.get_width() + taille_cellule, fenetre.get_height() + taille_cellule
     for feu in feux:
-        x, y = feu["position"]
-        dc = taille_cellule // 2
-        cx = x * taille_cellule + dc
-        cy = y * taille_cellule + dc
-        rayon = max(3, taille_cellule // 8)
-        espacement_vertical = int(rayon * 2.2)
-        epaisseur_contour = 1
-        etat_actuel = feu["etat"]
-        couleur_inactive = GRIS_FONCE
-        couleur_r = ROUGE if etat_actuel == "rouge" else couleur_inactive
-        couleur_o = ORANGE if etat_actuel == "orange" else couleur_inactive
-        couleur_v = VERT if etat_actuel == "vert" else couleur_inactive
-        centre_r, centre_o, centre_v = (cx, cy - espacement_vertical), (cx, cy), (cx, cy + espacement_vertical)
-
-        pygame.draw.circle(fenetre, couleur_r, centre_r, rayon)
-        pygame.draw.circle(fenetre, couleur_o, centre_o, rayon)
-        pygame.draw.circle(fenetre, couleur_v, centre_v, rayon)
-
-        if epaisseur_contour > 0:
-            pygame.draw.circle(fenetre, NOIR, centre_r, rayon, epaisseur_contour)
-            pygame.draw.circle(fenetre, NOIR, centre_o, rayon, epaisseur_contour)
-            pygame.draw.circle(fenetre, NOIR, centre_v, rayon, epaisseur_contour)
+        x, y = feu.position
+        if not (-taille_cellule <= x * taille_cellule <= limite_x_px and -taille_cellule <= y * taille_cellule <= limite_y_px):
+            continue
+        sprite = sprites[feu_etat[feu.index]]
+        # Centre du sprite aligné sur le centre de la cellule
+        fenetre.blit(sprite, (x * taille_cellule + dc - sprite.get_width() // 2,
+                              y * taille_cellule + dc - sprite.get_height() // 2))
 
 ##
 # @brief Dessine les indicateurs de sens de circulation sur les bords de la grille.
@@ -1102,41 +1777,85 @@ def dessiner_feux(fenetre: pygame.Surface, feux: List[Dict[str, Any]], taille_ce
 # @param taille_y Hauteur grille.
 # @param taille_cellule Taille cellule.
 def dessiner_directions(fenetre: pygame.Surface, directions_lignes: Dict[int, str], directions_colonnes: Dict[int, str], taille_x: int, taille_y: int, taille_cellule: int) -> None:
-    taille_fleche = taille_cellule * 0.3
+    # Constantes de géométrie, toutes entières et calculées une fois hors des boucles
+    # (la demi-flèche flottante propageait des floats dans tous les points des polygones)
+    taille_fleche = int(taille_cellule * 0.3)
+    demi_fleche = taille_fleche // 2
     decalage_centre = taille_cellule // 2
     couleur_fleche = NOIR
     epaisseur = 2
     taille_pointe, largeur_pointe = 6, 4
+    bord_droit_px = (taille_x - 1) * taille_cellule # Bord droit de la grille (colonne la plus à droite)
+    bord_bas_px = (taille_y - 1) * taille_cellule # Bord bas de la grille (ligne la plus basse)
+
+    # Indices des lignes/colonnes contenant au moins une route, calculés vectoriellement
+    # en une passe au lieu d'un balayage Python O(taille) par flèche.
+    est_route = grille != NON_ROUTIER
+    lignes_avec_route = set(np.flatnonzero(est_route.any(axis=1)))
+    colonnes_avec_route = set(np.flatnonzero(est_route.any(axis=0)))
 
     # Lignes
     for y, direction in directions_lignes.items():
-        if any(grille[y][x] != NON_ROUTIER for x in range(taille_x)): # Dessine si la ligne contient une route
+        if y in lignes_avec_route: # Dessine si la ligne contient une route
             cy = y * taille_cellule + decalage_centre
             if direction == "droite":
                 cx_depart = 0 # Bord gauche de la grille
-                sp, ep = (cx_depart + decalage_centre - taille_fleche / 2, cy), (cx_depart + decalage_centre + taille_fleche / 2, cy)
+                sp, ep = (cx_depart + decalage_centre - demi_fleche, cy), (cx_depart + decalage_centre + demi_fleche, cy)
                 pygame.draw.line(fenetre, couleur_fleche, sp, ep, epaisseur)
                 pygame.draw.polygon(fenetre, couleur_fleche, [(ep), (ep[0] - taille_pointe, ep[1] - largeur_pointe), (ep[0] - taille_pointe, ep[1] + largeur_pointe)])
             elif direction == "gauche":
-                cx_depart = (taille_x - 1) * taille_cellule # Bord droit de la grille
-                sp, ep = (cx_depart + decalage_centre + taille_fleche / 2, cy), (cx_depart + decalage_centre - taille_fleche / 2, cy)
+                cx_depart = bord_droit_px # Bord droit de la grille
+                sp, ep = (cx_depart + decalage_centre + demi_fleche, cy), (cx_depart + decalage_centre - demi_fleche, cy)
                 pygame.draw.line(fenetre, couleur_fleche, sp, ep, epaisseur)
                 pygame.draw.polygon(fenetre, couleur_fleche, [(ep), (ep[0] + taille_pointe, ep[1] - largeur_pointe), (ep[0] + taille_pointe, ep[1] + largeur_pointe)])
     # Colonnes
     for x, direction in directions_colonnes.items():
-         if any(grille[y][x] != NON_ROUTIER for y in range(taille_y)): # Dessine si la colonne contient une route
+         if x in colonnes_avec_route: # Dessine si la colonne contient une route
             cx = x * taille_cellule + decalage_centre
             if direction == "bas":
                 cy_depart = 0 # Bord haut de la grille
-                sp, ep = (cx, cy_depart + decalage_centre - taille_fleche / 2), (cx, cy_depart + decalage_centre + taille_fleche / 2)
+                sp, ep = (cx, cy_depart + decalage_centre - demi_fleche), (cx, cy_depart + decalage_centre + demi_fleche)
                 pygame.draw.line(fenetre, couleur_fleche, sp, ep, epaisseur)
                 pygame.draw.polygon(fenetre, couleur_fleche, [(ep), (ep[0] - largeur_pointe, ep[1] - taille_pointe), (ep[0] + largeur_pointe, ep[1] - taille_pointe)])
             elif direction == "haut":
-                cy_depart = (taille_y - 1) * taille_cellule # Bord bas de la grille
-                sp, ep = (cx, cy_depart + decalage_centre + taille_fleche / 2), (cx, cy_depart + decalage_centre - taille_fleche / 2)
+                cy_depart = bord_bas_px # Bord bas de la grille
+                sp, ep = (cx, cy_depart + decalage_centre + demi_fleche), (cx, cy_depart + decalage_centre - demi_fleche)
                 pygame.draw.line(fenetre, couleur_fleche, sp, ep, epaisseur)
                 pygame.draw.polygon(fenetre, couleur_fleche, [(ep), (ep[0] - largeur_pointe, ep[1] + taille_pointe), (ep[0] + largeur_pointe, ep[1] + taille_pointe)])
 
+##
+# @var _sprites_passages
+# @brief Réservoir des surfaces de zébrures pré-rendues, indexées par (taille, orientation, couleur, largeur).
+# @details Les passages sont statiques : les boucles de tirets n'ont besoin de tourner
+# qu'une fois par orientation, puis chaque passage n'est plus qu'un simple blit.
+_sprites_passages: Dict[Tuple[int, str, Tuple[int, int, int], int], pygame.Surface] = {}
+
+##
+# @brief Construit la surface de zébrures d'une cellule de passage piéton.
+# @param taille_cellule Taille cellule.
+# @param orientation 'horizontal' ou 'vertical'.
+# @param couleur Couleur des zébrures.
+# @param largeur_zebre Epaisseur des zébrures.
+# @return Surface SRCALPHA de la taille d'une cellule contenant les zébrures.
+def _construire_sprite_passage(taille_cellule: int, orientation: str, couleur: Tuple[int, int, int], largeur_zebre: int) -> pygame.Surface:
+    sprite = pygame.Surface((taille_cellule, taille_cellule), pygame.SRCALPHA)
+    marge = taille_cellule // 6
+
+    if orientation == 'horizontal':
+        y_debut, y_fin = marge, taille_cellule - marge
+        x_courant = marge
+        while x_courant < taille_cellule - marge:
+            pygame.draw.line(sprite, couleur, (x_courant, y_debut), (x_courant, y_fin), largeur_zebre)
+            x_courant += largeur_zebre * 2
+    else: # Vertical
+        x_debut, x_fin = marge, taille_cellule - marge
+        y_courant = marge
+        while y_courant < taille_cellule - marge:
+            pygame.draw.line(sprite, couleur, (x_debut, y_courant), (x_fin, y_courant), largeur_zebre)
+            y_courant += largeur_zebre * 2
+
+    return sprite
+
 ##
 # @brief Dessine les passages piétons.
 # @param fenetre Surface Pygame.
@@ -1145,40 +1864,100 @@ def dessiner_directions(fenetre: pygame.Surface, directions_lignes: Dict[int, st
 # @param couleur Couleur des zébrures.
 # @param largeur_zebre Epaisseur des zébrures.
 def dessiner_passages_pietons(fenetre: pygame.Surface, passages: List[Dict[str, Any]], taille_cellule: int, couleur: Tuple[int, int, int], largeur_zebre: int=5) -> None:
-    marge = taille_cellule // 6
     for passage in passages:
         x_cell, y_cell = passage['position']
         orientation = passage['orientation']
-        cell_rect = pygame.Rect(x_cell * taille_cellule, y_cell * taille_cellule, taille_cellule, taille_cellule)
 
-        if orientation == 'horizontal':
-            y_debut, y_fin = cell_rect.top + marge, cell_rect.bottom - marge
-            x_courant = cell_rect.left + marge
-            while x_courant < cell_rect.right - marge:
-                 pygame.draw.line(fenetre, couleur, (x_courant, y_debut), (x_courant, y_fin), largeur_zebre)
-                 x_courant += largeur_zebre * 2
-        else: # Vertical
-             x_debut, x_fin = cell_rect.left + marge, cell_rect.right - marge
-             y_courant = cell_rect.top + marge
-             while y_courant < cell_rect.bottom - marge:
-                 pygame.draw.line(fenetre, couleur, (x_debut, y_courant), (x_fin, y_courant), largeur_zebre)
-                 y_courant += largeur_zebre * 2
+        cle = (taille_cellule, orientation, couleur, largeur_zebre)
+        sprite = _sprites_passages.get(cle)
+        if sprite is None:
+            sprite = _construire_sprite_passage(taille_cellule, orientation, couleur, largeur_zebre)
+            _sprites_passages[cle] = sprite
+
+        fenetre.blit(sprite, (x_cell * taille_cellule, y_cell * taille_cellule))
 
 ##
-# @brief Dessine les piétons actifs.
-# @param fenetre Surface Pygame.
-# @param pietons Liste des piétons actifs.
+# @var _sprites_pietons
+# @brief Réservoir des bonshommes allumette pré-rendus, indexés par (taille, couleur, épaisseur).
+# @details La silhouette ne dépend que de la taille de cellule, de la couleur et de
+# l'épaisseur des traits : pré-rendue une fois, chaque piéton ne coûte plus qu'un blit
+# au lieu d'un cercle et trois tracés de lignes par frame.
+# La valeur mémorisée est (surface, ancre_x, ancre_y) : l'ancre est la position du
+# centre de la silhouette dans la surface.
+_sprites_pietons: Dict[Tuple[int, Tuple[int, int, int], int], Tuple[pygame.Surface, int, int]] = {}
+
+##
+# @brief Construit le sprite du bonhomme allumette (tête, torse, bras, jambes).
 # @param taille_cellule Taille cellule.
 # @param couleur Couleur du bonhomme.
 # @param epaisseur_ligne Epaisseur des traits.
-def dessiner_pietons(fenetre: pygame.Surface, pietons: List[Dict[str, Any]], taille_cellule: int, couleur: Tuple[int, int, int], epaisseur_ligne: int=2) -> None:
-    demi_cellule_px = taille_cellule // 2
+# @return Tuple (surface SRCALPHA, ancre_x, ancre_y) où l'ancre est le centre de la silhouette.
+def _construire_sprite_pieton(taille_cellule: int, couleur: Tuple[int, int, int], epaisseur_ligne: int) -> Tuple[pygame.Surface, int, int]:
     # Ratios pour dessiner un bonhomme allumette simple
     head_radius_ratio, torso_height_ratio, limb_length_ratio = 0.10, 0.25, 0.20
     head_radius = max(2, int(taille_cellule * head_radius_ratio))
     torso_dy = max(3, int(taille_cellule * torso_height_ratio))
     limb_len = max(3, int(taille_cellule * limb_length_ratio))
 
+    # Encombrement de la silhouette autour de son centre (marge pour l'épaisseur des traits)
+    arm_angle_offset_x = int(limb_len * 0.7)
+    leg_angle_offset_x = int(limb_len * 0.5)
+    demi_largeur = max(head_radius, arm_angle_offset_x, leg_angle_offset_x) + epaisseur_ligne
+    hauteur_haut = (torso_dy // 2) + 2 * head_radius + epaisseur_ligne # Du centre au sommet de la tête
+    hauteur_bas = (torso_dy // 2) + limb_len + epaisseur_ligne # Du centre au bout des jambes
+
+    sprite = pygame.Surface((2 * demi_largeur + 1, hauteur_haut + hauteur_bas + 1), pygame.SRCALPHA)
+    center_x, center_y = demi_largeur, hauteur_haut # Ancre : centre de la silhouette
+
+    # Calcul des points pour dessiner le bonhomme allumette relatif à center_x, center_y
+    head_center_y = center_y - (torso_dy // 2) - head_radius
+    head_pos = (center_x, head_center_y)
+    torso_top_y = center_y - (torso_dy // 2)
+    torso_bottom_y = center_y + (torso_dy // 2)
+    torso_start, torso_end = (center_x, torso_top_y), (center_x, torso_bottom_y)
+    shoulder_y = torso_top_y + int(torso_dy * 0.1)
+    shoulder_point = (center_x, shoulder_y)
+    hip_point = torso_end
+    arm_end_y = shoulder_y + int(limb_len * 0.7)
+    left_arm_end, right_arm_end = (center_x - arm_angle_offset_x, arm_end_y), (center_x + arm_angle_offset_x, arm_end_y)
+    leg_end_y = torso_bottom_y + limb_len
+    left_leg_end, right_leg_end = (center_x - leg_angle_offset_x, leg_end_y), (center_x + leg_angle_offset_x, leg_end_y)
+
+    # Dessin du bonhomme. Les deux bras (resp. les deux jambes) partagent leur point
+    # d'attache : chaque paire se dessine en une seule polyligne au lieu de deux traits.
+    pygame.draw.circle(sprite, couleur, head_pos, head_radius)
+    pygame.draw.line(sprite, couleur, torso_start, torso_end, epaisseur_ligne)
+    pygame.draw.lines(sprite, couleur, False, [left_arm_end, shoulder_point, right_arm_end], epaisseur_ligne)
+    pygame.draw.lines(sprite, couleur, False, [left_leg_end, hip_point, right_leg_end], epaisseur_ligne)
+
+    return sprite, center_x, center_y
+
+##
+# @brief Dessine les piétons actifs.
+# @param fenetre Surface Pygame.
+# @param pietons Liste des piétons actifs.
+# @param taille_cellule Taille cellule.
+# @param couleur Couleur du bonhomme.
+# @param epaisseur_ligne Epaisseur des traits.
+def dessiner_pietons(fenetre: pygame.Surface, pietons: List[Dict[str, Any]], taille_cellule: int, couleur: Tuple[int, int, int], epaisseur_ligne: int=2) -> None:
+    demi_cellule_px = taille_cellule // 2
+    # Rayon de tête utilisé aussi pour les marges de progression le long du passage
+    head_radius = max(2, int(taille_cellule * 0.10))
+
+    # Sprite partagé du bonhomme allumette (pré-rendu à la première demande)
+    cle = (taille_cellule, couleur, epaisseur_ligne)
+    entree = _sprites_pietons.get(cle)
+    if entree is None:
+        entree = _construire_sprite_pieton(taille_cellule, couleur, epaisseur_ligne)
+        _sprites_pietons[cle] = entree
+    sprite, ancre_x, ancre_y = entree
+
+    # Limites de la fenêtre (avec une cellule de marge) pour écarter les dessins hors écran
+    limite_x_px, limite_y_px = fenetre.get_width() + taille_cellule, fenetre.get_height() + taille_cellule
+
+    # Lot de blits accumulé puis soumis en un seul appel C (Surface.blits)
+    sequence_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
     for pieton in pietons:
         x_cell, y_cell = pieton['passage_pos']
         orientation, progres = pieton['orientation'], pieton['progres']
@@ -1207,30 +1986,98 @@ def dessiner_pietons(fenetre: pygame.Surface, pietons: List[Dict[str, Any]], tai
         # Position de dessin (au centre de la silhouette du bonhomme)
         center_x, center_y = int(px), int(py)
 
-        # Calcul des points pour dessiner le bonhomme allumette relatif à center_x, center_y
-        head_center_y = center_y - (torso_dy // 2) - head_radius
-        head_pos = (center_x, head_center_y)
-        torso_top_y = center_y - (torso_dy // 2)
-        torso_bottom_y = center_y + (torso_dy // 2)
-        torso_start, torso_end = (center_x, torso_top_y), (center_x, torso_bottom_y)
-        shoulder_y = torso_top_y + int(torso_dy * 0.1)
-        shoulder_point = (center_x, shoulder_y)
-        hip_point = torso_end
-        arm_angle_offset_x = int(limb_len * 0.7)
-        arm_end_y = shoulder_y + int(limb_len * 0.7)
-        left_arm_end, right_arm_end = (center_x - arm_angle_offset_x, arm_end_y), (center_x + arm_angle_offset_x, arm_end_y)
-        leg_angle_offset_x = int(limb_len * 0.5)
-        leg_end_y = torso_bottom_y + limb_len
-        left_leg_end, right_leg_end = (center_x - leg_angle_offset_x, leg_end_y), (center_x + leg_angle_offset_x, leg_end_y)
-
-        # Dessin du bonhomme
-        pygame.draw.circle(fenetre, couleur, head_pos, head_radius)
-        pygame.draw.line(fenetre, couleur, torso_start, torso_end, epaisseur_ligne)
-        pygame.draw.line(fenetre, couleur, shoulder_point, left_arm_end, epaisseur_ligne)
-        pygame.draw.line(fenetre, couleur, shoulder_point, right_arm_end, epaisseur_ligne)
-        pygame.draw.line(fenetre, couleur, hip_point, left_leg_end, epaisseur_ligne)
-        pygame.draw.line(fenetre, couleur, hip_point, right_leg_end, epaisseur_ligne)
+        # Ecarte d'emblée les piétons hors de la zone visible de la fenêtre
+        if not (-taille_cellule <= center_x <= limite_x_px and -taille_cellule <= center_y <= limite_y_px):
+            continue
 
+        # Un seul blit du sprite pré-rendu, ancré sur le centre de la silhouette
+        sequence_blits.append((sprite, (center_x - ancre_x, center_y - ancre_y)))
+
+    if sequence_blits:
+        fenetre.blits(sequence_blits, doreturn=False)
+
+
+##
+# @var _sprites_cercles
+# @brief Réservoir des disques pré-rendus, indexés par (rayon, couleur).
+# @details pygame.draw.circle re-rasterise le disque à chaque appel ; pour les cercles
+# de secours des voitures et les têtes de piétons (rayons et couleurs fixes), un blit
+# d'une surface partagée suffit.
+_sprites_cercles: Dict[Tuple[int, Tuple[int, int, int]], pygame.Surface] = {}
+
+##
+# @brief Renvoie un disque plein pré-rendu du rayon et de la couleur donnés (mis en cache).
+# @param rayon Rayon du disque en pixels.
+# @param couleur Couleur (r, g, b) du disque.
+# @return Surface SRCALPHA partagée (ne pas modifier), à blitter par son coin (centre - rayon).
+def obtenir_sprite_cercle(rayon: int, couleur: Tuple[int, int, int]) -> pygame.Surface:
+    cle = (rayon, couleur)
+    sprite = _sprites_cercles.get(cle)
+    if sprite is None:
+        sprite = pygame.Surface((2 * rayon + 1, 2 * rayon + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, couleur, (rayon, rayon), rayon)
+        _sprites_cercles[cle] = sprite
+    return sprite
+
+##
+# @var _surfaces_voitures_rotatees
+# @brief Réservoir des surfaces de voiture rotatées, indexées par (id(surface), angle).
+# @details pygame.transform.rotate recalcule la surface pixel par pixel à chaque appel ;
+# comme les orientations sont discrètes (0/90/180/270), quelques entrées par surface
+# teintée suffisent pour éviter la rotation à chaque frame pour chaque voiture.
+_surfaces_voitures_rotatees: Dict[Tuple[int, int], pygame.Surface] = {}
+
+##
+# @brief Renvoie la surface donnée tournée à l'angle demandé (mise en cache).
+# @param surface Surface de voiture (déjà teintée et redimensionnée).
+# @param angle Angle de rotation en degrés (valeurs discrètes attendues).
+# @return Surface rotatée partagée (ne pas modifier).
+def obtenir_surface_voiture_rotatee(surface: pygame.Surface, angle: int) -> pygame.Surface:
+    cle = (id(surface), angle)
+    surface_rotatee = _surfaces_voitures_rotatees.get(cle)
+    if surface_rotatee is None:
+        # convert_alpha : la surface mise en cache est au format d'affichage, chaque
+        # blit ultérieur évite une conversion de pixels à la volée
+        surface_rotatee = pygame.transform.rotate(surface, angle).convert_alpha()
+        _surfaces_voitures_rotatees[cle] = surface_rotatee
+    return surface_rotatee
+
+##
+# @var _font_id
+# @brief Police partagée pour l'affichage des IDs (construite paresseusement).
+# @details pygame.font.Font analyse le fichier de police et alloue un objet SDL_ttf ;
+# la construire à chaque frame dans les fonctions de dessin était du gaspillage pur.
+_font_id: Union[pygame.font.Font, None] = None
+
+##
+# @brief Renvoie la police partagée pour les IDs (taille 16), construite au premier appel.
+# @return Police Pygame partagée.
+def obtenir_font_id() -> pygame.font.Font:
+    global _font_id
+    if _font_id is None:
+        _font_id = pygame.font.Font(None, 16)
+    return _font_id
+
+##
+# @var _surfaces_texte_id
+# @brief Réservoir des surfaces de texte des IDs de voiture, indexées par (id, couleur).
+# @details font.render est l'une des opérations Pygame les plus coûteuses ; les IDs
+# sont de petits entiers et les couleurs fixes, donc le réservoir reste minuscule.
+_surfaces_texte_id: Dict[Tuple[int, Tuple[int, int, int]], pygame.Surface] = {}
+
+##
+# @brief Renvoie la surface de texte rendue pour l'ID de voiture donné (mise en cache).
+# @param font Police Pygame utilisée pour le rendu en cas d'absence du cache.
+# @param voiture_id Identifiant entier de la voiture.
+# @param couleur Couleur (r, g, b) du texte.
+# @return Surface de texte partagée (ne pas modifier).
+def obtenir_surface_texte_id(font: pygame.font.Font, voiture_id: int, couleur: Tuple[int, int, int]) -> pygame.Surface:
+    cle = (voiture_id, couleur)
+    surface_texte = _surfaces_texte_id.get(cle)
+    if surface_texte is None:
+        surface_texte = font.render(str(voiture_id), True, couleur)
+        _surfaces_texte_id[cle] = surface_texte
+    return surface_texte
 
 ##
 # @brief Dessine les voitures (image ou cercle).
@@ -1238,9 +2085,9 @@ def dessiner_pietons(fenetre: pygame.Surface, pietons: List[Dict[str, Any]], tai
 # @param fenetre Surface Pygame.
 # @param voitures Liste des voitures (inclut actives et en disparition).
 # @param taille_cellule Taille cellule.
-def dessiner_voitures(fenetre: pygame.Surface, voitures: List[Dict[str, Any]], taille_cellule: int) -> None:
-    temps_actuel = time.time() # Temps actuel pour gérer le délai de disparition
-    font_pour_id = pygame.font.Font(None, 16) # Police pour afficher l'ID
+# @param temps_actuel Horloge du tick (partagée avec les mises à jour) pour gérer le délai de disparition.
+def dessiner_voitures(fenetre: pygame.Surface, voitures: List[Voiture], taille_cellule: int, temps_actuel: float) -> None:
+    font_pour_id = obtenir_font_id() # Police partagée pour afficher l'ID
 
     # Couleurs pour l'ID de la voiture, contrastées selon le fond probable (image colorée ou cercle)
     couleur_texte_sur_image = BLANC # Utile si l'image colorée est foncée
@@ -1249,58 +2096,101 @@ def dessiner_voitures(fenetre: pygame.Surface, voitures: List[Dict[str, Any]], t
     # Décalage pour centrer l'objet voiture/cercle dans sa cellule
     centre_cellule_decalage = taille_cellule // 2
 
+    # Limites de la fenêtre (avec une cellule de marge) pour écarter les dessins hors écran
+    limite_x_px, limite_y_px = fenetre.get_width() + taille_cellule, fenetre.get_height() + taille_cellule
+
     # Angle par défaut quand une voiture est considérée comme "garée" (atteint sa destination finale et commence sa phase de disparition)
     ANGLE_GAREE = 90 # Orienter la voiture vers le "haut" (Nord, ou face à la zone non routière derrière la place de parking)
 
+    # Lot de blits (voiture puis son ID, dans l'ordre de superposition) soumis en un
+    # seul appel C (Surface.blits) plutôt qu'un aller-retour Python/C par surface
+    sequence_blits: List[Tuple[pygame.Surface, Any]] = []
+
     # Itère sur TOUTES les voitures dans la liste, y compris celles en phase de disparition.
     for voiture in voitures:
         # Condition pour dessiner la voiture : soit elle est encore en route, soit elle est arrivée
         # et le temps écoulé depuis son arrivée est inférieur au délai de disparition.
-        est_active = voiture.get("temps_arrivee") is None # Est active si temps_arrivee est None
-        est_en_disparition = voiture.get("temps_arrivee") is not None and (temps_actuel - voiture["temps_arrivee"] < DELAI_DISPARITION_APRES_ARRIVEE)
+        est_active = voiture.temps_arrivee is None # Est active si temps_arrivee est None
+        est_en_disparition = voiture.temps_arrivee is not None and (temps_actuel - voiture.temps_arrivee < DELAI_DISPARITION_APRES_ARRIVEE)
 
         if est_active or est_en_disparition:
-            # Récupère la position [x, y] de la voiture dans la grille
-            x_grid, y_grid = voiture["position"]
-
-            # Calcule les coordonnées centrales en pixels pour le dessin dans la cellule
-            centre_x_px = x_grid * taille_cellule + centre_cellule_decalage
-            centre_y_px = y_grid * taille_cellule + centre_cellule_decalage
+            # Récupère la position (x, y) de la voiture dans la grille
+            position = voiture.position
+
+            # Coordonnées centrales en pixels, recalculées uniquement quand la voiture a bougé
+            # depuis le dernier frame (une voiture passe plusieurs frames par cellule).
+            if voiture.position_dessinee != position:
+                x_grid, y_grid = position
+                voiture.centre_px = (x_grid * taille_cellule + centre_cellule_decalage,
+                                        y_grid * taille_cellule + centre_cellule_decalage)
+                voiture.position_dessinee = position
+            centre_x_px, centre_y_px = voiture.centre_px
+
+            # Ecarte d'emblée les voitures hors de la zone visible de la fenêtre
+            if not (-taille_cellule <= centre_x_px <= limite_x_px and -taille_cellule <= centre_y_px <= limite_y_px):
+                continue
 
             # Essaie d'utiliser l'image de voiture spécifique à cette voiture (déjà colorée et redimensionnée)
-            image_specifique_voiture = voiture.get("image")
+            image_specifique_voiture = voiture.image
 
             if image_specifique_voiture:
                 # --- Dessine l'image de la voiture ---
                 # Détermine l'angle d'orientation. Utilise l'angle de mouvement habituel,
                 # mais passe à l'angle "garée" si elle est arrivée et à sa destination finale.
-                angle_final_rotation = ANGLE_GAREE if voiture.get("temps_arrivee") is not None and tuple(voiture["position"]) == tuple(voiture["destination"]) else voiture.get("orientation", 0)
+                angle_final_rotation = ANGLE_GAREE if voiture.temps_arrivee is not None and voiture.position == voiture.destination else voiture.orientation
 
-                # Fait tourner l'image à l'angle souhaité
-                image_rotatee = pygame.transform.rotate(image_specifique_voiture, angle_final_rotation)
+                # Fait tourner l'image à l'angle souhaité (surface partagée via le cache de rotations)
+                image_rotatee = obtenir_surface_voiture_rotatee(image_specifique_voiture, angle_final_rotation)
                 # Obtient le rectangle de l'image après rotation pour la positionner correctement par son centre
                 rect_image_rotatee = image_rotatee.get_rect(center=(centre_x_px, centre_y_px))
 
                 # Dessine l'image rotatée sur la fenêtre
-                fenetre.blit(image_rotatee, rect_image_rotatee)
+                sequence_blits.append((image_rotatee, rect_image_rotatee))
 
                 # Dessine l'ID de la voiture (centré sur l'image)
-                texte_id_surface = font_pour_id.render(str(voiture["id"]), True, couleur_texte_sur_image)
+                texte_id_surface = obtenir_surface_texte_id(font_pour_id, voiture.id, couleur_texte_sur_image)
                 rect_texte_id = texte_id_surface.get_rect(center=rect_image_rotatee.center) # Centre le texte sur l'image
-                fenetre.blit(texte_id_surface, rect_texte_id)
+                sequence_blits.append((texte_id_surface, rect_texte_id))
 
             else:
                 # --- Si l'image n'est pas disponible, dessine un cercle de fallback ---
                 rayon_cercle = centre_cellule_decalage - 5 # Un peu plus petit que la demi-cellule pour la marge
-                couleur_du_cercle = voiture.get("couleur", NOIR) # Utilise la couleur définie pour la voiture ou noir par défaut
+                couleur_du_cercle = (voiture.couleur or NOIR) # Utilise la couleur définie pour la voiture ou noir par défaut
 
-                # Dessine le cercle
-                pygame.draw.circle(fenetre, couleur_du_cercle, (centre_x_px, centre_y_px), rayon_cercle)
+                # Dessine le cercle (disque pré-rendu partagé entre voitures de même couleur)
+                sprite_cercle = obtenir_sprite_cercle(rayon_cercle, couleur_du_cercle)
+                sequence_blits.append((sprite_cercle, (centre_x_px - rayon_cercle, centre_y_px - rayon_cercle)))
 
                 # Dessine l'ID de la voiture (centré sur le cercle)
-                texte_id_surface = font_pour_id.render(str(voiture["id"]), True, couleur_texte_sur_cercle)
+                texte_id_surface = obtenir_surface_texte_id(font_pour_id, voiture.id, couleur_texte_sur_cercle)
                 rect_texte_id = texte_id_surface.get_rect(center=(centre_x_px, centre_y_px)) # Centre le texte sur le cercle
-                fenetre.blit(texte_id_surface, rect_texte_id)
+                sequence_blits.append((texte_id_surface, rect_texte_id))
+
+    if sequence_blits:
+        fenetre.blits(sequence_blits, doreturn=False)
+
+##
+# @var _tirets_par_taille
+# @brief Segments (début, fin) des tirets de la ligne arrière pointillée, par taille de cellule.
+# @details Le motif de pointillés ne dépend que de la taille de cellule : les offsets sont
+# calculés une fois, relatifs au bord gauche de la ligne, et réutilisés pour chaque destination.
+_tirets_par_taille: Dict[int, List[Tuple[int, int]]] = {}
+
+##
+# @brief Calcule les offsets (début, fin) des tirets de la ligne arrière pour une taille de cellule.
+# @param taille_cellule Taille cellule.
+# @param marge_laterale_px Marge latérale en pixels (position des lignes latérales).
+# @return Liste de tuples (offset_debut, offset_fin) relatifs au début de la ligne.
+def _calculer_tirets(taille_cellule: int, marge_laterale_px: int) -> List[Tuple[int, int]]:
+    longueur_pointille = max(4, taille_cellule // 10)
+    espace_pointille = max(3, taille_cellule // 15)
+    longueur_ligne = taille_cellule - 2 * marge_laterale_px # Largeur entre les deux lignes latérales
+    tirets = []
+    offset = 0
+    while offset < longueur_ligne:
+        tirets.append((offset, min(offset + longueur_pointille, longueur_ligne))) # Le dernier tiret ne dépasse pas
+        offset += longueur_pointille + espace_pointille
+    return tirets
 
 ##
 # @brief Dessine des indicateurs visuels pour les destinations des voitures.
@@ -1310,41 +2200,51 @@ def dessiner_voitures(fenetre: pygame.Surface, voitures: List[Dict[str, Any]], t
 # @param taille_cellule Taille cellule.
 # @param couleur_lignes Couleur des lignes "parking".
 # @param epaisseur_lignes Epaisseur des lignes.
-def dessiner_destinations(fenetre: pygame.Surface, voitures: List[Dict[str, Any]], taille_cellule: int, couleur_lignes: Tuple[int, int, int], epaisseur_lignes: int=2) -> None:
-    font = pygame.font.Font(None, 16)
+def dessiner_destinations(fenetre: pygame.Surface, voitures: List[Voiture], taille_cellule: int, couleur_lignes: Tuple[int, int, int], epaisseur_lignes: int=2) -> None:
+    font = obtenir_font_id()
     font_color_id = NOIR # Couleur de l'ID de la voiture
     # Ratios pour la taille de l'indicateur par rapport à la cellule
     marge_laterale_ratio, marge_haut_ratio, marge_bas_ratio = 0.15, 0.15, 0.40
-    # Paramètres du pointillé pour la ligne arrière
-    longueur_pointille = max(4, taille_cellule // 10)
-    espace_pointille = max(3, taille_cellule // 15)
+    # Marges en pixels, invariantes sur la frame : calculées une fois hors de la boucle
+    marge_laterale_px = int(taille_cellule * marge_laterale_ratio)
+    marge_haut_px = int(taille_cellule * marge_haut_ratio)
+    marge_bas_px = int(taille_cellule * marge_bas_ratio)
+
+    # Motif de pointillés de la ligne arrière, pré-calculé par taille de cellule
+    tirets = _tirets_par_taille.get(taille_cellule)
+    if tirets is None:
+        tirets = _calculer_tirets(taille_cellule, marge_laterale_px)
+        _tirets_par_taille[taille_cellule] = tirets
+
+    # Limites de la fenêtre (avec une cellule de marge) pour écarter les dessins hors écran
+    limite_x_px, limite_y_px = fenetre.get_width() + taille_cellule, fenetre.get_height() + taille_cellule
 
-    # Stocke les destinations uniques actuellement visibles avec l'ID d'une des voitures y allant.
-    destinations_visibles: Dict[Tuple[int, int], int] = {}
+    # Destinations déjà dessinées ce frame (une seule place par position de destination unique).
+    destinations_dessinees: set = set()
 
-    # Collecte les destinations des voitures *actives* (qui ne sont pas encore arrivées)
+    # Passe unique : pour chaque voiture *active* (pas encore arrivée), dessine l'indicateur
+    # de sa destination à la première rencontre, sans dictionnaire intermédiaire.
     for v in voitures:
         # N'affiche la destination que si la voiture est toujours en route
-        if v.get("temps_arrivee") is None:
-            dest_tuple = tuple(v["destination"])
-            # S'assure de ne stocker qu'une seule entrée par position de destination unique
-            if dest_tuple not in destinations_visibles:
-                destinations_visibles[dest_tuple] = v["id"]
-
-    # Dessine les indicateurs pour chaque destination unique visible
-    for dest_pos, voiture_id in destinations_visibles.items():
+        if v.temps_arrivee is not None:
+            continue
+        dest_pos = v.destination
+        if dest_pos in destinations_dessinees:
+            continue
+        destinations_dessinees.add(dest_pos)
+
+        voiture_id = v.id
         dx, dy = dest_pos
         # Calcule les coordonnées en pixels du coin supérieur gauche de la cellule
         cell_x_px, cell_y_px = dx * taille_cellule, dy * taille_cellule
 
+        # Ecarte d'emblée les destinations hors de la zone visible de la fenêtre
+        if not (-taille_cellule <= cell_x_px <= limite_x_px and -taille_cellule <= cell_y_px <= limite_y_px):
+            continue
+
         # Vérifie si la destination est toujours sur une ROUTE praticable (un obstacle manuel/auto pourrait y avoir été placé)
         # Si non, ne dessine pas l'indicateur.
-        if 0 <= dy < len(grille) and 0 <= dx < len(grille[0]) and grille[dy][dx] == ROUTE:
-            # Calcul des positions en pixels pour les lignes de "parking"
-            marge_laterale_px = int(taille_cellule * marge_laterale_ratio)
-            marge_haut_px = int(taille_cellule * marge_haut_ratio)
-            marge_bas_px = int(taille_cellule * marge_bas_ratio)
-
+        if 0 <= dy < grille.shape[0] and 0 <= dx < grille.shape[1] and grille[dy, dx] == ROUTE:
             # Coordonnées pixel des lignes (relativement à la cellule)
             ligne_gauche_x = cell_x_px + marge_laterale_px
             ligne_droite_x = cell_x_px + taille_cellule - marge_laterale_px
@@ -1355,22 +2255,16 @@ def dessiner_destinations(fenetre: pygame.Surface, voitures: List[Dict[str, Any]
             pygame.draw.line(fenetre, couleur_lignes, (ligne_gauche_x, ligne_haut_y), (ligne_gauche_x, ligne_bas_y), epaisseur_lignes) # Ligne gauche
             pygame.draw.line(fenetre, couleur_lignes, (ligne_droite_x, ligne_haut_y), (ligne_droite_x, ligne_bas_y), epaisseur_lignes) # Ligne droite
 
-            # Ligne arrière (pointillée)
+            # Ligne arrière (pointillée) : tirets issus du motif pré-calculé, décalés au bord gauche
             ligne_arriere_y = ligne_bas_y # C'est le côté "mur", la voiture se garerait contre ce bord visuellement
-            ligne_arriere_debut_x = ligne_gauche_x
-            ligne_arriere_fin_x = ligne_droite_x
-            # Boucle pour dessiner les tirets de la ligne pointillée
-            x_courant = ligne_arriere_debut_x
-            while x_courant < ligne_arriere_fin_x:
-                x_fin_tiret = min(x_courant + longueur_pointille, ligne_arriere_fin_x) # Assure que le dernier tiret ne dépasse pas
-                pygame.draw.line(fenetre, couleur_lignes, (x_courant, ligne_arriere_y), (x_fin_tiret, ligne_arriere_y), epaisseur_lignes)
-                x_courant += longueur_pointille + espace_pointille # Espace entre les tirets
+            for offset_debut, offset_fin in tirets:
+                pygame.draw.line(fenetre, couleur_lignes, (ligne_gauche_x + offset_debut, ligne_arriere_y), (ligne_gauche_x + offset_fin, ligne_arriere_y), epaisseur_lignes)
 
 
             # Dessin de l'ID de la voiture associée (centré dans l'espace de la "place")
             centre_id_x = (ligne_gauche_x + ligne_droite_x) // 2
             centre_id_y = (ligne_haut_y + ligne_bas_y) // 2
-            txt_surface = font.render(str(voiture_id), True, font_color_id)
+            txt_surface = obtenir_surface_texte_id(font, voiture_id, font_color_id)
             text_rect = txt_surface.get_rect(center=(centre_id_x, centre_id_y))
             fenetre.blit(txt_surface, text_rect)
 
@@ -1384,10 +2278,10 @@ def dessiner_destinations(fenetre: pygame.Surface, voitures: List[Dict[str, Any]
 # @param positions_arbres Liste de tuples (x, y).
 # @param grille La grille (pour vérifier NON_ROUTIER).
 # @param taille_cellule Taille cellule.
-def dessiner_arbres(fenetre: pygame.Surface, positions_arbres: List[Tuple[int, int]], grille: List[List[str]], taille_cellule: int) -> None:
+def dessiner_arbres(fenetre: pygame.Surface, positions_arbres: List[Tuple[int, int]], grille: np.ndarray, taille_cellule: int) -> None:
     for pos in positions_arbres:
         x, y = pos
-        if 0 <= y < len(grille) and 0 <= x < len(grille[0]) and grille[y][x] == NON_ROUTIER:
+        if 0 <= y < grille.shape[0] and 0 <= x < grille.shape[1] and grille[y, x] == NON_ROUTIER:
             cell_x_px, cell_y_px = x * taille_cellule, y * taille_cellule
             # Dimensions
             tronc_largeur = int(taille_cellule * 0.15)
@@ -1410,10 +2304,10 @@ def dessiner_arbres(fenetre: pygame.Surface, positions_arbres: List[Tuple[int, i
 # @param positions_maisons Liste de tuples (x, y).
 # @param grille La grille (pour vérifier NON_ROUTIER).
 # @param taille_cellule Taille cellule.
-def dessiner_maisons(fenetre: pygame.Surface, positions_maisons: List[Tuple[int, int]], grille: List[List[str]], taille_cellule: int) -> None:
+def dessiner_maisons(fenetre: pygame.Surface, positions_maisons: List[Tuple[int, int]], grille: np.ndarray, taille_cellule: int) -> None:
     for pos in positions_maisons:
         x, y = pos
-        if 0 <= y < len(grille) and 0 <= x < len(grille[0]) and grille[y][x] == NON_ROUTIER:
+        if 0 <= y < grille.shape[0] and 0 <= x < grille.shape[1] and grille[y, x] == NON_ROUTIER:
             cell_x_px, cell_y_px = x * taille_cellule, y * taille_cellule
             # Ratios dimensionnels
             marge_horizontale = int(taille_cellule * 0.15)
@@ -1445,10 +2339,10 @@ def dessiner_maisons(fenetre: pygame.Surface, positions_maisons: List[Tuple[int,
 # @param positions_ecoles Liste de tuples (x, y).
 # @param grille La grille (pour vérifier NON_ROUTIER).
 # @param taille_cellule Taille cellule.
-def dessiner_ecoles(fenetre: pygame.Surface, positions_ecoles: List[Tuple[int, int]], grille: List[List[str]], taille_cellule: int) -> None:
+def dessiner_ecoles(fenetre: pygame.Surface, positions_ecoles: List[Tuple[int, int]], grille: np.ndarray, taille_cellule: int) -> None:
     for pos in positions_ecoles:
         x, y = pos
-        if 0 <= y < len(grille) and 0 <= x < len(grille[0]) and grille[y][x] == NON_ROUTIER:
+        if 0 <= y < grille.shape[0] and 0 <= x < grille.shape[1] and grille[y, x] == NON_ROUTIER:
             cell_x_px, cell_y_px = x * taille_cellule, y * taille_cellule
 
             # Bâtiment principal (Rectangle)
@@ -1488,6 +2382,89 @@ def dessiner_ecoles(fenetre: pygame.Surface, positions_ecoles: List[Tuple[int, i
             porte_y = mur_y + hauteur_mur - porte_hauteur - 2 # Légèrement relevée du bas
             pygame.draw.rect(fenetre, COULEUR_ECOLE_PORTE, (porte_x, porte_y, porte_largeur, porte_hauteur))
 
+##
+# @var _sprites_montagnes
+# @brief Réservoir des massifs pré-rendus, indexés par (hauteur en cellules, taille cellule).
+# @details La géométrie eau/roc/neige ne dépend que de la hauteur de la pile NON_ROUTIER
+# et de la taille de cellule : les massifs de même hauteur partagent le même sprite,
+# qui n'est retessellé ni à chaque reconstruction du fond ni par massif.
+_sprites_montagnes: Dict[Tuple[int, int], pygame.Surface] = {}
+
+##
+# @brief Construit le sprite d'un massif montagneux (eau + roc + neige ou monticule).
+# Les coordonnées sont locales au sprite : la cellule de base d'eau occupe le bas.
+# @param cellules_non_routières_au_dessus Hauteur de la pile NON_ROUTIER au-dessus de la base.
+# @param taille_cellule Taille cellule.
+# @return Surface SRCALPHA du massif complet.
+def _construire_sprite_montagne(cellules_non_routières_au_dessus: int, taille_cellule: int) -> pygame.Surface:
+    # Largeur maximale occupée : la base du roc s'élargit avec la hauteur du massif.
+    largeur_base_roc_px = int(taille_cellule * (1 + cellules_non_routières_au_dessus * 0.09))
+    largeur_sprite = max(taille_cellule, largeur_base_roc_px)
+    hauteur_sprite = (cellules_non_routières_au_dessus + 1) * taille_cellule
+    sprite = pygame.Surface((largeur_sprite, hauteur_sprite), pygame.SRCALPHA)
+
+    # Repères locaux : centre horizontal du sprite et niveau de l'eau (haut de la cellule de base).
+    centre_x_cell_base_px = largeur_sprite // 2
+    niveau_eau_y_px = cellules_non_routières_au_dessus * taille_cellule
+
+    # --- Dessin de l'Eau ---
+    # Le rectangle de l'eau remplit la cellule de base.
+    pygame.draw.rect(sprite, COULEUR_EAU, (centre_x_cell_base_px - taille_cellule // 2, niveau_eau_y_px, taille_cellule, taille_cellule - 25))
+
+    # La ligne supérieure de la cellule la plus haute non-routière empilée (haut du sprite).
+    limite_y_pic_px = 0
+
+    # --- Dessin de la Montagne (Roc et Neige) si des cellules NON_ROUTIER sont trouvées au-dessus ---
+    if cellules_non_routières_au_dessus > 0:
+        # Rocher : dessiné comme un triangle ancré à la base d'eau, montant jusqu'à un pic rocheux.
+        # Position Y pixel du pic rocheux : Ancré un peu en dessous de la limite maximale. Sa hauteur est liée au nombre de cellules.
+        pos_y_pic_roc_px = limite_y_pic_px + int(taille_cellule * (cellules_non_routières_au_dessus * 0.4 + 0.1))
+
+        # Points du triangle de roc (pic centré, base aux niveaux de l'eau)
+        points_roc = [
+            (centre_x_cell_base_px - largeur_base_roc_px // 2, niveau_eau_y_px),
+            (centre_x_cell_base_px + largeur_base_roc_px // 2, niveau_eau_y_px),
+            (centre_x_cell_base_px, pos_y_pic_roc_px)
+        ]
+        # S'assure que le pic du roc ne descend pas en dessous du niveau de l'eau
+        points_roc[2] = (points_roc[2][0], min(points_roc[2][1], niveau_eau_y_px)) # Le pic roc est toujours au-dessus de l'eau.
+
+        pygame.draw.polygon(sprite, COULEUR_MONTAGNE_ROCHE, points_roc)
+
+        # Neige : dessiné comme un triangle plus étroit sur le pic rocheux, montant plus haut vers le pic max.
+        largeur_base_neige_px = int(largeur_base_roc_px * 0.5) # La base de la neige est sur le roc
+        # Position Y pixel du pic neigeux : Proche ou au niveau de la limite max.
+        pos_y_pic_neige_px = limite_y_pic_px + int(taille_cellule * (cellules_non_routières_au_dessus * 0.2)) # Un peu au dessus du roc peak
+
+        # Points du triangle de neige (pic centré, base au niveau du pic rocheux)
+        points_neige = [
+            (centre_x_cell_base_px - largeur_base_neige_px // 2, pos_y_pic_roc_px), # Ancré sur le pic roc
+            (centre_x_cell_base_px + largeur_base_neige_px // 2, pos_y_pic_roc_px),
+            (centre_x_cell_base_px, pos_y_pic_neige_px)
+        ]
+        # S'assure que le pic neigeux ne monte pas au-dessus de la limite pixel calculée pour le pic max
+        points_neige[2] = (points_neige[2][0], max(limite_y_pic_px, points_neige[2][1]))
+
+        pygame.draw.polygon(sprite, COULEUR_MONTAGNE_NEIGE, points_neige)
+
+    # else: S'il n'y a PAS de cellules NON_ROUTIER directement au-dessus
+    else:
+        # Dessine un petit monticule rocheux bas qui reste DANS la cellule de base d'eau.
+        largeur_monticule_px = int(taille_cellule * 0.7)
+        hauteur_monticule_px = int(taille_cellule * 0.4)
+        # Position Y pixel du pic du monticule : En dessous du niveau de l'eau pour donner l'impression d'être partiellement submergé.
+        pos_y_pic_monticule_px = niveau_eau_y_px + hauteur_monticule_px # Pic en bas de la base eau Y.
+
+        points_monticule_roc = [
+            (centre_x_cell_base_px - largeur_monticule_px // 2, niveau_eau_y_px), # Ancré à la base de l'eau
+            (centre_x_cell_base_px + largeur_monticule_px // 2, niveau_eau_y_px), # Ancré à la base de l'eau
+            (centre_x_cell_base_px, pos_y_pic_monticule_px)
+        ]
+        # Dessine le petit monticule rocheux dans la cellule d'eau.
+        pygame.draw.polygon(sprite, COULEUR_MONTAGNE_ROCHE, points_monticule_roc)
+
+    return sprite
+
 ##
 # @brief Dessine des massifs montagneux avec eau à leur base sur les positions spécifiées si elles sont NON_ROUTIER.
 # Le dessin s'étend dans les cellules NON_ROUTIER situées directement au-dessus de la cellule de base d'eau donnée.
@@ -1495,157 +2472,149 @@ def dessiner_ecoles(fenetre: pygame.Surface, positions_ecoles: List[Tuple[int, i
 # @param positions_base_eau Liste de tuples (x, y) des cellules base d'eau/montagne.
 # @param grille La grille (pour vérifier NON_ROUTIER au-dessus).
 # @param taille_cellule Taille cellule.
-def dessiner_montagne_avec_eau(fenetre: pygame.Surface, positions_base_eau: List[Tuple[int, int]], grille: List[List[str]], taille_cellule: int) -> None:
-    taille_x_grille = len(grille[0])
-    taille_y_grille = len(grille)
+def dessiner_montagne_avec_eau(fenetre: pygame.Surface, positions_base_eau: List[Tuple[int, int]], grille: np.ndarray, taille_cellule: int) -> None:
+    taille_x_grille = grille.shape[1]
+    taille_y_grille = grille.shape[0]
 
     for pos_base in positions_base_eau:
         x_base, y_base = pos_base
         # S'assure que la position de base est valide et sur une zone non-routière ('N')
-        if not (0 <= y_base < taille_y_grille and 0 <= x_base < taille_x_grille and grille[y_base][x_base] == NON_ROUTIER):
+        if not (0 <= y_base < taille_y_grille and 0 <= x_base < taille_x_grille and grille[y_base, x_base] == NON_ROUTIER):
              continue # Ignore cette position si non valide
 
-        # Coordonnées pixel du coin supérieur gauche de la cellule de base
-        cell_x_base_px, cell_y_base_px = x_base * taille_cellule, y_base * taille_cellule
-        # Centre horizontal de la cellule de base
-        centre_x_cell_base_px = cell_x_base_px + taille_cellule // 2
-        # La limite supérieure de la cellule de base représente le "niveau de l'eau" visuel.
-        niveau_eau_y_px = cell_y_base_px
-
-        # --- Dessin de l'Eau ---
-        # Le rectangle de l'eau remplit la cellule de base.
-        pygame.draw.rect(fenetre, COULEUR_EAU, (cell_x_base_px, cell_y_base_px, taille_cellule, taille_cellule -25))
-
         # --- Détermination de la hauteur du massif montagneux ---
-        # On compte les cellules NON_ROUTIER empilées verticalement au-dessus de la cellule de base (x_base, y_base).
-        ligne_y_pic_potentiel = y_base # Commence au niveau de la cellule de base
-        cellules_non_routières_au_dessus = 0 # Compteur
-
-        y_courant_check = y_base - 1 # Commence à vérifier la cellule juste au-dessus
-        while y_courant_check >= 0 and grille[y_courant_check][x_base] == NON_ROUTIER:
-            cellules_non_routières_au_dessus += 1
-            ligne_y_pic_potentiel = y_courant_check # La ligne la plus haute atteinte par les cellules NON_ROUTIER empilées
-            y_courant_check -= 1 # Continue de monter
-
-        # --- Dessin de la Montagne (Roc et Neige) si des cellules NON_ROUTIER sont trouvées au-dessus ---
-        if cellules_non_routières_au_dessus > 0:
-            # La position Y pixel correspondant au sommet *potentiel* maximum du massif.
-            # C'est la ligne supérieure de la cellule la plus haute non-routière empilée.
-            limite_y_pic_px = ligne_y_pic_potentiel * taille_cellule
-
-            # Rocher : dessiné comme un triangle ancré à la base d'eau, montant jusqu'à un pic rocheux.
-            largeur_base_roc_px = int(taille_cellule * (1 + cellules_non_routières_au_dessus * 0.09)) # La base peut s'élargir avec la hauteur
-            # Position Y pixel du pic rocheux : Ancré un peu en dessous de la limite maximale. Sa hauteur est liée au nombre de cellules.
-            pos_y_pic_roc_px = limite_y_pic_px + int(taille_cellule * (cellules_non_routières_au_dessus * 0.4 + 0.1))
-
-            # Points du triangle de roc (pic centré, base aux niveaux de l'eau)
-            points_roc = [
-                (centre_x_cell_base_px - largeur_base_roc_px // 2, niveau_eau_y_px),
-                (centre_x_cell_base_px + largeur_base_roc_px // 2, niveau_eau_y_px),
-                (centre_x_cell_base_px, pos_y_pic_roc_px)
-            ]
-            # S'assure que le pic du roc ne descend pas en dessous du niveau de l'eau
-            points_roc[2] = (points_roc[2][0], min(points_roc[2][1], niveau_eau_y_px)) # Le pic roc est toujours au-dessus de l'eau.
-
-            pygame.draw.polygon(fenetre, COULEUR_MONTAGNE_ROCHE, points_roc)
-
-            # Neige : dessiné comme un triangle plus étroit sur le pic rocheux, montant plus haut vers le pic max.
-            largeur_base_neige_px = int(largeur_base_roc_px * 0.5) # La base de la neige est sur le roc
-            # Position Y pixel du pic neigeux : Proche ou au niveau de la limite max.
-            pos_y_pic_neige_px = limite_y_pic_px + int(taille_cellule * (cellules_non_routières_au_dessus * 0.2)) # Un peu au dessus du roc peak
-
-            # Points du triangle de neige (pic centré, base au niveau du pic rocheux)
-            points_neige = [
-                (centre_x_cell_base_px - largeur_base_neige_px // 2, pos_y_pic_roc_px), # Ancré sur le pic roc
-                (centre_x_cell_base_px + largeur_base_neige_px // 2, pos_y_pic_roc_px),
-                (centre_x_cell_base_px, pos_y_pic_neige_px)
-            ]
-            # S'assure que le pic neigeux ne monte pas au-dessus de la limite pixel calculée pour le pic max
-            points_neige[2] = (points_neige[2][0], max(limite_y_pic_px, points_neige[2][1]))
-
-            pygame.draw.polygon(fenetre, COULEUR_MONTAGNE_NEIGE, points_neige)
-
-        # else: S'il n'y a PAS de cellules NON_ROUTIER directement au-dessus
+        # On compte les cellules NON_ROUTIER empilées verticalement au-dessus de la cellule
+        # de base (x_base, y_base), vectoriellement : la colonne au-dessus est lue de bas en
+        # haut et np.argmax repère la première cellule routière rencontrée.
+        colonne_au_dessus = grille[y_base - 1::-1, x_base] if y_base > 0 else grille[:0, x_base]
+        est_routiere = colonne_au_dessus != NON_ROUTIER
+        if est_routiere.any():
+            cellules_non_routières_au_dessus = int(np.argmax(est_routiere))
         else:
-             # Dessine un petit monticule rocheux bas qui reste DANS la cellule de base d'eau.
-             largeur_monticule_px = int(taille_cellule * 0.7)
-             hauteur_monticule_px = int(taille_cellule * 0.4)
-             # Position Y pixel du pic du monticule : En dessous du niveau de l'eau pour donner l'impression d'être partiellement submergé.
-             pos_y_pic_monticule_px = niveau_eau_y_px + hauteur_monticule_px # Pic en bas de la base eau Y.
+            cellules_non_routières_au_dessus = colonne_au_dessus.shape[0] # Toute la colonne est NON_ROUTIER
 
-             points_monticule_roc = [
-                 (centre_x_cell_base_px - largeur_monticule_px // 2, niveau_eau_y_px), # Ancré à la base de l'eau
-                 (centre_x_cell_base_px + largeur_monticule_px // 2, niveau_eau_y_px), # Ancré à la base de l'eau
-                 (centre_x_cell_base_px, pos_y_pic_monticule_px)
-             ]
-             # Dessine le petit monticule rocheux dans la cellule d'eau.
-             pygame.draw.polygon(fenetre, COULEUR_MONTAGNE_ROCHE, points_monticule_roc)
+        # Récupère (ou construit) le sprite du massif pour cette hauteur de pile.
+        cle = (cellules_non_routières_au_dessus, taille_cellule)
+        sprite = _sprites_montagnes.get(cle)
+        if sprite is None:
+            sprite = _construire_sprite_montagne(cellules_non_routières_au_dessus, taille_cellule)
+            _sprites_montagnes[cle] = sprite
+
+        # Blit du sprite : son bas-centre s'aligne sur la cellule de base d'eau.
+        centre_x_cell_base_px = x_base * taille_cellule + taille_cellule // 2
+        haut_sprite_y_px = (y_base - cellules_non_routières_au_dessus) * taille_cellule
+        fenetre.blit(sprite, (centre_x_cell_base_px - sprite.get_width() // 2, haut_sprite_y_px))
 
 ##
-# @brief Dessine des représentations simples de fleurs sur les positions spécifiées si elles sont NON_ROUTIER.
-# Dessine une tige verte et quelques "pétales" circulaires avec un centre.
-# @param fenetre Surface Pygame.
-# @param positions_fleurs Liste de tuples (x, y) des cellules où dessiner les fleurs.
-# @param grille La grille (pour vérifier NON_ROUTIER).
+# @var _sprites_fleurs
+# @brief Réservoir des fleurs pré-rendues (tige + pétales + centre), indexées par taille de cellule.
+# @details Une fleur coûtait cinq cercles et une ligne, soit six transitions Python→C
+# par cellule fleurie ; pré-rendue une fois, chaque fleur n'est plus qu'un blit.
+_sprites_fleurs: Dict[int, pygame.Surface] = {}
+
+##
+# @brief Construit le sprite d'une fleur (tige verte, quatre pétales, centre jaune).
+# Les coordonnées sont locales à la cellule (la fleur est centrée dans la cellule).
 # @param taille_cellule Taille cellule.
-def dessiner_fleurs(fenetre: pygame.Surface, positions_fleurs: List[Tuple[int, int]], grille: List[List[str]], taille_cellule: int) -> None:
+# @return Surface SRCALPHA de la taille d'une cellule.
+def _construire_sprite_fleur(taille_cellule: int) -> pygame.Surface:
     # Dimensions et propriétés des éléments de la fleur, basées sur la taille de la cellule
     rayon_petale = max(1, int(taille_cellule * 0.08)) # Rayon des petits cercles pour les pétales
     rayon_centre_fleur = max(1, int(taille_cellule * 0.04)) # Rayon du cercle central
-    hauteur_tige_ratio = 0.5 # La tige s'étend sur environ la moitié de la cellule vers le bas.
     epaisseur_tige = max(1, int(taille_cellule * 0.03)) # Epaisseur du trait de la tige
     decalage_petales_du_centre = max(2, int(taille_cellule * 0.1)) # Distance entre le centre et chaque pétale
-    # Décalage léger aléatoire par fleur pour varier un peu le positionnement dans la cellule
-    # décalage_aleatoire_x = random.randint(-int(taille_cellule * 0.05), int(taille_cellule * 0.05))
-    # décalage_aleatoire_y = random.randint(-int(taille_cellule * 0.05), int(taille_cellule * 0.05))
 
-    taille_x_grille = len(grille[0])
-    taille_y_grille = len(grille)
+    sprite = pygame.Surface((taille_cellule, taille_cellule), pygame.SRCALPHA)
+    # Position centrale pour le dessin de la fleur (centre de la cellule)
+    centre_dessin_x = taille_cellule // 2
+    centre_dessin_y = taille_cellule // 2
 
-    for pos in positions_fleurs:
-        x, y = pos
-        # S'assure que la position est valide et bien sur une zone non-routière ('N')
-        if not (0 <= y < taille_y_grille and 0 <= x < taille_x_grille and grille[y][x] == NON_ROUTIER):
-            continue # Ignore si pas valide ou pas sur une zone NON_ROUTIER.
+    # --- Dessin de la Tige ---
+    # La tige descend du centre visuel de la fleur vers le bas de la cellule (avec une petite marge).
+    pos_y_fin_tige_px = taille_cellule - int(taille_cellule * 0.15) # Finit près du bord bas de la cellule
+    # La tige est une ligne verticale à la position horizontale du centre de dessin de la fleur.
+    pygame.draw.line(sprite, COULEUR_FLEUR_VERT, (centre_dessin_x, centre_dessin_y), (centre_dessin_x, pos_y_fin_tige_px), epaisseur_tige)
 
-        # Coordonnées pixel du coin supérieur gauche de la cellule
-        cell_x_px, cell_y_px = x * taille_cellule, y * taille_cellule
-        # Calcule le centre exact de la cellule
-        centre_cellule_x_px = cell_x_px + taille_cellule // 2
-        centre_cellule_y_px = cell_y_px + taille_cellule // 2
+    # --- Dessin des Pétales ---
+    # Dessine des pétales (des cercles) autour du centre de dessin de la fleur.
+    # On utilise 4 pétales dans les directions cardinales simples (haut, bas, gauche, droite).
+    pygame.draw.circle(sprite, COULEUR_FLEUR_ROSE, (centre_dessin_x, centre_dessin_y - decalage_petales_du_centre), rayon_petale) # Pétale Nord
+    pygame.draw.circle(sprite, COULEUR_FLEUR_ROSE, (centre_dessin_x, centre_dessin_y + decalage_petales_du_centre), rayon_petale) # Pétale Sud
+    pygame.draw.circle(sprite, COULEUR_FLEUR_ROSE, (centre_dessin_x - decalage_petales_du_centre, centre_dessin_y), rayon_petale) # Pétale Ouest
+    pygame.draw.circle(sprite, COULEUR_FLEUR_ROSE, (centre_dessin_x + decalage_petales_du_centre, centre_dessin_y), rayon_petale) # Pétale Est
 
-        # Position centrale pour le dessin de la fleur (peut appliquer les décalages aléatoires ici)
-        centre_dessin_x = centre_cellule_x_px # + décalage_aleatoire_x # Avec décalage aléatoire
-        centre_dessin_y = centre_cellule_y_px # + décalage_aleatoire_y # Avec décalage aléatoire
+    # --- Dessin du Centre de la fleur ---
+    # Dessiné après les pétales pour qu'il soit par-dessus eux.
+    pygame.draw.circle(sprite, (255, 200, 0), (centre_dessin_x, centre_dessin_y), rayon_centre_fleur) # Centre (Jaune/Orange)
 
+    return sprite
 
-        # --- Dessin de la Tige ---
-        # La tige descend du centre visuel de la fleur vers le bas de la cellule (avec une petite marge).
-        pos_y_debut_tige_px = centre_dessin_y # Démarre au centre Y de la fleur
-        pos_y_fin_tige_px = (y + 1) * taille_cellule - int(taille_cellule * 0.15) # Finit près du bord bas de la cellule
-        # La tige est une ligne verticale à la position horizontale du centre de dessin de la fleur.
-        pygame.draw.line(fenetre, COULEUR_FLEUR_VERT, (centre_dessin_x, pos_y_debut_tige_px), (centre_dessin_x, pos_y_fin_tige_px), epaisseur_tige)
+##
+# @brief Dessine des représentations simples de fleurs sur les positions spécifiées si elles sont NON_ROUTIER.
+# Blitte le sprite de fleur pré-rendu (tige verte, pétales, centre) par cellule.
+# @param fenetre Surface Pygame.
+# @param positions_fleurs Liste de tuples (x, y) des cellules où dessiner les fleurs.
+# @param grille La grille (pour vérifier NON_ROUTIER).
+# @param taille_cellule Taille cellule.
+def dessiner_fleurs(fenetre: pygame.Surface, positions_fleurs: List[Tuple[int, int]], grille: np.ndarray, taille_cellule: int) -> None:
+    sprite = _sprites_fleurs.get(taille_cellule)
+    if sprite is None:
+        sprite = _construire_sprite_fleur(taille_cellule)
+        _sprites_fleurs[taille_cellule] = sprite
+
+    taille_x_grille = grille.shape[1]
+    taille_y_grille = grille.shape[0]
+    # Zone de découpe de la surface cible : les cellules entièrement hors zone sont
+    # rejetées avant le blit (utile si la grille déborde de la surface)
+    clip = fenetre.get_clip()
 
-        # Optionnel : ajouter des feuilles simples sur la tige
-        # petit_feuille_largeur = int(epaisseur_tige * 4)
-        # petit_feuille_hauteur = int(epaisseur_tige * 2)
-        # decalage_feuille_y_depuis_centre = int(hauteur_tige_ratio * taille_cellule * 0.4)
-        # pygame.draw.ellipse(fenetre, COULEUR_FLEUR_VERT, pygame.Rect(centre_dessin_x - epaisseur_tige - petit_feuille_largeur, centre_dessin_y + decalage_feuille_y_depuis_centre, petit_feuille_largeur, petit_feuille_hauteur)) # Feuille gauche
-        # pygame.draw.ellipse(fenetre, COULEUR_FLEUR_VERT, pygame.Rect(centre_dessin_x + epaisseur_tige, centre_dessin_y + decalage_feuille_y_depuis_centre, petit_feuille_largeur, petit_feuille_hauteur)) # Feuille droite
+    for pos in positions_fleurs:
+        x, y = pos
+        # S'assure que la position est valide et bien sur une zone non-routière ('N')
+        if not (0 <= y < taille_y_grille and 0 <= x < taille_x_grille and grille[y, x] == NON_ROUTIER):
+            continue # Ignore si pas valide ou pas sur une zone NON_ROUTIER.
 
+        px, py = x * taille_cellule, y * taille_cellule
+        if px >= clip.right or py >= clip.bottom or px + taille_cellule <= clip.left or py + taille_cellule <= clip.top:
+            continue
 
-        # --- Dessin des Pétales ---
-        # Dessine des pétales (des cercles) autour du centre de dessin de la fleur.
-        # On utilise 4 pétales dans les directions cardinales simples (haut, bas, gauche, droite).
-        pygame.draw.circle(fenetre, COULEUR_FLEUR_ROSE, (centre_dessin_x, centre_dessin_y - decalage_petales_du_centre), rayon_petale) # Pétale Nord
-        pygame.draw.circle(fenetre, COULEUR_FLEUR_ROSE, (centre_dessin_x, centre_dessin_y + decalage_petales_du_centre), rayon_petale) # Pétale Sud
-        pygame.draw.circle(fenetre, COULEUR_FLEUR_ROSE, (centre_dessin_x - decalage_petales_du_centre, centre_dessin_y), rayon_petale) # Pétale Ouest
-        pygame.draw.circle(fenetre, COULEUR_FLEUR_ROSE, (centre_dessin_x + decalage_petales_du_centre, centre_dessin_y), rayon_petale) # Pétale Est
+        fenetre.blit(sprite, (px, py))
 
-        # --- Dessin du Centre de la fleur ---
-        # Dessiné après les pétales pour qu'il soit par-dessus eux.
-        pygame.draw.circle(fenetre, (255, 200, 0), (centre_dessin_x, centre_dessin_y), rayon_centre_fleur) # Centre (Jaune/Orange)
 
+##
+# @brief Pré-rend toute la scène statique dans une surface réutilisable.
+# @param largeur Largeur de la fenêtre en pixels.
+# @param hauteur Hauteur de la fenêtre en pixels.
+# @param grille La grille.
+# @param taille_cellule Taille d'une cellule en pixels.
+# @param directions_lignes Dict sens lignes (flèches de bord).
+# @param directions_colonnes Dict sens colonnes (flèches de bord).
+# @param taille_x Largeur grille (en cellules).
+# @param taille_y Hauteur grille (en cellules).
+# @param passages Liste des passages piétons (zébrures statiques).
+# @return Surface contenant fonds de cellules, décorations, lignes, flèches et passages piétons.
+# @details Les fonds, décorations, lignes, flèches de sens et passages piétons ne changent
+#          jamais après l'initialisation (les obstacles sont dessinés par-dessus) : les
+#          rasteriser une seule fois remplace des centaines de primitives par frame par un
+#          unique blit.
+def construire_fond_statique(largeur: int, hauteur: int, grille: np.ndarray, taille_cellule: int, directions_lignes: Dict[int, str], directions_colonnes: Dict[int, str], taille_x: int, taille_y: int, passages: List[Dict[str, Any]]) -> pygame.Surface:
+    fond = pygame.Surface((largeur, hauteur))
+    fond.fill(BLANC)
+    # Fonds des cellules (route/non-route) en premier
+    dessiner_fonds_cellules(fond, grille, taille_cellule)
+    # Eléments fixes du décor sur les zones non routières
+    dessiner_maisons(fond, POSITIONS_MAISONS, grille, taille_cellule)
+    dessiner_arbres(fond, POSITIONS_ARBRES, grille, taille_cellule)
+    dessiner_ecoles(fond, POSITIONS_ECOLES, grille, taille_cellule)
+    dessiner_montagne_avec_eau(fond, POSITIONS_MASSIF_BASE_EAU, grille, taille_cellule)
+    dessiner_fleurs(fond, POSITIONS_FLEURS, grille, taille_cellule)
+    # Lignes de la grille par-dessus les fonds
+    dessiner_grille_lignes(fond, largeur, hauteur, taille_cellule)
+    # Flèches de sens de circulation : statiques elles aussi (le tracé ne change pas)
+    dessiner_directions(fond, directions_lignes, directions_colonnes, taille_x, taille_y, taille_cellule)
+    # Zébrures des passages piétons : positions et orientations fixées à l'initialisation
+    dessiner_passages_pietons(fond, passages, taille_cellule, COULEUR_PASSAGE)
+    return fond.convert() # Format d'affichage : blits les plus rapides
 
 # --- INITIALISATION ET BOUCLE PRINCIPALE ---
 
@@ -1656,6 +2625,8 @@ lignes_directions, colonnes_directions = creer_directions_routes(TAILLE_X_GRILLE
 
 # Initialisation des feux, passages piétons et voitures
 feux = initialiser_feux_repartis_sur_routes(TAILLE_X_GRILLE, TAILLE_Y_GRILLE, grille)
+feux_positions = frozenset(feu.position for feu in feux) # Les feux sont fixes : l'ensemble est construit une seule fois
+feu_index_par_position = {feu.position: feu.index for feu in feux} # Index spatial statique pour les validations O(1)
 passages_pietons = initialiser_passages_pietons_sur_routes(NB_PASSAGES_PIETONS, TAILLE_X_GRILLE, TAILLE_Y_GRILLE, feux, grille)
 # Remarque : pietons_actifs commence vide
 voitures = generer_voitures_initiales(
@@ -1666,116 +2637,194 @@ voitures = generer_voitures_initiales(
 )
 # Remarque : obstacle_automatique_timer commence à 0.0
 
+# Scène statique rasterisée une seule fois (fonds, décorations, lignes, flèches, passages piétons)
+fond_statique = construire_fond_statique(LARGEUR, HAUTEUR, grille, TAILLE_CELLULE, lignes_directions, colonnes_directions, TAILLE_X_GRILLE, TAILLE_Y_GRILLE, passages_pietons)
+
+## @brief Etats des feux tels que présentés à l'écran au dernier frame (None avant le premier).
+_feu_etat_presente: Union[np.ndarray, None] = None
+
+##
+# @brief Collecte les rectangles écran susceptibles d'avoir changé ce frame.
+# Couvre les voitures (avec marge pour la rotation et l'ID), leurs destinations,
+# les piétons et les feux dont l'état a changé depuis le dernier frame présenté.
+# Combinés aux rectangles du frame précédent, ils délimitent la zone à présenter
+# via pygame.display.update.
+# @param voitures Liste des voitures (actives et en disparition).
+# @param pietons Liste des piétons actifs.
+# @param feux Liste des feux.
+# @param taille_cellule Taille cellule.
+# @return Liste de pygame.Rect en coordonnées écran.
+def collecter_rects_dynamiques(voitures: List[Voiture], pietons: List[Dict[str, Any]], feux: List[Feu], taille_cellule: int) -> List[pygame.Rect]:
+    global _feu_etat_presente
+    demi = taille_cellule // 2
+    rects = []
+    for v in voitures:
+        x, y = v.position
+        # Cellule gonflée d'une demi-cellule de chaque côté : couvre l'image rotatée et le texte d'ID
+        rects.append(pygame.Rect(x * taille_cellule - demi, y * taille_cellule - demi, 2 * taille_cellule, 2 * taille_cellule))
+        if v.temps_arrivee is None:
+            dx, dy = v.destination
+            rects.append(pygame.Rect(dx * taille_cellule, dy * taille_cellule, taille_cellule, taille_cellule))
+    for p in pietons:
+        x, y = p["passage_pos"]
+        rects.append(pygame.Rect(x * taille_cellule - demi, y * taille_cellule - demi, 2 * taille_cellule, 2 * taille_cellule))
+    # Feux : seuls ceux dont la couleur a changé depuis le dernier frame présenté
+    # nécessitent un rafraîchissement (le sprite est identique sinon)
+    for feu in feux:
+        if _feu_etat_presente is not None and _feu_etat_presente[feu.index] == feu_etat[feu.index]:
+            continue
+        x, y = feu.position
+        rects.append(pygame.Rect(x * taille_cellule, y * taille_cellule, taille_cellule, taille_cellule))
+    _feu_etat_presente = feu_etat.copy()
+    return rects
+
+## @brief Version de la grille présentée à l'écran (force un flip complet quand elle change).
+version_grille_affichee = -1
+## @brief Rectangles dynamiques du frame précédent (zones à rafraîchir même si l'entité a bougé).
+rects_dynamiques_precedents: List[pygame.Rect] = []
+
+# Accumulateur de temps simulé : la logique avance par pas fixes de PAS_SIMULATION,
+# découplée de la cadence de la boucle (voir chaîne de mise à jour ci-dessous)
+accumulateur_simulation: float = 0.0
+
 # Boucle Principale
 running = True
 while running:
     # Calcule le temps écoulé depuis la dernière frame en secondes
     dt: float = clock.tick(30) / 1000.0 # Vise 30 images par seconde
 
+    # Horloge unique du tick : calculée une seule fois et passée aux mises à jour,
+    # plutôt qu'un appel time.time() par entité/fonction.
+    temps_actuel: float = time.time()
+
     # --- Gestion des Événements Utilisateur ---
+    # Les obstacles ajoutés ce tick sont accumulés puis traités en un seul lot après la
+    # boucle d'événements : plusieurs clics dans la même frame ne déclenchent qu'un seul
+    # balayage des voitures (au lieu d'un balayage complet par clic).
+    obstacles_ajoutes_ce_tick: List[Tuple[int, int]] = []
     for event in pygame.event.get():
+        # Chaîne elif : les types d'événement sont mutuellement exclusifs, inutile de
+        # retester les suivants une fois l'un d'eux reconnu
         if event.type == pygame.QUIT:
             running = False
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             running = False
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             # Convertit les coordonnées souris en coordonnées de grille
             cx, cy = event.pos[0] // TAILLE_CELLULE, event.pos[1] // TAILLE_CELLULE
             # Vérifie que les coordonnées sont dans les limites de la grille
             if 0 <= cx < TAILLE_X_GRILLE and 0 <= cy < TAILLE_Y_GRILLE:
                  if event.button == 1: # Clic Gauche -> Ajouter Obstacle Manuel
-                     if ajouter_obstacle_manuel(grille, cx, cy, feux):
-                          # Forcer le recalcul des voitures dont le chemin ou la destination est touché
-                          forcer_recalcul_si_affecte(cx, cy, voitures)
+                     if ajouter_obstacle_manuel(grille, cx, cy, feux_positions):
+                          # Le recalcul des voitures touchées est différé au lot ci-dessous
+                          obstacles_ajoutes_ce_tick.append((cx, cy))
                  elif event.button == 3: # Clic Droit -> Retirer Obstacle Manuel
-                     if grille[cy][cx] == OBSTACLE_MANUEL:
-                         grille[cy][cx] = ROUTE
+                     if grille[cy, cx] == OBSTACLE_MANUEL:
+                         grille[cy, cx] = ROUTE
+                         version_grille += 1
                          print(f"Obstacle MANUEL retiré en ({cx},{cy}). Case redevenue ROUTE.")
 
-    # --- Logique d'Obstacle Automatique ---
-    obstacle_automatique_timer += dt
-    if obstacle_automatique_timer >= OBSTACLE_AUTOMATIQUE_INTERVAL:
-        obstacle_automatique_timer -= OBSTACLE_AUTOMATIQUE_INTERVAL
-
-        action = random.choice(['add', 'remove', 'none']) # Peut choisir de ne rien faire
-        if action == 'add':
-            # Trouve les positions ROUTE où on PEUT ajouter un obstacle automatique (pas déjà occupé par feu/obstacle manuel/auto)
-            possible_add_positions = []
-            positions_interdites = {feu["position"] for feu in feux}.union({
-                (x,y) for y in range(TAILLE_Y_GRILLE) for x in range(TAILLE_X_GRILLE)
-                if grille[y][x] in SYMBOLES_NON_PRATICABLES # N, X, A
-            })
-
-            for y in range(TAILLE_Y_GRILLE):
-                 for x in range(TAILLE_X_GRILLE):
-                      if grille[y][x] == ROUTE and (x,y) not in positions_interdites:
-                           possible_add_positions.append((x, y))
-
-            if possible_add_positions:
-                ox, oy = random.choice(possible_add_positions)
-                if ajouter_obstacle_auto(grille, ox, oy, feux): # Appelle ajouter_obstacle_auto
-                    # Si ajouté avec succès, force recalcul des voitures impactées.
-                    forcer_recalcul_si_affecte(ox, oy, voitures)
-
-        elif action == 'remove':
-            # Trouve toutes les positions actuellement occupées par un obstacle AUTOMATIQUE
-            current_obstacle_auto_positions = [(x, y) for y in range(TAILLE_Y_GRILLE) for x in range(TAILLE_X_GRILLE) if grille[y][x] == OBSTACLE_AUTO_SYM]
-            if current_obstacle_auto_positions:
-                # Choisit un obstacle AUTOMATIQUE au hasard et le retire (le rend ROUTE)
-                ox, oy = random.choice(current_obstacle_auto_positions)
-                grille[oy][ox] = ROUTE
-                # Les voitures affectées recalculeront ou se débloqueront automatiquement au prochain tick si besoin.
-
-    # --- Mises à jour Logiques (État de la Simulation) ---
-    mettre_a_jour_feux(feux)
-    mettre_a_jour_pietons(passages_pietons, pietons_actifs, voitures) # Les piétons sont bloqués si une voiture est bloquée sur le passage
-    # La mise à jour des voitures est le coeur de la logique dynamique : déplacement, blocages, recalculs, nouvelle destination
-    mettre_a_jour_voitures(voitures, grille, feux, lignes_directions, colonnes_directions, TAILLE_X_GRILLE, TAILLE_Y_GRILLE, pietons_actifs) # Piétons sont passés pour la vérification de validité de déplacement
-
-    # --- Regénération de Voitures ---
-    # Maintient le nombre de voitures autour de la cible en ajoutant de nouvelles si la population diminue.
-    # Ajout dans une boucle pour essayer d'ajouter plusieurs voitures par tick si nécessaire et possible.
-    while len(voitures) < NOMBRE_VOITURES_CIBLE:
-        nouvelle_voiture = generer_une_nouvelle_voiture(
-             TAILLE_X_GRILLE, TAILLE_Y_GRILLE, feux, grille, lignes_directions, colonnes_directions,
-             image_voiture_echelle,
-             voitures # Passe la liste actuelle pour que la génération évite les positions occupées
-        )
-        if not nouvelle_voiture:
-             break # Sort de la boucle while (de génération) si aucune voiture n'a pu être ajoutée
-
-        voitures.append(nouvelle_voiture)
-
+    if obstacles_ajoutes_ce_tick:
+        # Forcer le recalcul des voitures dont le chemin ou la destination est touché
+        forcer_recalcul_si_affectees(frozenset(obstacles_ajoutes_ce_tick), voitures)
+
+    # --- Pas de Simulation à Cadence Fixe ---
+    # La logique avance par pas de PAS_SIMULATION accumulés : la cadence de simulation
+    # est découplée de celle du rendu (l'une ou l'autre peut être modifiée sans toucher
+    # au reste). Après un gel prolongé, le rattrapage est borné puis le reliquat jeté.
+    accumulateur_simulation += dt
+    pas_executes = 0
+    while accumulateur_simulation >= PAS_SIMULATION and pas_executes < MAX_PAS_RATTRAPAGE:
+        accumulateur_simulation -= PAS_SIMULATION
+        pas_executes += 1
+
+        # --- Logique d'Obstacle Automatique ---
+        obstacle_automatique_timer += PAS_SIMULATION
+        if obstacle_automatique_timer >= OBSTACLE_AUTOMATIQUE_INTERVAL:
+            obstacle_automatique_timer -= OBSTACLE_AUTOMATIQUE_INTERVAL
+
+            action = random.choice(['add', 'remove', 'none']) # Peut choisir de ne rien faire
+            if action == 'add':
+                # Positions ROUTE où on PEUT ajouter un obstacle automatique (pas déjà occupé
+                # par feu/obstacle manuel/auto) : réservoir partagé, reconstruit seulement
+                # quand la grille a changé depuis le dernier intervalle.
+                possible_add_positions = obtenir_cellules_route_libres(grille, feux)
+
+                if possible_add_positions:
+                    ox, oy = random.choice(possible_add_positions)
+                    if ajouter_obstacle_auto(grille, ox, oy, feux_positions): # Appelle ajouter_obstacle_auto
+                        # Si ajouté avec succès, force recalcul des voitures impactées.
+                        forcer_recalcul_si_affectees(frozenset(((ox, oy),)), voitures)
+
+            elif action == 'remove':
+                # Choisit un obstacle AUTOMATIQUE au hasard dans la liste entretenue
+                # (aucun balayage de grille) et le retire (le rend ROUTE).
+                if obstacles_auto_positions:
+                    # Retrait O(1) : l'élément tiré est remplacé par le dernier, puis pop
+                    i = random.randrange(len(obstacles_auto_positions))
+                    ox, oy = obstacles_auto_positions[i]
+                    obstacles_auto_positions[i] = obstacles_auto_positions[-1]
+                    obstacles_auto_positions.pop()
+                    grille[oy, ox] = ROUTE
+                    version_grille += 1
+                    # Les voitures affectées recalculeront ou se débloqueront automatiquement au prochain tick si besoin.
+
+        # --- Mises à jour Logiques (État de la Simulation) ---
+        mettre_a_jour_feux(feux, temps_actuel)
+        mettre_a_jour_pietons(passages_pietons, pietons_actifs, voitures) # Les piétons sont bloqués si une voiture est bloquée sur le passage
+        # La mise à jour des voitures est le coeur de la logique dynamique : déplacement, blocages, recalculs, nouvelle destination
+        mettre_a_jour_voitures(voitures, grille, feux, lignes_directions, colonnes_directions, TAILLE_X_GRILLE, TAILLE_Y_GRILLE, pietons_actifs, temps_actuel) # Piétons sont passés pour la vérification de validité de déplacement
+
+        # --- Regénération de Voitures ---
+        # Maintient le nombre de voitures autour de la cible en ajoutant de nouvelles si la population diminue.
+        # Au plus UNE voiture par pas : chaque génération peut coûter plusieurs recherches de
+        # chemin, et l'ancienne boucle while pouvait en enchaîner des dizaines sur le même pas
+        # (pic de latence après la disparition d'un groupe). L'amortissement sur les pas
+        # suivants lisse la charge, le retour à la cible reste rapide à 30 Hz.
+        if len(voitures) < NOMBRE_VOITURES_CIBLE:
+            nouvelle_voiture = generer_une_nouvelle_voiture(
+                 TAILLE_X_GRILLE, TAILLE_Y_GRILLE, feux, grille, lignes_directions, colonnes_directions,
+                 image_voiture_echelle,
+                 voitures # Passe la liste actuelle pour que la génération évite les positions occupées
+            )
+            if nouvelle_voiture:
+                voitures.append(nouvelle_voiture)
+
+    if pas_executes == MAX_PAS_RATTRAPAGE:
+        # Gel long (fenêtre déplacée, machine en pause) : le temps non rattrapé est
+        # abandonné plutôt que de dérouler des dizaines de pas dans la même frame.
+        accumulateur_simulation = 0.0
+
+    # Rien n'a bougé et la grille n'a pas changé : l'image précédente reste exacte,
+    # inutile de redessiner ou re-présenter quoi que ce soit cette frame.
+    if pas_executes == 0 and version_grille == version_grille_affichee:
+        continue
 
     # --- Section Dessin ---
-    fenetre.fill(BLANC) # Nettoie l'écran avec un fond blanc
-
-    # Dessine les fonds des cellules (route/non-route) en premier
-    dessiner_fonds_cellules(fenetre, grille, TAILLE_CELLULE)
-    # Dessine les éléments fixes du décor sur les zones non routières
-    dessiner_maisons(fenetre, POSITIONS_MAISONS, grille, TAILLE_CELLULE)
-    dessiner_arbres(fenetre, POSITIONS_ARBRES, grille, TAILLE_CELLULE)
-    dessiner_ecoles(fenetre, POSITIONS_ECOLES, grille, TAILLE_CELLULE)
-    dessiner_montagne_avec_eau(fenetre, POSITIONS_MASSIF_BASE_EAU, grille, TAILLE_CELLULE)
-    dessiner_fleurs(fenetre, POSITIONS_FLEURS, grille, TAILLE_CELLULE)
-
-    # Dessine les lignes de la grille
-    dessiner_grille_lignes(fenetre, LARGEUR, HAUTEUR, TAILLE_CELLULE)
+    # La scène statique (fonds, décorations, lignes) est blittée en une seule fois
+    fenetre.blit(fond_statique, (0, 0))
 
     # Dessine les éléments interactifs ou importants du réseau routier (sauf voitures/piétons/dest qui sont dynamiques)
     dessiner_obstacles_manuels(fenetre, grille, TAILLE_CELLULE)
     # dessiner_obstacles_automatiques(fenetre, grille, TAILLE_CELLULE) # Désactivé par défaut si 'auto' n'est pas visuel
-    dessiner_passages_pietons(fenetre, passages_pietons, TAILLE_CELLULE, COULEUR_PASSAGE)
     dessiner_feux(fenetre, feux, TAILLE_CELLULE)
-    dessiner_directions(fenetre, lignes_directions, colonnes_directions, TAILLE_X_GRILLE, TAILLE_Y_GRILLE, TAILLE_CELLULE)
+    # Les flèches de sens et les passages piétons font partie du fond statique pré-rendu
     dessiner_destinations(fenetre, voitures, TAILLE_CELLULE, JAUNE_PARKING)
 
     # Dessine les entités dynamiques (piétons avant voitures pour ne pas être cachés si très petits)
     dessiner_pietons(fenetre, pietons_actifs, TAILLE_CELLULE, COULEUR_PIETON)
-    dessiner_voitures(fenetre, voitures, TAILLE_CELLULE)
-
-    # Afficher l'état du rendu (mettre à jour l'écran)
-    pygame.display.flip()
+    dessiner_voitures(fenetre, voitures, TAILLE_CELLULE, temps_actuel)
+
+    # Afficher l'état du rendu. Le décor étant statique, seules les zones touchées
+    # par les entités dynamiques (ce frame et le précédent) sont présentées ;
+    # un flip complet n'a lieu que lorsque la grille elle-même a changé.
+    rects_dynamiques = collecter_rects_dynamiques(voitures, pietons_actifs, feux, TAILLE_CELLULE)
+    if version_grille != version_grille_affichee:
+        pygame.display.flip()
+        version_grille_affichee = version_grille
+    else:
+        pygame.display.update(rects_dynamiques_precedents + rects_dynamiques)
+    rects_dynamiques_precedents = rects_dynamiques
 
 
 # --- Fin de la Simulation ---